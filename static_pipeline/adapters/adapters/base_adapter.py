@@ -1,28 +1,236 @@
+import logging
 from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Iterator
+import numpy as np
 import pandas as pd
+from transform.genres import concat_genre_frames
+from utils.csv_ingest import iter_csv_source, read_csv_source
+from utils.raw_cache import RawColumnarCache
 from utils.save_aux_csv import save_aux_csv
+from utils.title_cache import TitleCache
 
 class BaseAdapter(ABC):
     def __init__(self, source_config: dict):
         self.config = source_config
+        # Zählwerte des letzten transform()-Laufs (für Run-Metriken)
+        self.stats: dict[str, int] = {"rejected_rows": 0, "duplicate_rows": 0}
+        # Fehlerhafte CSV-Zeilen (Quarantäne) – gezählt je Adapter-Instanz, da
+        # extract() vor begin_stream() läuft
+        self.quarantined_rows = 0
+        self._quarantine_written = False
+        # Optionaler Raw-Cache (utils/raw_cache.py); wird von der Pipeline gesetzt
+        self.raw_cache: RawColumnarCache | None = None
+        # Optionaler Titel-Cache (utils/title_cache.py) für normalize_titles
+        self.title_cache: TitleCache | None = None
+        self.begin_stream()
 
     @abstractmethod
     def extract(self) -> any:
         """Lädt Rohdaten (ein DataFrame oder Roh-Objekte)"""
         pass
 
-    @abstractmethod
     def transform(self, data: any) -> pd.DataFrame:
-        """Bereinigt und formatiert die Quelldaten zu einem DataFrame"""
-        pass
-    
+        """Bereinigt und formatiert die Quelldaten zu einem DataFrame.
+
+        Standard: die gesamten Rohdaten werden als ein einziger Chunk durch
+        `transform_chunk` geschickt. Adapter ohne Chunk-Unterstützung
+        überschreiben stattdessen diese Methode.
+        """
+        self.begin_stream()
+        return self.transform_chunk(data)
+
+    # ------------------------------------------------------------ #
+    # Chunk-Modus (Eingaben größer als der Arbeitsspeicher)         #
+    # ------------------------------------------------------------ #
+    def extract_chunks(self, chunksize: int) -> Iterator[any]:
+        """Liefert die Rohdaten in Blöcken von höchstens `chunksize` Zeilen.
+
+        Standard: ein einziger Block aus `extract()`.
+        """
+        yield self.extract()
+
+    def transform_chunk(self, data: any) -> pd.DataFrame:
+        """Bereinigt einen Block; Zustand über Blöcke hinweg liegt in `self._stream`."""
+        raise NotImplementedError(
+            f"{type(self).__name__} implementiert weder transform() noch transform_chunk()")
+
+    def supports_chunks(self) -> bool:
+        """True, wenn der Adapter `transform_chunk` implementiert."""
+        return type(self).transform_chunk is not BaseAdapter.transform_chunk
+
+    def begin_stream(self) -> None:
+        """Setzt den blockübergreifenden Zustand zurück (IDs, gesehene Schlüssel, Aux-Dateien)."""
+        self._stream: dict = {
+            "row_offset": 0,          # bereits vergebene zeilenbasierte IDs
+            "seen_keys": set(),       # "lower(title)\x1fyear" für die Duplikatprüfung
+            "aux_written": set(),     # Aux-Arten, die in diesem Lauf schon geschrieben wurden
+        }
+        self.stats = {"rejected_rows": 0, "duplicate_rows": 0}
+
+    def _next_ids(self, n: int) -> range:
+        """Stabile zeilenbasierte IDs, fortlaufend über alle Blöcke."""
+        start = self._stream["row_offset"]
+        self._stream["row_offset"] = start + n
+        return range(start + 1, start + n + 1)
+
+    @property
+    def _seen_keys(self) -> set:
+        return self._stream["seen_keys"]
+
+    def run_chunked(self, chunksize: int) -> tuple[pd.DataFrame, int]:
+        """
+        Extract + Transform blockweise mit begrenztem Speicherbedarf.
+
+        Nur die bereinigten Zeilen (wenige Spalten) werden gesammelt; Duplikate
+        über Blockgrenzen hinweg werden über den gemeinsamen Schlüsselbestand
+        erkannt, ungültige/doppelte Zeilen blockweise an die Aux-CSVs angehängt.
+
+        Returns:
+            (bereinigtes DataFrame, Anzahl eingelesener Rohzeilen)
+        """
+        self.begin_stream()
+        parts: list[pd.DataFrame] = []
+        input_rows = 0
+        for chunk in self.extract_chunks(chunksize):
+            input_rows += len(chunk[0] if isinstance(chunk, tuple) else chunk)
+            part = self.transform_chunk(chunk)
+            if not part.empty:
+                parts.append(part)
+        if not parts:
+            return pd.DataFrame(), input_rows
+        # Genre-Kategorien der Blöcke vereinheitlichen (Spalte bleibt kategorial)
+        return concat_genre_frames(parts), input_rows
+
+    # ------------------------------------------------------------ #
+    # Gemeinsame CSV-Ingestion (utils/csv_ingest.py)               #
+    # ------------------------------------------------------------ #
+    def _read_csv(
+        self,
+        path: str | Path,
+        schema: dict[str, str] | None = None,
+        dialect: dict | None = None,
+        where: dict[str, list] | None = None,
+    ) -> pd.DataFrame:
+        """Liest eine Roh-CSV vollständig; fehlerhafte Zeilen landen in der Quarantäne.
+
+        `dialect`/`where` wie bei `read_csv_source` (TSV, Zeilenfilter).
+        """
+        bad_lines: list[dict] = []
+        df = read_csv_source(path, schema=schema, on_bad_line=bad_lines.append,
+                             engine=self.config.get("csv_engine", "auto"), cache=self.raw_cache,
+                             dialect=dialect, where=where)
+        self._quarantine(path, bad_lines)
+        return df
+
+    def _iter_csv(
+        self,
+        path: str | Path,
+        chunksize: int,
+        schema: dict[str, str] | None = None,
+        dialect: dict | None = None,
+        where: dict[str, list] | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Blockweise Variante von `_read_csv`."""
+        bad_lines: list[dict] = []
+        for chunk in iter_csv_source(path, chunksize, schema=schema, on_bad_line=bad_lines.append,
+                                     engine=self.config.get("csv_engine", "auto"), cache=self.raw_cache,
+                                     dialect=dialect, where=where):
+            self._quarantine(path, bad_lines)
+            bad_lines.clear()
+            yield chunk
+        self._quarantine(path, bad_lines)
+
+    def _quarantine(self, path: str | Path, bad_lines: list[dict]) -> None:
+        """Schreibt fehlerhafte Zeilen (mit Zeilennummer) nach <quarantine>/<Adapter>_quarantine.csv."""
+        if not bad_lines:
+            return
+        adapter_name = type(self).__name__
+        logging.warning(f"{adapter_name}: {len(bad_lines)} fehlerhafte Zeilen in {path} → Quarantäne")
+        frame = pd.DataFrame(bad_lines, columns=["line", "expected_columns", "actual_columns", "text"])
+        frame.insert(0, "file", str(path))
+        save_aux_csv("quarantine", adapter_name, frame, append=self._quarantine_written)
+        self._quarantine_written = True
+        self.quarantined_rows += len(bad_lines)
+
+    # ------------------------------------------------------------ #
+    # Gemeinsamer Validierungs-/Dedupe-Kern (vektorisiert)          #
+    # ------------------------------------------------------------ #
+    def _validate_and_dedupe(
+        self,
+        df: pd.DataFrame,
+        rating: pd.Series | None = None,
+        title_col: str = "title",
+        year_col: str = "year",
+    ) -> tuple[pd.Series, pd.Series, pd.Series]:
+        """
+        Prüft alle Zeilen eines (Block-)DataFrames auf einmal.
+
+        Regeln (Reihenfolge wie in den bisherigen Zeilenschleifen)
+        - Grund: "empty title" → "invalid year" (NA oder außerhalb 1870–2025)
+          → "missing rating" (nur wenn `rating` übergeben wird)
+        - Duplikat: Schlüssel (lower(title), int(year) bzw. NA) kam bereits
+          vorher vor – im selben Block oder in einem früheren Block. Die erste
+          Zeile gewinnt; auch ungültige Zeilen belegen ihren Schlüssel.
+        - Duplikate werden nicht zusätzlich als ungültig gezählt.
+
+        Returns:
+            (reason, duplicate_mask, invalid_mask); reason ist None für gültige
+            Zeilen, gültige Zeilen = ~duplicate_mask & ~invalid_mask.
+        """
+        title = df[title_col]
+        # object und pandas-"string" (Schema der CSV-Ingestion); Nicht-Strings/NA → leer
+        if title.dtype == object or pd.api.types.is_string_dtype(title.dtype):
+            stripped = title.str.strip().astype(object)
+        else:
+            stripped = pd.Series(pd.NA, index=df.index)
+        empty_title = stripped.isna() | stripped.eq("")
+
+        year = pd.to_numeric(df[year_col], errors="coerce").astype("float64")
+        bad_year = year.isna() | ~year.between(1870, 2025)
+
+        conditions = [empty_title.to_numpy(), bad_year.to_numpy()]
+        choices = ["empty title", "invalid year"]
+        if rating is not None:
+            conditions.append(pd.to_numeric(rating, errors="coerce").isna().to_numpy())
+            choices.append("missing rating")
+        reason = pd.Series(np.select(conditions, choices, default=None), index=df.index, dtype=object)
+        reason = reason.where(reason.notna(), None)
+
+        # Schlüssel als String: "<titel klein>\x1f<jahr>" (NA-Jahr → leer)
+        year_text = pd.Series("", index=df.index, dtype=object)
+        has_year = year.notna()
+        year_text[has_year] = year[has_year].astype("int64").astype(str)
+        keys = title.astype(str).str.lower() + "\x1f" + year_text
+
+        seen = self._seen_keys
+        duplicate = keys.duplicated(keep="first")
+        if seen:
+            duplicate |= keys.isin(seen)
+        seen.update(keys[~duplicate].tolist())
+
+        invalid = reason.notna() & ~duplicate
+        return reason, duplicate, invalid
+
+    def _record_rating_sources(self, winner: pd.Series) -> None:
+        """Zählt je Block, aus welcher Kandidatenspalte das Rating stammt (Run-Metriken)."""
+        counts = self.stats.setdefault("rating_sources", {})
+        for column, count in winner.fillna("none").value_counts().items():
+            counts[column] = counts.get(column, 0) + int(count)
+
     def _log_aux_files(
         self,
         adapter_name: str,
-        invalid_rows: list[dict],
-        duplicate_rows: list[dict],
+        invalid_rows: list[dict] | pd.DataFrame,
+        duplicate_rows: list[dict] | pd.DataFrame,
     ) -> None:
-        if invalid_rows:
-            save_aux_csv("invalid", adapter_name, pd.DataFrame(invalid_rows))
-        if duplicate_rows:
-            save_aux_csv("duplicates", adapter_name, pd.DataFrame(duplicate_rows))
\ No newline at end of file
+        self.stats["rejected_rows"] += len(invalid_rows)
+        self.stats["duplicate_rows"] += len(duplicate_rows)
+        for kind, rows in (("invalid", invalid_rows), ("duplicates", duplicate_rows)):
+            if len(rows) == 0:
+                continue
+            # Erster Block eines Laufs überschreibt, weitere Blöcke hängen an
+            append = kind in self._stream["aux_written"]
+            frame = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame(rows)
+            save_aux_csv(kind, adapter_name, frame, append=append)
+            self._stream["aux_written"].add(kind)
@@ -1,11 +1,13 @@
 # static_pipeline/adapters/adapters/imdb_adapter.py
-import re
-from pathlib import Path
-from typing import List
+from typing import Iterator
 import yaml
+import numpy as np
 import pandas as pd
 from adapters.adapters.base_adapter import BaseAdapter
-from transform.normalize import normalize_film_title
+from transform.normalize import normalize_titles
+from transform.dates import INFER, YEAR_ONLY, parse_dates
+from transform.genres import intern_genres
+from utils.csv_ingest import csv_dialect
 
 class ImdbAdapter(BaseAdapter):
     """IMDb-Adapter mit Validierung & Logging (Schema-konform).
@@ -13,141 +15,176 @@ class ImdbAdapter(BaseAdapter):
     • title            str, bereinigt, (title, year) eindeutig
     • release_date_imdb   datetime64[ns]
     • year             Int64  (1900-2025)
-    • genres           list[str]  (optional, leere Liste erlaubt)
+    • genres           category (internierte Genre-Kombination, NaN = keine Genres)
     • rating           float 0-10  (IMDb-Skala)
+
+    Modi
+    - file_path: vorab gejointe CSV (originalTitle, release_date, averageRating, …);
+      ID_IMDB = Zeilennummer.
+    - basics_path + ratings_path: offizielle Dumps title.basics.tsv(.gz) und
+      title.ratings.tsv(.gz). basics wird blockweise gelesen und schon beim
+      Lesen auf `title_types` (Default: movie) gefiltert; Ratings werden über
+      einen Hash-Index auf tconst zugeordnet. ID_IMDB = Nummer aus tconst
+      ("tt0035423" → 35423), damit stabil über Dump-Stände hinweg.
+
+    In beiden Modi trägt `imdb_id` die tconst-Nummer (CSV-Spalte `id`) für den
+    exakten ID-Join im Merge (Crosswalk, siehe transform/merge.py).
     """
 
+    # Gelesene Rohspalten (budget, gross, directors, runtimeMinutes … bleiben ungeparst)
+    csv_schema = {
+        "id": "string",
+        "originalTitle": "string",
+        "genres": "string",
+        "averageRating": "float64",
+        "release_date": "string",
+    }
+
+    # IMDb-Dumps: Tab-getrennt, ohne Quoting, "\N" = fehlend
+    tsv_dialect = csv_dialect("\t", quoted=False, null_values=("\\N",))
+    basics_schema = {
+        "tconst": "string",
+        "titleType": "string",
+        "originalTitle": "string",
+        "startYear": "string",
+        "genres": "string",
+    }
+    tsv_ratings_schema = {"tconst": "string", "averageRating": "float64"}
+    # Zeilen je gelesenem Block der Dumps (config: tsv_chunksize)
+    default_tsv_chunksize = 1_000_000
+
     # ------------------------------------------------------------ #
     # 1) Extract                                                   #
     # ------------------------------------------------------------ #
     def extract(self) -> pd.DataFrame:  # type: ignore[override]
-        return pd.read_csv(self.config["file_path"], on_bad_lines="skip")
+        if self._tsv_mode():
+            chunksize = int(self.config.get("tsv_chunksize", self.default_tsv_chunksize))
+            parts = list(self._iter_tsv_movies(chunksize))
+            return pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=[
+                "tconst", "originalTitle", "release_date", "genres", "averageRating"])
+        return self._read_csv(self.config["file_path"], self.csv_schema)
+
+    def extract_chunks(self, chunksize: int) -> Iterator[pd.DataFrame]:  # type: ignore[override]
+        if self._tsv_mode():
+            yield from self._iter_tsv_movies(chunksize)
+            return
+        yield from self._iter_csv(self.config["file_path"], chunksize, self.csv_schema)
+
+    # ------------------------------------------------------------ #
+    # IMDb-Dumps (title.basics + title.ratings)                    #
+    # ------------------------------------------------------------ #
+    def _tsv_mode(self) -> bool:
+        return "file_path" not in self.config and "basics_path" in self.config
+
+    def _tsv_ratings(self) -> tuple[pd.Index, np.ndarray]:
+        """title.ratings → (Hash-Index der tconst-Nummern, Ratings; letzter Eintrag NaN)."""
+        chunksize = int(self.config.get("tsv_chunksize", self.default_tsv_chunksize))
+        numbers, ratings = [], []
+        for chunk in self._iter_csv(self.config["ratings_path"], chunksize,
+                                    self.tsv_ratings_schema, dialect=self.tsv_dialect):
+            numbers.append(_tconst_numbers(chunk["tconst"]))
+            ratings.append(pd.to_numeric(chunk["averageRating"], errors="coerce").to_numpy(dtype=np.float32))
+        index = pd.Index(np.concatenate(numbers) if numbers else np.zeros(0, dtype=np.int64))
+        values = np.concatenate(ratings) if ratings else np.zeros(0, dtype=np.float32)
+        first = ~index.duplicated(keep="first")
+        return index[first], np.append(values[first], np.nan)
+
+    def _iter_tsv_movies(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Gefilterte title.basics-Blöcke im Rohformat des CSV-Modus.
+
+        Spalten: tconst, originalTitle, release_date (= startYear), genres,
+        averageRating. Im Speicher liegen nur der Rating-Index und ein Block.
+        """
+        ratings_index, ratings = self._tsv_ratings()
+        title_types = list(self.config.get("title_types", ["movie"]))
+        for chunk in self._iter_csv(self.config["basics_path"], chunksize, self.basics_schema,
+                                    dialect=self.tsv_dialect, where={"titleType": title_types}):
+            if chunk.empty:
+                continue
+            # Hash-Lookup je tconst-Nummer; -1 (kein Rating) → letzter Eintrag (NaN)
+            positions = ratings_index.get_indexer(_tconst_numbers(chunk["tconst"]))
+            yield pd.DataFrame({
+                "tconst": chunk["tconst"].to_numpy(),
+                "originalTitle": chunk["originalTitle"].to_numpy(),
+                "release_date": chunk["startYear"].to_numpy(),
+                "genres": chunk["genres"].to_numpy(),
+                "averageRating": ratings[positions].astype(np.float64),
+            })
 
     # ------------------------------------------------------------ #
     # 2) Transform + Validate                                      #
     # ------------------------------------------------------------ #
-    def transform(self, df: pd.DataFrame) -> pd.DataFrame:  # type: ignore[override]
+    def transform_chunk(self, df: pd.DataFrame) -> pd.DataFrame:  # type: ignore[override]
         df = df.copy()
-        src_path = Path(self.config["file_path"])
 
-        # Stabile zeilenbasierte ID, die von Anfang an gilt und nicht neu nummeriert wird
-        df["ID_IMDB"] = range(1, len(df) + 1)
+        # Stabile ID: tconst-Nummer (Dump-Modus) bzw. zeilenbasiert, nie neu nummeriert
+        if "tconst" in df.columns:
+            df["ID_IMDB"] = pd.array(_tconst_numbers(df["tconst"]), dtype="Int64")
+            df.loc[df["ID_IMDB"] < 0, "ID_IMDB"] = pd.NA
+        else:
+            df["ID_IMDB"] = self._next_ids(len(df))
 
-        invalid_rows: List[dict] = []
-        duplicate_rows: List[dict] = []
-        seen_keys = set()
-        cleaned_rows = []
+        # ---------- IMDb-ID für den Crosswalk-Join ----------------
+        tconst_col = next((c for c in ("tconst", "id") if c in df.columns), None)
+        imdb_id = pd.Series(pd.NA, index=df.index, dtype="Int64")
+        if tconst_col is not None:
+            numbers = _tconst_numbers(df[tconst_col])
+            imdb_id = pd.Series(pd.array(numbers, dtype="Int64"), index=df.index).mask(numbers < 0)
 
         # ---------- Titel normalisieren ---------------------------
-        df["title"] = df["originalTitle"].astype(str).apply(normalize_film_title)
+        df["title"] = normalize_titles(df["originalTitle"].astype(str), cache=self.title_cache)
 
         # ---------- Datum → release_date_imdb + year --------------
-        df["release_date_imdb"] = pd.to_datetime(df.get("release_date"), errors="coerce")
+        # Explizite Formate ("July 11, 2001", "July 2001", "2001"), erst danach
+        # Formaterkennung je Wert – so hängt das Ergebnis nicht von Blockgrenzen ab
+        df["release_date_imdb"] = parse_dates(
+            df.get("release_date"), ["%B %d, %Y", "%B %Y", YEAR_ONLY, INFER])
         df["year"] = df["release_date_imdb"].dt.year.astype("Int64")
 
-        # ---------- Fallback-Parsing für "Month YYYY" oder "YYYY" ----------
-        def _parse_fallback(val: str):
-            val = str(val).strip()
-            # "September 2012" etc.
-            try:
-                dt = pd.to_datetime(val, format="%B %Y", errors="raise")
-                return dt
-            except Exception:
-                pass
-            # nur Jahr "2013"
-            if val.isdigit() and len(val) == 4:
-                return pd.to_datetime(f"{val}-01-01", errors="coerce")
-            return pd.NaT
-
-        mask_na_date = df["release_date_imdb"].isna() & df["release_date"].notna()
-        if mask_na_date.any():
-            df.loc[mask_na_date, "release_date_imdb"] = (
-                df.loc[mask_na_date, "release_date"].apply(_parse_fallback)
-            )
-
-        # Jahr erneut nachziehen, falls jetzt Datum vorhanden ist
-        missing_year = df["year"].isna()
-        df.loc[missing_year, "year"] = df.loc[missing_year, "release_date_imdb"].dt.year.astype("Int64")
-
         # Fallback: separate year-Spalte, falls vorhanden und immer noch NA
         na_mask = df["year"].isna() & df.columns.str.contains("year").any()
         if na_mask.any():
             df.loc[na_mask, "year"] = pd.to_numeric(df.loc[na_mask, "year"], errors="coerce")
 
         # ---------- Rating (0-10) ----------------------------------
+        # fehlendes Rating ist erlaubt, wird als NA durchgereicht
         rating_col = "averageRating" if "averageRating" in df.columns else None
-
-        for _, row in df.iterrows():
-            orig = row.to_dict()
-            reason = None
-
-            # 1) Title-Check
-            title = row["title"]
-            if not isinstance(title, str) or not title.strip():
-                reason = "empty title"
-
-            # 2) Year-Check
-            year = row["year"]
-            if pd.isna(year) or not (1870 <= year <= 2025):
-                reason = reason or "invalid year"
-
-            # 3) Rating-Check (fehlendes Rating ist erlaubt, wird als NA durchgereicht)
-            rating = (
-                pd.to_numeric(row.get(rating_col), errors="coerce") if rating_col else pd.NA
-            )
-            if pd.notna(rating):
-                rating = float(rating)         
-            # 4) Duplicate-Check
-            key = (title.lower(), int(year) if pd.notna(year) else None)
-            if key in seen_keys:
-                duplicate_rows.append({
-                    "ID_IMDB": row["ID_IMDB"],
-                    "title": title,
-                    "release_date_imdb": row["release_date_imdb"],
-                    "year": year,
-                    "genres": (
-                        [g.strip() for g in re.split(r"[|,]", str(row.get("genres", ""))) if g.strip()]
-                        if pd.notna(row.get("genres")) else []
-                    ),
-                    "rating": (float(rating) if pd.notna(rating) else pd.NA),
-                    "reason": "duplicate title+year",
-                })
-                continue
-            seen_keys.add(key)
-
-            # 5) Invalid vs Valid
-            genres_raw = row.get("genres", "")
-            genres_list = (
-                [g.strip() for g in re.split(r"[|,]", str(genres_raw)) if g.strip()]
-                if pd.notna(genres_raw)
-                else []
-            )
-
-            if reason:
-                invalid_rows.append({
-                    "ID_IMDB": row["ID_IMDB"],
-                    "title": title,
-                    "release_date_imdb": row["release_date_imdb"],
-                    "year": year,
-                    "genres": genres_list,
-                    "rating": (float(rating) if pd.notna(rating) else pd.NA),
-                    "reason": reason,
-                })
-            else:
-                cleaned_rows.append(
-                    {
-                        "ID_IMDB": row["ID_IMDB"],
-                        "title": title,
-                        "release_date_imdb": row["release_date_imdb"],
-                        "year": year,
-                        "genres": genres_list,
-                        "rating_imdb": (float(rating) if pd.notna(rating) else pd.NA),
-                    }
-                )
+        rating = (
+            pd.to_numeric(df[rating_col], errors="coerce") if rating_col
+            else pd.Series(np.nan, index=df.index)
+        ).astype("Float64")
+
+        # ---------- Genres → internierte Kombinationen -------------
+        genres = intern_genres(df.get("genres"), sep="[|,]", index=df.index)
+
+        # ---------- Validierung + Duplikate (gemeinsamer Kern) -----
+        reason, is_duplicate, is_invalid = self._validate_and_dedupe(df)
+
+        out = pd.DataFrame({
+            "ID_IMDB": df["ID_IMDB"],
+            "title": df["title"],
+            "release_date_imdb": df["release_date_imdb"],
+            "year": df["year"],
+            "genres": genres,
+            "rating_imdb": rating,
+            "imdb_id": imdb_id,
+        })
 
         # ---------- CSV-Logging (zentraler Pfad) --------------------
-        self._log_aux_files("ImdbAdapter", invalid_rows, duplicate_rows)
-            
+        aux = out.rename(columns={"rating_imdb": "rating"})
+        self._log_aux_files(
+            "ImdbAdapter",
+            aux[is_invalid].assign(reason=reason[is_invalid]),
+            aux[is_duplicate].assign(reason="duplicate title+year"),
+        )
+
         # ---------- Ergebnis-DataFrame -----------------------------
-        result = pd.DataFrame(cleaned_rows)
-        return result[["ID_IMDB", "title", "release_date_imdb", "year", "genres", "rating_imdb"]]
\ No newline at end of file
+        final_cols = ["ID_IMDB", "title", "release_date_imdb", "year", "genres", "rating_imdb", "imdb_id"]
+        return out.loc[~is_duplicate & ~is_invalid, final_cols].reset_index(drop=True)
+
+
+def _tconst_numbers(tconst: pd.Series) -> np.ndarray:
+    """IMDb-tconst ("tt0035423") → int64-Nummer (35423); nicht lesbar → -1."""
+    numbers = pd.to_numeric(tconst.astype(str).str.slice(2), errors="coerce")
+    return numbers.fillna(-1).to_numpy(dtype=np.int64)
@@ -1,141 +1,96 @@
 # static_pipeline/adapters/adapters/metacritic_adapter.py
-import re
 from pathlib import Path
-from typing import List
+from typing import Iterator
 
 import pandas as pd
 from adapters.adapters.base_adapter import BaseAdapter
-from transform.normalize import normalize_film_title
+from transform.normalize import normalize_titles
+from transform.dates import YEAR_ONLY, parse_dates
+from transform.genres import intern_genres
+from transform.rating_coalesce import coalesce_ratings, rating_candidate
 
 
 class MetacriticAdapter(BaseAdapter):
     """Reiner Pandas-Adapter für Metacritic – mit Validierung & Logging."""
 
+    # userscore enthält "tbd" → als String lesen, coalesce_ratings parst
+    csv_schema = {
+        "movie_title": "string",
+        "release_date": "string",
+        "genre": "string",
+        "metascore": "float64",
+        "userscore": "string",
+    }
+
     def extract(self) -> pd.DataFrame: 
-        return pd.read_csv(self.config["file_path"], on_bad_lines="skip")
+        return self._read_csv(self.config["file_path"], self.csv_schema)
+
+    def extract_chunks(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        yield from self._iter_csv(self.config["file_path"], chunksize, self.csv_schema)
 
-    def transform(self, df: pd.DataFrame) -> pd.DataFrame:  
+    def transform_chunk(self, df: pd.DataFrame) -> pd.DataFrame:
         df = df.copy()
         src_path = Path(self.config["file_path"])
         # Stabile zeilenbasierte ID
-        df["ID_METACRITIC"] = range(1, len(df) + 1)
-        invalid_rows: List[dict] = []
-        duplicate_rows: List[dict] = []
-        seen_keys = set()
+        df["ID_METACRITIC"] = self._next_ids(len(df))
 
         # ---------- Titel normalisieren --------------------------------
-        df["title"] = df["movie_title"].astype(str).apply(normalize_film_title)
+        df["title"] = normalize_titles(df["movie_title"].astype(str), cache=self.title_cache)
 
         # ---------- Datum parsen  --------------------------------------
-        def _parse_date(val: str):
-            val = str(val).strip()
-            # 1) Reguläres dd-MMM-yy (Metacritic-Standard)
-            d = pd.to_datetime(val, format="%d-%b-%y", errors="coerce")
-            if pd.notna(d):
-                return d
-            # 2) Month YYYY  (e.g. "January 1994")
-            m = pd.to_datetime(val, format="%B %Y", errors="coerce")
-            if pd.notna(m):
-                return m
-            # 3) Reines Jahr "1994"
-            if re.fullmatch(r"\d{4}", val):
-                return pd.to_datetime(f"{val}-01-01", errors="coerce")
-            return pd.NaT
-
-        df["release_date_meta"] = df["release_date"].apply(_parse_date)
+        # 1) dd-MMM-yy (Metacritic-Standard), 2) Month YYYY, 3) reines Jahr;
+        # zweistellige Jahresrollen (>2025 → -100 Jahre) werden korrigiert
+        df["release_date_meta"] = parse_dates(
+            df["release_date"], ["%d-%b-%y", "%B %Y", YEAR_ONLY], rollover_after=2025)
         df["year"] = df["release_date_meta"].dt.year.astype("Int64")
 
-        # Korrektur zweistelliger Jahresrollen (>2025 → -100 Jahre)
-        df.loc[df["year"] > 2025, "year"] -= 100
-        df.loc[df["release_date_meta"].dt.year > 2025, "release_date_meta"] -= pd.DateOffset(
-            years=100
-        )
-
         # ---------- Rating-Spalte wählen --------------------------------
         rating_candidates = [
             c for c in df.columns if any(k in c.lower() for k in ("score", "rating"))
         ]
 
-        def _best_rating(row):
-            best_val = pd.NA
-            best_count = -1
-            for col in rating_candidates:
-                raw = row[col]
-                # Ignoriere Platzhalter wie "tbd"
-                if isinstance(raw, str) and raw.lower() == "tbd":
-                    continue
-                num = pd.to_numeric(raw, errors="coerce")
-                if pd.notna(num):
-                    # Kritiker-Score liegt 0–100, User-Score meist 0–10
-                    if "user" in col.lower() and num <= 10:
-                        num *= 10
-                    return float(num)
-            return best_val
-
-        df["rating_metacritic"] = df.apply(_best_rating, axis=1)
-
-        # ---------- Zeilen iterieren & prüfen ---------------------------
-        cleaned_rows = []
-        for _, row in df.iterrows():
-            reason = None
-
-            title = row["title"]
-            if not isinstance(title, str) or not title.strip():
-                reason = "empty title"
-
-            year = row["year"]
-            if pd.isna(year) or not (1870 <= year <= 2025):
-                reason = reason or "invalid year"
-
-            rating = row["rating_metacritic"]
-            if pd.isna(rating):
-                reason = reason or "missing rating"
-
-            key = (title.lower(), int(year) if pd.notna(year) else None)
-            if key in seen_keys:
-                duplicate_rows.append({**row.to_dict(), "reason": "duplicate title+year"})
-                continue  # Duplikate werden nicht doppelt geprüft
-            seen_keys.add(key)
+        # Kritiker-Score liegt 0–100, User-Score meist 0–10 → ×10; "tbd" = kein Wert
+        candidates = [
+            rating_candidate(
+                col,
+                sentinels=("tbd",),
+                rescale_max=10 if "user" in col.lower() else None,
+                rescale_factor=10,
+            )
+            for col in rating_candidates
+        ]
+        df["rating_metacritic"], rating_source = coalesce_ratings(df, candidates)
+        self._record_rating_sources(rating_source)
 
-            if reason:
-                invalid_rows.append({**row.to_dict(), "reason": reason})
-            else:
-                cleaned_rows.append(
-                    {
-                        "ID_METACRITIC": row["ID_METACRITIC"],
-                        "title": title,
-                        "release_date_meta": row["release_date_meta"],
-                        "year": year,
-                        "genres": [
-                            g.strip()
-                            for g in str(row.get("genre", "")).split(",")
-                            if g.strip()
-                        ],
-                        "rating_metacritic": rating,
-                    }
-                )
+        # ---------- Validierung + Duplikate (gemeinsamer Kern) ----------
+        reason, is_duplicate, is_invalid = self._validate_and_dedupe(
+            df, rating=df["rating_metacritic"])
+        is_clean = ~is_duplicate & ~is_invalid
 
         # ---------- Invalid/Duplicate zentral speichern ------------------
-        def _convert(rows: list[dict]):
-            converted = []
-            for d in rows:
-                converted.append({
-                    "ID_METACRITIC": d.get("ID_METACRITIC"),
-                    "title": d.get("title"),
-                    "release_date_meta": d.get("release_date_meta"),
-                    "year": d.get("year"),
-                    "genres": d.get("genres", d.get("genre")),
-                    "rating": d.get("rating_metacritic", d.get("rating")),
-                    "reason": d.get("reason", "")
-                })
-            return converted
-
+        # Aux-Dateien führen die Rohgenres (Spalte "genre") unverändert mit
+        aux = pd.DataFrame({
+            "ID_METACRITIC": df["ID_METACRITIC"],
+            "title": df["title"],
+            "release_date_meta": df["release_date_meta"],
+            "year": df["year"],
+            "genres": df["genre"] if "genre" in df.columns else None,
+            "rating": df["rating_metacritic"],
+        })
         self._log_aux_files(
             "MetacriticAdapter",
-            _convert(invalid_rows),
-            _convert(duplicate_rows),
+            aux[is_invalid].assign(reason=reason[is_invalid]),
+            aux[is_duplicate].assign(reason="duplicate title+year"),
         )
 
         # ---------- Ergebnis-DataFrame ----------------------------------
-        result_df = pd.DataFrame(cleaned_rows)
-        return result_df[["ID_METACRITIC", "title", "release_date_meta", "year", "genres", "rating_metacritic"]]
\ No newline at end of file
+        clean = df[is_clean]
+        result_df = pd.DataFrame({
+            "ID_METACRITIC": clean["ID_METACRITIC"],
+            "title": clean["title"],
+            "release_date_meta": clean["release_date_meta"],
+            "year": clean["year"],
+            "genres": intern_genres(clean.get("genre"), sep=",", index=clean.index),
+            "rating_metacritic": clean["rating_metacritic"],
+        })
+        return result_df.reset_index(drop=True)
@@ -1,9 +1,29 @@
 import pandas as pd
 from adapters.adapters.base_adapter import BaseAdapter
-from transform.normalize import normalize_film_title
+from transform.normalize import normalize_titles
+from transform.genres import intern_genres, with_genre_lists
+from transform.rating_aggregate import aggregate_ratings
 from pathlib import Path  
+from typing import Iterator
 
 class MovielensAdapter(BaseAdapter):
+    # Gelesene Rohspalten je Datei (rating_count, userId, timestamp bleiben ungeparst)
+    aggregated_schema = {
+        "movieId": "int64",
+        "title": "string",
+        "genres": "string",
+        "average_rating": "float64",
+        "release_year": "float64",
+    }
+    movies_schema = {"movieId": "int64", "title": "string", "genres": "string"}
+    # Kompakte dtypes: 8 Byte je Rating (MovieLens 32M ≈ 256 MB je Vollblock-Summe)
+    ratings_schema = {"movieId": "int32", "rating": "float32"}
+    # Zeilen je Block beim Aggregieren von ratings.csv (config: ratings_chunksize)
+    default_ratings_chunksize = 1_000_000
+    # Optionaler Crosswalk links.csv (config: links_path); imdbId "0114709" → 114709
+    links_schema = {"movieId": "int64", "imdbId": "int64"}
+    _imdb_links: pd.Series | None = None
+
     def extract(self):  # type: ignore[override]
         """Lädt die benötigten Movielens-Daten.
 
@@ -14,9 +34,14 @@ class MovielensAdapter(BaseAdapter):
            wird genau eine CSV-Datei eingelesen, die bereits Filme und die
            durchschnittlichen Bewertungen enthält.
 
-        2. Rohdateien: Sind *movies_path* **und** *ratings_path* gesetzt, werden
-           diese beiden Dateien geladen und in :pymeth:`transform` zusammengeführt
-           wie bisher.
+        2. Rohdateien: Sind *movies_path* **und** *ratings_path* gesetzt, wird
+           movies.csv geladen und ratings.csv blockweise (*ratings_chunksize*
+           Zeilen, optional *ratings_workers* Threads) zu Mittelwert und Anzahl
+           je movieId aggregiert; :pymeth:`transform` führt beides zusammen.
+           Der Speicherbedarf hängt nur von der Zahl der Filme ab.
+
+        In beiden Modi ergänzt ein optionaler *links_path* (MovieLens links.csv)
+        die Spalte `imdb_id` für den exakten ID-Join im Merge.
         """
 
         # --- Modus 1: Eine bereits aggregierte CSV ---
@@ -25,28 +50,75 @@ class MovielensAdapter(BaseAdapter):
             None,
         )
         if aggregated_key:
-            aggregated_df = pd.read_csv(self.config[aggregated_key])
+            aggregated_df = self._read_csv(self.config[aggregated_key], self.aggregated_schema)
             return aggregated_df  # Einzelnes DataFrame
 
         # --- Modus 2: Zwei Roh-Dateien (Standard des ursprünglichen Codes) ---
-        movies = pd.read_csv(self.config["movies_path"])
-        ratings = pd.read_csv(self.config["ratings_path"])
-        return movies, ratings
+        movies = self._read_csv(self.config["movies_path"], self.movies_schema)
+        return movies, self._aggregate_ratings()
 
-    def transform(self, data) -> pd.DataFrame:  # type: ignore[override]
+    def extract_chunks(self, chunksize: int) -> Iterator:  # type: ignore[override]
+        """Blockweises Einlesen; im Rohmodus wird movies.csv in Blöcke geteilt,
+        die (blockweise berechnete) Rating-Aggregation jedem Block beigelegt."""
+        aggregated_key = next(
+            (k for k in ("file_path", "aggregated_path") if k in self.config),
+            None,
+        )
+        if aggregated_key:
+            yield from self._iter_csv(self.config[aggregated_key], chunksize, self.aggregated_schema)
+            return
+
+        ratings = self._aggregate_ratings()
+        for movies in self._iter_csv(self.config["movies_path"], chunksize, self.movies_schema):
+            yield movies, ratings
+
+    def _aggregate_ratings(self) -> pd.DataFrame:
+        """ratings.csv blockweise → rating_movielens + rating_count je movieId (Index)."""
+        chunks = self._iter_csv(
+            self.config["ratings_path"],
+            int(self.config.get("ratings_chunksize", self.default_ratings_chunksize)),
+            self.ratings_schema,
+        )
+        return self._rating_table(
+            aggregate_ratings(chunks, workers=int(self.config.get("ratings_workers", 1))))
+
+    @staticmethod
+    def _rating_table(aggregated: pd.DataFrame) -> pd.DataFrame:
+        return pd.DataFrame({
+            "rating_movielens": aggregated["mean"].round(2),
+            "rating_count": aggregated["count"],
+        })
+
+    def _links(self) -> pd.Series | None:
+        """links.csv → imdb_id je movieId (einmal gelesen); None ohne links_path."""
+        if "links_path" not in self.config:
+            return None
+        if self._imdb_links is None:
+            links = self._read_csv(self.config["links_path"], self.links_schema)
+            links = links.dropna(subset=["movieId", "imdbId"]).drop_duplicates("movieId")
+            self._imdb_links = pd.Series(
+                links["imdbId"].to_numpy(dtype="int64"),
+                index=pd.Index(links["movieId"].to_numpy(dtype="int64"), name="movieId"),
+            )
+        return self._imdb_links
+
+    def transform_chunk(self, data) -> pd.DataFrame:  # type: ignore[override]
         """Bereinigt und vereinheitlicht die Movielens-Daten."""
 
         if isinstance(data, tuple):
             # --- Legacy-Pfad: Rohdateien ---
             df_movies, df_ratings = data
             df_movies = df_movies.copy()
+            if "rating" in df_ratings.columns:
+                # Einzelratings (nicht aus extract) → wie dort aggregieren
+                df_ratings = self._rating_table(aggregate_ratings([df_ratings]))
         else:
             # --- Neuer Pfad: Aggregierte Datei ---
             df_movies = data.copy()
             df_ratings = None  # Wird nicht benötigt
 
         # Stabile zeilenbasierte ID, die von Anfang an gilt
-        df_movies["ID_MOVIELENS"] = range(1, len(df_movies) + 1)
+        df_movies["ID_MOVIELENS"] = self._next_ids(len(df_movies))
 
         # Bestehende Logik zur Jahres-Extraktion und Titel-Vorreinigung
         df_movies["year"] = (
@@ -58,17 +130,18 @@ class MovielensAdapter(BaseAdapter):
             .astype("Int64")
         )
         # ── ungültige Zeilen (fehlendes Jahr) sammeln ──────────
-        invalid_df = df_movies[df_movies["year"].isna()].copy()
-        invalid_initial: list[dict] = []
-        if not invalid_df.empty:
-            for _, row in invalid_df.iterrows():
-                invalid_initial.append({
-                    "title": row["title"],
-                    "year": pd.NA,
-                    "genres_ml": row.get("genres", ""),
-                    "rating_movielens": row.get("average_rating", pd.NA),
-                    "reason": "missing year"
-                })
+        missing_year = df_movies["year"].isna()
+        invalid_initial = pd.DataFrame({
+            "ID_MOVIELENS": pd.Series(pd.NA, index=df_movies.index[missing_year], dtype="Int64"),
+            "title": df_movies.loc[missing_year, "title"],
+            "year": pd.Series(pd.NA, index=df_movies.index[missing_year], dtype="Int64"),
+            "genres_ml": df_movies.loc[missing_year, "genres"] if "genres" in df_movies.columns else "",
+            "rating_movielens": (
+                df_movies.loc[missing_year, "average_rating"]
+                if "average_rating" in df_movies.columns else pd.NA
+            ),
+            "reason": "missing year",
+        })
         # Fallback: falls Jahr fehlt, versuche release_year/year-Spalten + 2-digit Mapping
         if df_movies["year"].isna().any():
             # release_year übernehmen, falls vorhanden
@@ -91,94 +164,50 @@ class MovielensAdapter(BaseAdapter):
         df_movies = df_movies.dropna(subset=["year"])            
         
         # Titel ausschließlich über die zentrale Normalisierung bereinigen
-        df_movies["title"] = df_movies["title"].astype(str).apply(normalize_film_title)
+        df_movies["title"] = normalize_titles(df_movies["title"].astype(str), cache=self.title_cache)
         
         # Bestehende Logik für Genres und Ratings
         df_movies.rename(columns={"genres": "genres_ml"}, inplace=True)
-        df_movies["genres_ml"] = (
-            df_movies["genres_ml"]
-            .fillna("")
-            .apply(lambda g: [genre.strip() for genre in g.split("|") if genre.strip()] if isinstance(g, str) and g else [])
-        )
+        df_movies["genres_ml"] = intern_genres(df_movies.get("genres_ml"), sep="|", index=df_movies.index)
         
         # --- Bewertungsspalte erstellen ---
         if df_ratings is not None:
-            # Alte Logik: Durchschnitt aus Ratings berechnen.
-            df_grouped_ratings = (
-                df_ratings
-                .groupby("movieId")
-                .agg(rating_movielens=("rating", "mean"))
-                .reset_index()
-            )
-            df_grouped_ratings["rating_movielens"] = df_grouped_ratings[
-                "rating_movielens"
-            ].round(2)
-
-            df = pd.merge(df_movies, df_grouped_ratings, on="movieId", how="left")
+            # Rohmodus: Mittelwert (2 Nachkommastellen) + Anzahl je movieId
+            movie_ids = df_movies["movieId"]
+            df_movies["rating_movielens"] = movie_ids.map(df_ratings["rating_movielens"])
+            df_movies["rating_count"] = movie_ids.map(df_ratings["rating_count"]).astype("Int64")
         else:
-            # Neue Logik: Spalte *average_rating* umbenennen.
+            # Aggregierte Datei: Spalte *average_rating* umbenennen.
             if "average_rating" in df_movies.columns:
                 df_movies.rename(columns={"average_rating": "rating_movielens"}, inplace=True)
-            df = df_movies
-        
-        # ---------- Vollständige Validierung -----------------------------
-        invalid_rows, duplicate_rows, seen = invalid_initial.copy(), [], set()
-        cleaned_rows = []
-
-        for _, row in df_movies.iterrows():
-            orig = row.to_dict()
-            reason = None
-
-            # Titel prüfen
-            title = row["title"]
-            if not isinstance(title, str) or not title.strip():
-                reason = "empty title"
-
-            # Jahr prüfen
-            year = row["year"]
-            if pd.isna(year) or not (1870 <= year <= 2025):
-                reason = reason or "invalid year"
-
-            # Rating prüfen (0–5 oder 0–10 -> schon numerisch?)
-            rating = pd.to_numeric(row.get("rating_movielens"), errors="coerce")
-            if pd.isna(rating):
-                reason = reason or "missing rating"
-
-            # Duplicate-Check
-            key = (title.lower(), int(year) if pd.notna(year) else None)
-            if key in seen:
-                duplicate_rows.append({**orig, "reason": "duplicate title+year"})
-                continue
-            seen.add(key)
-
-            if reason:
-                invalid_rows.append({**orig, "reason": reason})
-            else:
-                cleaned_rows.append(row)
+
+        # Crosswalk: IMDb-ID für den exakten ID-Join im Merge
+        links = self._links()
+        if links is not None:
+            df_movies["imdb_id"] = df_movies["movieId"].map(links).astype("Int64")
+
+        # ---------- Vollständige Validierung (gemeinsamer Kern) ----------
+        rating = df_movies.get("rating_movielens", pd.Series(pd.NA, index=df_movies.index))
+        reason, is_duplicate, is_invalid = self._validate_and_dedupe(df_movies, rating=rating)
 
         # ---------- Invalid/Duplicate in einheitlichem Schema + zentralem Pfad
-        def _convert(rows: list[dict]):
-            converted = []
-            for d in rows:
-                converted.append({
-                    "ID_MOVIELENS": d.get("ID_MOVIELENS"),
-                    "title": d.get("title"),
-                    "year": d.get("year"),
-                    "genres_ml": d.get("genres_ml", d.get("genres")),
-                    "rating_movielens": d.get("rating_movielens"),
-                    "reason": d.get("reason", "")
-                })
-            return converted
-
-        self._log_aux_files(
-            "MovielensAdapter",
-            _convert(invalid_rows),
-            _convert(duplicate_rows),
-        )
+        aux_cols = ["ID_MOVIELENS", "title", "year", "genres_ml", "rating_movielens"]
+        if "rating_count" in df_movies.columns:
+            aux_cols.append("rating_count")
+        aux = df_movies.reindex(columns=aux_cols)
+        # invalid_initial führt Rohgenres; die kategorialen Genres vor dem concat als Listen ausgeben
+        invalid_parts = [
+            part for part in (invalid_initial, with_genre_lists(aux[is_invalid].assign(reason=reason[is_invalid])))
+            if not part.empty
+        ]
+        invalid_rows = pd.concat(invalid_parts, ignore_index=True) if invalid_parts else invalid_initial
+        duplicate_rows = aux[is_duplicate].assign(reason="duplicate title+year")
+
+        self._log_aux_files("MovielensAdapter", invalid_rows, duplicate_rows)
         print(len(invalid_rows), "invalid  |", len(duplicate_rows), "duplicates")
-        result = pd.DataFrame(cleaned_rows)
+        final_cols = ["ID_MOVIELENS", "title", "year", "genres_ml", "rating_movielens", "rating_count", "imdb_id"]
+        result = df_movies[~is_duplicate & ~is_invalid].copy()
         if not result.empty and "rating_movielens" in result.columns:
             result["rating_movielens"] = pd.to_numeric(result["rating_movielens"], errors="coerce").astype("Float64")
 
-        final_cols = ["ID_MOVIELENS", "title", "year", "genres_ml", "rating_movielens"]
-        return result[[col for col in final_cols if col in result.columns]]
\ No newline at end of file
+        return result[[col for col in final_cols if col in result.columns]]
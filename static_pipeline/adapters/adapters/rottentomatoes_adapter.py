@@ -1,17 +1,28 @@
 import pandas as pd
 from adapters.adapters.base_adapter import BaseAdapter
-from transform.normalize import normalize_film_title  # Importieren
+from transform.normalize import normalize_titles  # Importieren
+from transform.dates import INFER, parse_dates
+from transform.genres import intern_genres
+from transform.rating_coalesce import coalesce_ratings, rating_candidate
 import logging
 from pathlib import Path 
 from io import StringIO  # NEU
+from typing import Iterator
 
 
 class RottenTomatoesAdapter(BaseAdapter):
+    # Gelesene Rohspalten (movie_info u. a. Freitextspalten bleiben ungeparst)
+    csv_schema = {
+        "movie_title": "string",
+        "genres": "string",
+        "original_release_date": "string",
+        "streaming_release_date": "string",
+        "tomatometer_rating": "float64",
+        "audience_rating": "float64",
+    }
 
     def extract(self) -> pd.DataFrame:
-        df = pd.read_csv(self.config['file_path'],
-                         engine="python",
-                         on_bad_lines="skip")
+        df = self._read_csv(self.config['file_path'], self.csv_schema)
         logging.info(
             f"RottenTomatoesAdapter: Rohdaten nach CSV-Einlesen (erste 5 Zeilen):\n{df.head()}"
         )
@@ -21,7 +32,10 @@ class RottenTomatoesAdapter(BaseAdapter):
             f"RottenTomatoesAdapter: Info zu Rohdaten:\n{buf.getvalue()}")
         return df
 
-    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+    def extract_chunks(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        yield from self._iter_csv(self.config['file_path'], chunksize, self.csv_schema)
+
+    def transform_chunk(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         • Bereinigt Rotten-Tomatoes-Rohdaten
         • akzeptiert fallback auf `streaming_release_date`, falls
@@ -33,19 +47,18 @@ class RottenTomatoesAdapter(BaseAdapter):
         df = df.copy()
 
         # Stabile zeilenbasierte ID
-        df["ID_RT"] = range(1, len(df) + 1)
+        df["ID_RT"] = self._next_ids(len(df))
 
         # 1) Titel normalisieren ------------------------------------------------
         base_title_series = df["movie_title"].astype(str)
-        df["title"] = base_title_series.apply(normalize_film_title)
+        df["title"] = normalize_titles(base_title_series, cache=self.title_cache)
 
         # 2) Release-Date (Original + Fallback) ---------------------------------
         df.rename(columns={"original_release_date": "release_date_rt_temp"},
                 inplace=True, errors="ignore")
 
         # 2a  Versuch: original_release_date
-        df["release_date_rt"] = pd.to_datetime(df.get("release_date_rt_temp"),
-                                            errors="coerce")
+        df["release_date_rt"] = parse_dates(df.get("release_date_rt_temp"), [INFER])
 
         # 2b  Fallback auf streaming_release_date, falls erster Versuch NaT
         needs_fallback = (
@@ -53,97 +66,40 @@ class RottenTomatoesAdapter(BaseAdapter):
             & df.get("streaming_release_date").notna()
         )
         if needs_fallback.any():
-            df.loc[needs_fallback, "release_date_rt"] = pd.to_datetime(
-                df.loc[needs_fallback, "streaming_release_date"],
-                errors="coerce"
-            )
+            df.loc[needs_fallback, "release_date_rt"] = parse_dates(
+                df.loc[needs_fallback, "streaming_release_date"], [INFER])
 
         df["year"] = df["release_date_rt"].dt.year.astype("Int64")
 
-        # 3) Genres in Liste umwandeln -----------------------------------------
+        # 3) Genres internieren (Kombination je Zeile als Kategorie-Code) -------
         df.rename(columns={"genres": "genres_rt_temp"}, inplace=True, errors="ignore")
-        df["genres_rt"] = (
-            df.get("genres_rt_temp", pd.Series(dtype=str))
-            .fillna("")
-            .apply(lambda g: [genre.strip() for genre in g.split(",") if genre.strip()]
-                    if isinstance(g, str) and g else [])
-        )
+        df["genres_rt"] = intern_genres(df.get("genres_rt_temp"), sep=",", index=df.index)
 
         # 4) Rating-Spalte wählen (Tomatometer bevorzugt, Fallback Audience) ----
-        rating_candidates = ["tomatometer_rating", "audience_rating"]
-
-        def _best_rating(row):
-            for col in rating_candidates:
-                val = pd.to_numeric(row.get(col), errors="coerce")
-                if pd.notna(val):
-                    # Beide Ratings sind 0–100 skaliert
-                    return float(val)
-            return pd.NA
-
-        df["rating_rt_audience"] = (
-            df.apply(_best_rating, axis=1)
-        ).astype("Float64")
+        # Beide Ratings sind 0–100 skaliert
+        rating_candidates = [rating_candidate("tomatometer_rating"), rating_candidate("audience_rating")]
+        df["rating_rt_audience"], rating_source = coalesce_ratings(df, rating_candidates)
+        self._record_rating_sources(rating_source)
 
         # 5) Temporäre Spalten loswerden ---------------------------------------
         df.drop(columns=[c for c in ("release_date_rt_temp", "genres_rt_temp")
                         if c in df.columns],
                 inplace=True, errors="ignore")
 
-        # 6) Vollständige Validierung & Logging --------------------------------
-        invalid_rows, duplicate_rows, seen = [], [], set()
-        cleaned_rows = []
-
-        for _, row in df.iterrows():
-            orig = row.to_dict()
-            reason = None
-
-            # Titel prüfen
-            title = row["title"]
-            if not isinstance(title, str) or not title.strip():
-                reason = reason or "empty title"
-
-            # Jahr prüfen
-            year = row["year"]
-            if pd.isna(year) or not (1870 <= year <= 2025):
-                reason = reason or "invalid year"
-
-            # Rating prüfen
-            if pd.isna(row["rating_rt_audience"]):
-                reason = reason or "missing rating"
-
-            # Duplikatsprüfung
-            key = (title.lower(), int(year) if pd.notna(year) else None)
-            if key in seen:
-                duplicate_rows.append({**orig, "reason": "duplicate title+year"})
-                continue
-            seen.add(key)
-
-            if reason:
-                invalid_rows.append({**orig, "reason": reason})
-            else:
-                cleaned_rows.append(row)
+        # 6) Vollständige Validierung (gemeinsamer Kern) -----------------------
+        reason, is_duplicate, is_invalid = self._validate_and_dedupe(
+            df, rating=df["rating_rt_audience"])
 
         # 7) CSV-Logging in zentralen Ordner (einheitliches Schema) -------------
-        def _convert(rows: list[dict]):
-            converted = []
-            for d in rows:
-                converted.append({
-                    "title": d.get("title"),
-                    "release_date_rt": d.get("release_date_rt"),
-                    "year": d.get("year"),
-                    "genres_rt": d.get("genres_rt"),
-                    "rating_rt_audience": d.get("rating_rt_audience"),
-                    "reason": d.get("reason", "")
-                })
-            return converted
-
+        aux_cols = ["title", "release_date_rt", "year", "genres_rt", "rating_rt_audience"]
+        aux = df.reindex(columns=aux_cols)
         self._log_aux_files(
             "RottenTomatoesAdapter",
-            _convert(invalid_rows),
-            _convert(duplicate_rows),
+            aux[is_invalid].assign(reason=reason[is_invalid]),
+            aux[is_duplicate].assign(reason="duplicate title+year"),
         )
 
         # 8) Ergebnis-DataFrame -------------------------------------------------
-        result = pd.DataFrame(cleaned_rows)
         final_cols = ["ID_RT", "title", "release_date_rt", "year", "genres_rt", "rating_rt_audience"]
-        return result[[col for col in final_cols if col in result.columns]]
\ No newline at end of file
+        result = df[~is_duplicate & ~is_invalid]
+        return result[[col for col in final_cols if col in result.columns]]
@@ -0,0 +1,240 @@
+"""
+End-to-End-Skalierungsbenchmark: ETLPipeline.run() auf synthetischen Daten.
+
+Je Größe (Anzahl Filme im synthetischen Universum, siehe
+generate_synthetic.py) wird
+  1. ein Rohdatensatz erzeugt (oder aus `--data-dir` wiederverwendet),
+  2. eine Config mit absoluten Pfaden in ein eigenes Arbeitsverzeichnis
+     geschrieben (Cache und Checkpoints aus, Metriken an),
+  3. main_pipeline.py als eigener Prozess mit diesem Arbeitsverzeichnis
+     gestartet (Zwischenergebnisse wie unfiltered/duplicates landen dort),
+  4. der Metrik-Report (utils/run_metrics.py) eingelesen.
+
+Ausgegeben werden je Stufe Wall-Zeit und Peak-RSS pro Größe sowie der
+Skalierungsexponent k aus t ∝ n^k zwischen benachbarten Größen
+(k ≈ 1 linear, k ≈ 2 quadratisch).
+
+Beispiele (aus static_pipeline/):
+    python benchmarks/bench_pipeline.py --sizes 100k,1M,10M --data-dir /tmp/etl_synth
+    python benchmarks/bench_pipeline.py --sizes 10k,100k --output benchmarks/scaling.json
+
+Mit `--max-seconds` werden größere Größen übersprungen, sobald ein Lauf
+länger gedauert hat; `--timeout` bricht einen einzelnen Lauf ab.
+"""
+
+import argparse
+import json
+import math
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import yaml
+
+BENCH_DIR = Path(__file__).resolve().parent
+PIPELINE_DIR = BENCH_DIR.parent
+sys.path.insert(0, str(BENCH_DIR))
+
+from generate_synthetic import SEED, dataset_paths, generate_sources, parse_count, sources_config  # noqa: E402
+
+_GENERATOR_MANIFEST = "generator.json"
+
+
+def _label(n: int) -> str:
+    if n >= 1_000_000 and n % 1_000_000 == 0:
+        return f"{n // 1_000_000}M"
+    if n >= 1_000 and n % 1_000 == 0:
+        return f"{n // 1_000}k"
+    return str(n)
+
+
+def ensure_dataset(data_dir: Path, n_movies: int, params: dict) -> dict[str, Path]:
+    """Erzeugt den Datensatz, sofern er nicht mit identischen Parametern vorliegt."""
+    target = data_dir / _label(n_movies)
+    manifest_path = target / _GENERATOR_MANIFEST
+    wanted = {"n_movies": n_movies, **params}
+    try:
+        existing = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        existing = None
+    if existing == wanted:
+        print(f"[{_label(n_movies)}] verwende vorhandene Rohdaten unter {target}")
+        return dataset_paths(target, params.get("movielens_raw", False))
+
+    print(f"[{_label(n_movies)}] erzeuge Rohdaten unter {target} …")
+    start = time.perf_counter()
+    paths = generate_sources(n_movies, target, **params)
+    print(f"[{_label(n_movies)}] Rohdaten erzeugt in {time.perf_counter() - start:.1f}s")
+    manifest_path.write_text(json.dumps(wanted, indent=2), encoding="utf-8")
+    return paths
+
+
+def write_config(work_dir: Path, paths: dict[str, Path], movielens_raw: bool) -> Path:
+    """Pipeline-Config mit absoluten Pfaden unterhalb von `work_dir`."""
+    with open(PIPELINE_DIR / "config.yaml", "r", encoding="utf-8") as f:
+        base_config = yaml.safe_load(f) or {}
+    config = {
+        "logging": {"level": "WARNING"},
+        "sources": sources_config(paths, movielens_raw),
+        "processing": base_config.get("processing", {}),
+        "cache": {"enabled": False},
+        "checkpoints": {"enabled": False},
+        "metrics": {"enabled": True, "dir": str(work_dir / "run_metrics")},
+        "intermediate_outputs": {"dir": str(work_dir / "processed")},
+        "output": {
+            "csv_path": str(work_dir / "processed" / "merge_result.csv"),
+            "intermediate_adapter_data_path": str(work_dir / "intermediate_adapter_outputs"),
+            "validation_reports_path": str(work_dir / "validation_reports"),
+        },
+    }
+    config_path = work_dir / "config.yaml"
+    config_path.write_text(yaml.safe_dump(config, sort_keys=False), encoding="utf-8")
+    return config_path
+
+
+def run_pipeline(work_dir: Path, config_path: Path, timeout: float | None) -> dict:
+    """Startet main_pipeline.py und liefert den Metrik-Report (oder einen Fehlerdatensatz)."""
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(
+            [sys.executable, str(PIPELINE_DIR / "main_pipeline.py"),
+             "--config", str(config_path), "--no-cache"],
+            cwd=work_dir, capture_output=True, text=True, timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return {"status": "timeout", "total_wall_s": round(time.perf_counter() - start, 2)}
+    wall = round(time.perf_counter() - start, 2)
+
+    reports = sorted((work_dir / "run_metrics").glob("run_*.json"))
+    if not reports:
+        return {"status": "failed", "returncode": proc.returncode,
+                "stderr_tail": proc.stderr[-2000:], "process_wall_s": wall}
+    report = json.loads(reports[-1].read_text(encoding="utf-8"))
+    report["process_wall_s"] = wall
+    return report
+
+
+def scaling_exponents(results: dict[int, dict]) -> dict[str, dict[str, float]]:
+    """k je Stufe aus t ∝ n^k zwischen benachbarten Größen."""
+    exponents: dict[str, dict[str, float]] = {}
+    sizes = sorted(n for n, rep in results.items() if rep.get("status") == "ok")
+    for small, large in zip(sizes, sizes[1:]):
+        pair = f"{_label(small)}→{_label(large)}"
+        stages_small = results[small].get("stages", {})
+        for stage, rec in results[large].get("stages", {}).items():
+            t_small = stages_small.get(stage, {}).get("wall_s")
+            t_large = rec.get("wall_s")
+            if not t_small or not t_large or t_small <= 0:
+                continue
+            k = math.log(t_large / t_small) / math.log(large / small)
+            exponents.setdefault(stage, {})[pair] = round(k, 2)
+    return exponents
+
+
+def print_report(results: dict[int, dict], exponents: dict[str, dict[str, float]]) -> None:
+    sizes = sorted(results)
+    stages: list[str] = []
+    for n in sizes:
+        stages += [s for s in results[n].get("stages", {}) if s not in stages]
+
+    header = f"{'Stufe':<14}" + "".join(f"{_label(n):>22}" for n in sizes) + "   Exponent k"
+    print("\n" + header)
+    print("-" * len(header))
+    for stage in stages + ["total"]:
+        cells = []
+        for n in sizes:
+            rep = results[n]
+            rec = {"wall_s": rep.get("total_wall_s")} if stage == "total" else rep.get("stages", {}).get(stage)
+            if not rec or rec.get("wall_s") is None:
+                cells.append(f"{rep.get('status', '–') if stage == 'total' else '–':>22}")
+                continue
+            rss = rec.get("peak_rss_mb")
+            rss_text = f" {rss:>7.0f} MB" if rss is not None else ""
+            cells.append(f"{rec['wall_s']:>10.2f} s{rss_text:>11}")
+        k_text = ", ".join(f"{pair}: {k}" for pair, k in exponents.get(stage, {}).items())
+        print(f"{stage:<14}" + "".join(cells) + f"   {k_text}")
+
+    for n in sizes:
+        adapters = results[n].get("adapters", {})
+        if adapters:
+            rows = ", ".join(f"{name}: {rec.get('input_rows', '?')}→{rec.get('output_rows', '?')}"
+                             for name, rec in adapters.items())
+            print(f"[{_label(n)}] Adapterzeilen (Ein→Aus): {rows}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="End-to-End-Skalierungsbenchmark der Pipeline")
+    parser.add_argument("--sizes", default="100k,1M,10M",
+                        help="Filme im synthetischen Universum, z. B. 100k,1M,10M")
+    parser.add_argument("--data-dir", type=Path, default=None,
+                        help="Verzeichnis für (wiederverwendbare) Rohdaten; Default: temporär")
+    parser.add_argument("--work-dir", type=Path, default=None,
+                        help="Arbeitsverzeichnis der Läufe; Default: temporär (wird gelöscht)")
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--overlap", type=float, default=0.6)
+    parser.add_argument("--movielens-raw", action="store_true",
+                        help="MovieLens im Rohmodus (movies.csv + ratings.csv) betreiben")
+    parser.add_argument("--max-seconds", type=float, default=None,
+                        help="Größere Größen überspringen, sobald ein Lauf länger dauert")
+    parser.add_argument("--timeout", type=float, default=None, help="Abbruch eines Laufs nach n Sekunden")
+    parser.add_argument("--output", type=Path, default=None, help="Ergebnisse als JSON speichern")
+    args = parser.parse_args(argv)
+
+    sizes = sorted(parse_count(part) for part in args.sizes.split(",") if part.strip())
+    params = {"seed": args.seed, "overlap": args.overlap, "movielens_raw": args.movielens_raw}
+
+    tmp_root = Path(tempfile.mkdtemp(prefix="etl_scale_"))
+    data_dir = args.data_dir or tmp_root / "data"
+    work_root = args.work_dir or tmp_root / "work"
+    results: dict[int, dict] = {}
+    try:
+        for n in sizes:
+            paths = ensure_dataset(data_dir, n, params)
+            work_dir = work_root / _label(n)
+            shutil.rmtree(work_dir, ignore_errors=True)
+            work_dir.mkdir(parents=True)
+            config_path = write_config(work_dir, paths, args.movielens_raw)
+
+            print(f"[{_label(n)}] starte Pipeline …")
+            report = run_pipeline(work_dir, config_path, args.timeout)
+            results[n] = report
+            total = report.get("total_wall_s") or report.get("process_wall_s") or 0.0
+            print(f"[{_label(n)}] Status {report.get('status')} nach {total:.1f}s")
+            if report.get("status") == "failed" and report.get("stderr_tail"):
+                print(report["stderr_tail"])
+            if report.get("status") != "ok" or (args.max_seconds is not None and total > args.max_seconds):
+                skipped = [_label(s) for s in sizes if s > n]
+                if skipped:
+                    print(f"Überspringe {skipped}")
+                break
+    finally:
+        # Nur das selbst angelegte temporäre Verzeichnis entfernen
+        shutil.rmtree(tmp_root, ignore_errors=True)
+
+    exponents = scaling_exponents(results)
+    print_report(results, exponents)
+
+    if args.output:
+        payload = {
+            "meta": {
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                **params,
+            },
+            "results": {_label(n): rep for n, rep in results.items()},
+            "scaling_exponents": exponents,
+        }
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        print(f"Ergebnisse gespeichert: {args.output}")
+    return 0 if all(rep.get("status") == "ok" for rep in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,393 @@
+"""
+Micro-Benchmarks für die laufzeitkritischen Transform-Funktionen.
+
+Gemessen werden (je Eingabegröße, synthetische Daten mit festem Seed):
+  • normalize_film_title                   (Titel-Normalisierung, per .apply)
+  • normalize_titles                       (Batch-Variante, je verschiedenem Titel einmal)
+  • year_clusters                          (±1-Jahr-Cluster je norm_title, vektorisiert)
+  • fuzzy_title_clusters                   (unscharfer Titelabgleich, MinHash-LSH-Blocking)
+  • build_long_frame                       (Adapter-Frames → Long-Frame, v. a. Peak-Speicher)
+  • merge_sources                          (vollständiger Long→Wide-Merge)
+  • calculate_normalized_ratings_and_superscores
+  • treat_outliers                         (Methode 'cap')
+  • validate_dataframe
+  • parse_dates                            (Mehrformat-Datumsparser, Metacritic-Mix)
+  • coalesce_ratings                       (Rating-Kandidaten mit Sentinel/Umskalierung)
+  • intern_genres                          (Roh-Genres → kategoriale Genre-Kombinationen)
+
+Ausgabe je Benchmark/Größe: beste Laufzeit aus `--repeat` Läufen, Zeilen pro
+Sekunde (ops/sec) und Peak-Speicher (tracemalloc, separater Lauf).
+
+Beispiele (aus static_pipeline/):
+    python benchmarks/bench_transforms.py --sizes 1k,10k,100k
+    python benchmarks/bench_transforms.py --save-baseline benchmarks/baseline.json
+    python benchmarks/bench_transforms.py --compare benchmarks/baseline.json --threshold 0.2
+
+Mit `--compare` endet das Skript mit Exit-Code 1, wenn ein Benchmark mehr als
+`--threshold` (relativ) langsamer ist oder mehr Speicher braucht als die Baseline.
+"""
+
+import argparse
+import json
+import logging
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+# Imports wie in main_pipeline.py relativ zu static_pipeline/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from transform.dates import YEAR_ONLY, parse_dates  # noqa: E402
+from transform.fuzzy_match import fuzzy_title_clusters  # noqa: E402
+from transform.genres import as_genre_codes, intern_genres  # noqa: E402
+from transform.merge import build_long_frame, merge_sources, year_clusters  # noqa: E402
+from transform.normalize import normalize_film_title, normalize_titles  # noqa: E402
+from transform.normalize_ratings import calculate_normalized_ratings_and_superscores  # noqa: E402
+from transform.outlier_treatment import treat_outliers  # noqa: E402
+from transform.rating_coalesce import coalesce_ratings, rating_candidate  # noqa: E402
+from utils.basic_validator import validate_dataframe  # noqa: E402
+
+SEED = 42
+_WORDS = np.array([
+    "the", "dark", "knight", "return", "of", "star", "wars", "love", "story",
+    "city", "night", "man", "woman", "war", "last", "first", "blue", "red",
+    "house", "river", "day", "life", "dead", "time", "king", "ghost", "dream",
+    "amélie", "café", "señor", "die", "hard", "part", "ii", "iii", "lost",
+])
+_MONTHS_ABBR = np.array(["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"])
+_GENRES = np.array(["Action", "Comedy", "Drama", "Horror", "Romance", "Thriller", "Sci-Fi", "War"])
+
+
+# ------------------------------------------------------------ #
+# Synthetische Eingaben                                         #
+# ------------------------------------------------------------ #
+def _titles(n: int, rng: np.random.Generator, distinct_ratio: float = 0.5) -> np.ndarray:
+    """n Rohtitel mit ca. n*distinct_ratio verschiedenen Werten inkl. Jahr-/Klammerzusätzen."""
+    n_distinct = max(1, int(n * distinct_ratio))
+    lengths = rng.integers(1, 5, n_distinct)
+    words = rng.choice(_WORDS, size=(n_distinct, 4))
+    years = rng.integers(1920, 2025, n_distinct)
+    base = [
+        " ".join(w[:k]).title() + (f" ({y})" if y % 3 == 0 else "") + (": Director's Cut" if y % 7 == 0 else "")
+        for w, k, y in zip(words, lengths, years)
+    ]
+    return np.array(base, dtype=object)[rng.integers(0, n_distinct, n)]
+
+
+def _source_frame(n: int, rng: np.random.Generator, id_col: str, rating_col: str,
+                  genre_col: str, scale: float) -> pd.DataFrame:
+    titles = pd.Series(_titles(n, rng, distinct_ratio=0.8)).map(normalize_film_title)
+    years = rng.integers(1950, 2025, n)
+    return pd.DataFrame({
+        id_col: np.arange(1, n + 1),
+        "title": titles,
+        "year": pd.array(years, dtype="Int64"),
+        genre_col: as_genre_codes(pd.Series(
+            [list(rng.choice(_GENRES, size=rng.integers(0, 3), replace=False)) for _ in range(n)])),
+        rating_col: pd.array(np.round(rng.random(n) * scale, 1), dtype="Float64"),
+    })
+
+
+def _wide_frame(n: int, rng: np.random.Generator) -> pd.DataFrame:
+    def _col(scale: float) -> pd.Series:
+        values = np.round(rng.random(n) * scale, 2)
+        values[rng.random(n) < 0.3] = np.nan
+        return pd.Series(values, dtype="Float64")
+
+    return pd.DataFrame({
+        "title": pd.Series(_titles(n, rng, distinct_ratio=0.9)).map(normalize_film_title),
+        "release_year": pd.array(rng.integers(1890, 2025, n), dtype="Int64"),
+        "rating_imdb": _col(10),
+        "rating_movielens": _col(5),
+        "rating_metacritic": _col(100),
+        "rating_rt_audience": _col(100),
+    })
+
+
+# ------------------------------------------------------------ #
+# Benchmarks: name → (setup(n, rng) → args, fn(*args))          #
+# ------------------------------------------------------------ #
+def _setup_normalize(n, rng):
+    return (pd.Series(_titles(n, rng)),)
+
+
+def _run_normalize(titles):
+    return titles.apply(normalize_film_title)
+
+
+def _run_normalize_batch(titles):
+    return normalize_titles(titles)
+
+
+def _setup_year_cluster(n, rng):
+    n_titles = max(1, n // 3)
+    df = pd.DataFrame({
+        "norm_title": rng.integers(0, n_titles, n).astype(str),
+        "release_year": pd.array(rng.integers(1990, 2000, n), dtype="Int64"),
+    })
+    df.loc[rng.random(n) < 0.02, "release_year"] = pd.NA
+    return (df,)
+
+
+def _run_year_cluster(df):
+    return year_clusters(df["norm_title"], df["release_year"])
+
+
+def _setup_fuzzy(n, rng):
+    titles = pd.Series(_titles(n, rng, distinct_ratio=0.8)).map(normalize_film_title)
+    # ~10 % Schreibvarianten ohne Leerzeichen ("spider man" → "spiderman")
+    variant = rng.random(n) < 0.1
+    titles[variant] = titles[variant].str.replace(" ", "", n=1)
+    years = pd.Series(pd.array(rng.integers(1950, 2025, n), dtype="Int32"))
+    return titles, years
+
+
+def _run_fuzzy(titles, years):
+    return fuzzy_title_clusters(titles, years)
+
+
+def _setup_merge(n, rng):
+    per_source = max(1, n // 4)
+    return ([
+        _source_frame(per_source, rng, "ID_IMDB", "rating_imdb", "genres", 10),
+        _source_frame(per_source, rng, "ID_METACRITIC", "rating_metacritic", "genres", 100),
+        _source_frame(per_source, rng, "ID_MOVIELENS", "rating_movielens", "genres_ml", 5),
+        _source_frame(per_source, rng, "ID_RT", "rating_rt_audience", "genres_rt", 100),
+    ],)
+
+
+def _run_merge(dfs):
+    return merge_sources(dfs)
+
+
+def _run_long_frame(dfs):
+    return build_long_frame(dfs)
+
+
+def _setup_superscores(n, rng):
+    return (_wide_frame(n, rng),)
+
+
+def _run_superscores(df):
+    return calculate_normalized_ratings_and_superscores(df, outlier_treatment_method="cap")
+
+
+def _setup_outliers(n, rng):
+    values = rng.normal(6.5, 1.2, n)
+    values[rng.random(n) < 0.01] = 25.0
+    return (pd.Series(values),)
+
+
+def _run_outliers(series):
+    return treat_outliers(series, method="cap")
+
+
+def _setup_parse_dates(n, rng):
+    # Metacritic-Mix: überwiegend dd-MMM-yy, dazu "Month YYYY", "YYYY" und Müll
+    days, months = rng.integers(1, 29, n), rng.choice(_MONTHS_ABBR, n)
+    years = rng.integers(1920, 2025, n)
+    values = np.array([f"{d}-{m}-{y % 100:02d}" for d, m, y in zip(days, months, years)], dtype=object)
+    kind = rng.random(n)
+    values[kind < 0.05] = [f"January {y}" for y in years[kind < 0.05]]
+    values[(kind >= 0.05) & (kind < 0.08)] = years[(kind >= 0.05) & (kind < 0.08)].astype(str)
+    values[kind > 0.99] = "tbd"
+    return (pd.Series(values),)
+
+
+def _run_parse_dates(values):
+    return parse_dates(values, ["%d-%b-%y", "%B %Y", YEAR_ONLY], rollover_after=2025)
+
+
+def _setup_coalesce(n, rng):
+    # Metacritic-Layout: metascore teils leer, userscore 0–10 mit "tbd"
+    metascore = rng.integers(1, 100, n).astype(float)
+    metascore[rng.random(n) < 0.3] = np.nan
+    userscore = np.round(rng.random(n) * 10, 1).astype(str).astype(object)
+    userscore[rng.random(n) < 0.25] = "tbd"
+    df = pd.DataFrame({"metascore": metascore, "userscore": userscore})
+    candidates = [
+        rating_candidate("metascore", sentinels=("tbd",)),
+        rating_candidate("userscore", sentinels=("tbd",), rescale_max=10, rescale_factor=10),
+    ]
+    return df, candidates
+
+
+def _run_coalesce(df, candidates):
+    return coalesce_ratings(df, candidates)
+
+
+def _setup_intern_genres(n, rng):
+    # RT-Layout: "Comedy, Drama" mit 0–3 Genres je Zeile
+    values = [", ".join(rng.choice(_GENRES, size=rng.integers(0, 4), replace=False)) for _ in range(n)]
+    return (pd.Series(values, dtype=object),)
+
+
+def _run_intern_genres(values):
+    return intern_genres(values, sep=",")
+
+
+def _setup_validate(n, rng):
+    return (_wide_frame(n, rng),)
+
+
+def _run_validate(df):
+    return validate_dataframe(df, df_name="bench", log_level=logging.DEBUG)
+
+
+BENCHMARKS: dict[str, tuple[Callable, Callable]] = {
+    "normalize_film_title": (_setup_normalize, _run_normalize),
+    "normalize_titles": (_setup_normalize, _run_normalize_batch),
+    "year_cluster": (_setup_year_cluster, _run_year_cluster),
+    "fuzzy_title_clusters": (_setup_fuzzy, _run_fuzzy),
+    "build_long_frame": (_setup_merge, _run_long_frame),
+    "merge_sources": (_setup_merge, _run_merge),
+    "calculate_normalized_ratings_and_superscores": (_setup_superscores, _run_superscores),
+    "treat_outliers": (_setup_outliers, _run_outliers),
+    "validate_dataframe": (_setup_validate, _run_validate),
+    "parse_dates": (_setup_parse_dates, _run_parse_dates),
+    "coalesce_ratings": (_setup_coalesce, _run_coalesce),
+    "intern_genres": (_setup_intern_genres, _run_intern_genres),
+}
+
+
+# ------------------------------------------------------------ #
+# Messung                                                      #
+# ------------------------------------------------------------ #
+def parse_sizes(value: str) -> list[int]:
+    """'1k,10k,1M' → [1000, 10000, 1000000]."""
+    factors = {"k": 1_000, "m": 1_000_000}
+    sizes = []
+    for part in value.split(","):
+        part = part.strip().lower()
+        if not part:
+            continue
+        factor = factors.get(part[-1], 1)
+        sizes.append(int(float(part[:-1] if factor > 1 else part) * factor))
+    return sizes
+
+
+def measure_benchmark(name: str, n: int, repeat: int, with_memory: bool = True) -> dict:
+    """Beste Laufzeit aus `repeat` Läufen + Peak-Speicher eines separaten Laufs."""
+    setup, fn = BENCHMARKS[name]
+    args = setup(n, np.random.default_rng(SEED))
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    result = {
+        "rows": n,
+        "seconds": round(best, 6),
+        "ops_per_sec": round(n / best, 2) if best > 0 else None,
+    }
+    if with_memory:
+        tracemalloc.start()
+        fn(*args)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result["peak_mem_mb"] = round(peak / (1024 * 1024), 3)
+    return result
+
+
+def run_benchmarks(names: list[str], sizes: list[int], repeat: int,
+                   max_seconds: float | None, with_memory: bool = True) -> dict:
+    """Führt alle Benchmarks aus; größere Größen werden übersprungen, sobald eine
+    Größe länger als `max_seconds` gedauert hat."""
+    results: dict[str, dict[str, dict]] = {}
+    for name in names:
+        results[name] = {}
+        for n in sorted(sizes):
+            res = measure_benchmark(name, n, repeat, with_memory)
+            results[name][str(n)] = res
+            mem = f"{res['peak_mem_mb']:>10.2f} MB" if "peak_mem_mb" in res else ""
+            print(f"{name:<46} {n:>10,} rows  {res['seconds']:>10.4f} s  "
+                  f"{res['ops_per_sec']:>14,.0f} rows/s {mem}")
+            if max_seconds is not None and res["seconds"] > max_seconds:
+                skipped = [s for s in sizes if s > n]
+                if skipped:
+                    print(f"{name:<46} überspringe {skipped} (> {max_seconds}s)")
+                break
+    return results
+
+
+def compare_to_baseline(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Liefert Meldungen für alle Messungen, die schlechter als Baseline*(1+threshold) sind."""
+    regressions = []
+    base_results = baseline.get("results", {})
+    for name, by_size in results.items():
+        for size, res in by_size.items():
+            base = base_results.get(name, {}).get(size)
+            if not base:
+                continue
+            if base.get("seconds") and res["seconds"] > base["seconds"] * (1 + threshold):
+                regressions.append(
+                    f"{name} @ {size}: Laufzeit {res['seconds']:.4f}s vs. Baseline {base['seconds']:.4f}s "
+                    f"(+{res['seconds'] / base['seconds'] - 1:.0%})")
+            if base.get("peak_mem_mb") and res.get("peak_mem_mb") \
+                    and res["peak_mem_mb"] > base["peak_mem_mb"] * (1 + threshold):
+                regressions.append(
+                    f"{name} @ {size}: Peak-Speicher {res['peak_mem_mb']:.2f} MB vs. Baseline "
+                    f"{base['peak_mem_mb']:.2f} MB (+{res['peak_mem_mb'] / base['peak_mem_mb'] - 1:.0%})")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Micro-Benchmarks der Transform-Funktionen")
+    parser.add_argument("--sizes", default="1k,10k,100k",
+                        help="Eingabegrößen, z. B. 1k,10k,100k,1M,10M (Default: 1k,10k,100k)")
+    parser.add_argument("--only", nargs="*", choices=sorted(BENCHMARKS), default=None,
+                        help="Nur diese Benchmarks ausführen")
+    parser.add_argument("--repeat", type=int, default=3, help="Wiederholungen je Messung (bester Wert zählt)")
+    parser.add_argument("--max-seconds", type=float, default=60.0,
+                        help="Größere Größen überspringen, sobald eine Messung länger dauert")
+    parser.add_argument("--no-memory", action="store_true", help="Keine tracemalloc-Messung")
+    parser.add_argument("--output", type=Path, default=None, help="Ergebnisse als JSON speichern")
+    parser.add_argument("--save-baseline", type=Path, default=None, help="Ergebnisse als Baseline speichern")
+    parser.add_argument("--compare", type=Path, default=None, help="Mit Baseline-JSON vergleichen")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Erlaubte relative Verschlechterung ggü. Baseline (Default 0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.ERROR)
+    names = args.only or list(BENCHMARKS)
+    results = run_benchmarks(names, parse_sizes(args.sizes), args.repeat,
+                             args.max_seconds, with_memory=not args.no_memory)
+    payload = {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    for target in (args.output, args.save_baseline):
+        if target:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            print(f"Ergebnisse gespeichert: {target}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        if regressions:
+            print(f"\nRegressionen (> {args.threshold:.0%}) ggü. {args.compare}:")
+            for msg in regressions:
+                print(f"  ✗ {msg}")
+            return 1
+        print(f"\nKeine Regressionen (> {args.threshold:.0%}) ggü. {args.compare}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
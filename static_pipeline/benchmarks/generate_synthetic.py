@@ -0,0 +1,473 @@
+"""
+Synthetischer Rohdaten-Generator für Skalierungstests.
+
+Erzeugt für ein gemeinsames „Film-Universum“ mit `n_movies` Filmen die
+Rohdateien aller Quellen im Spaltenlayout der echten Dateien unter data/raw/:
+
+  • imdb_data.csv               – tt-IDs, "December 11, 2001" (teils nur Jahr),
+                                   Komma-Genres, averageRating/numVotes
+  • metacritic_movies.csv       – dd-MMM-yy-Datumswerte ("1-Jul-59"),
+                                   userscore teils "tbd"
+  • movielens_aggregated.csv    – "Title (YYYY)"-Titel, Artikel nachgestellt
+                                   ("American President, The (1995)"),
+                                   Pipe-Genres inkl. "(no genres listed)"
+  • rotten_tomatoes_movies.csv  – original_release_date teils leer/unparsebar
+                                   → Fallback streaming_release_date,
+                                   tomatometer/audience teils leer
+  • optional movies.csv + ratings.csv (MovieLens-Rohmodus)
+
+Quellenübergreifende Überlappung
+- Jeder Film hat eine „Heimatquelle“ und erscheint zusätzlich mit
+  Wahrscheinlichkeit `overlap` in jeder weiteren Quelle
+  (0 = disjunkt, 1 = jeder Film in allen Quellen).
+- Gemeinsame Filme tragen in allen Quellen denselben Titel (mit
+  quellentypischen Schreibweisen) und mit kleiner Wahrscheinlichkeit ein um
+  ±1 verschobenes Jahr, wie es bei Kinostart vs. Festival-Premiere vorkommt.
+
+Zusätzlich werden `duplicate_rate` exakte Duplikate und `invalid_rate`
+ungültige Zeilen (leerer Titel bzw. Jahr außerhalb 1870–2025) eingestreut.
+Die Dateien werden blockweise geschrieben, damit auch 10M Filme mit
+begrenztem Speicher erzeugt werden können. Gleicher Seed → identische Dateien.
+
+Beispiele (aus static_pipeline/):
+    python benchmarks/generate_synthetic.py --movies 100k --output-dir /tmp/etl_synth
+    python benchmarks/generate_synthetic.py --movies 1M --overlap 0.4 --movielens-raw
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+SEED = 42
+SOURCES: tuple[str, ...] = ("ImdbAdapter", "MetacriticAdapter", "MovielensAdapter", "RottenTomatoesAdapter")
+FILE_NAMES: dict[str, str] = {
+    "ImdbAdapter": "imdb_data.csv",
+    "MetacriticAdapter": "metacritic_movies.csv",
+    "MovielensAdapter": "movielens_aggregated.csv",
+    "RottenTomatoesAdapter": "rotten_tomatoes_movies.csv",
+}
+
+_MONTHS = np.array(["January", "February", "March", "April", "May", "June", "July",
+                    "August", "September", "October", "November", "December"], dtype=object)
+_MONTHS_ABBR = np.array([m[:3] for m in _MONTHS], dtype=object)
+_SYLLABLES = np.array([
+    "ka", "lo", "mi", "ra", "ven", "tor", "el", "an", "dor", "si", "mar", "lu", "ber",
+    "ne", "sha", "quin", "zo", "fa", "gri", "ol", "té", "cé", "ño", "us", "ix", "den",
+])
+_EXTRA_WORDS = np.array([
+    "night", "city", "love", "war", "king", "ghost", "river", "dream", "dark", "story",
+    "return", "last", "blue", "house", "life", "day", "man", "woman", "star", "lost",
+], dtype=object)
+
+# Kanonisches Genre → Schreibweise je Quelle (IMDb, Metacritic, MovieLens, RT)
+_GENRE_TABLE: list[tuple[str, str, str, str]] = [
+    ("Action", "Action", "Action", "Action & Adventure"),
+    ("Adventure", "Adventure", "Adventure", "Action & Adventure"),
+    ("Animation", "Animation", "Animation", "Animation"),
+    ("Comedy", "Comedy", "Comedy", "Comedy"),
+    ("Crime", "Crime", "Crime", "Mystery & Suspense"),
+    ("Documentary", "Documentary", "Documentary", "Documentary"),
+    ("Drama", "Drama", "Drama", "Drama"),
+    ("Family", "Family", "Children", "Kids & Family"),
+    ("Fantasy", "Fantasy", "Fantasy", "Science Fiction & Fantasy"),
+    ("Horror", "Horror", "Horror", "Horror"),
+    ("Musical", "Music", "Musical", "Musical & Performing Arts"),
+    ("Mystery", "Mystery", "Mystery", "Mystery & Suspense"),
+    ("Romance", "Romance", "Romance", "Romance"),
+    ("Sci-Fi", "Sci-Fi", "Sci-Fi", "Science Fiction & Fantasy"),
+    ("Thriller", "Thriller", "Thriller", "Mystery & Suspense"),
+    ("War", "War", "War", "Drama"),
+    ("Western", "Western", "Western", "Western"),
+]
+_GENRE_NAMES = [np.array(col, dtype=object) for col in zip(*_GENRE_TABLE)]
+
+
+# ------------------------------------------------------------ #
+# Hilfsfunktionen                                              #
+# ------------------------------------------------------------ #
+def parse_count(value: str | int) -> int:
+    """'100k' → 100000, '1M' → 1000000, '2500' → 2500."""
+    if isinstance(value, int):
+        return value
+    text = value.strip().lower()
+    factors = {"k": 1_000, "m": 1_000_000}
+    factor = factors.get(text[-1:], 1)
+    return int(float(text[:-1] if factor > 1 else text) * factor)
+
+
+def _vocabulary(rng: np.random.Generator, size: int = 6000) -> np.ndarray:
+    """Pseudowörter aus 2–3 Silben plus einige echte Wörter (mit Akzenten)."""
+    picks = rng.integers(0, len(_SYLLABLES), size=(size, 3))
+    three = rng.random(size) < 0.5
+    words = (_SYLLABLES[picks[:, 0]].astype(object) + _SYLLABLES[picks[:, 1]]
+             + np.where(three, _SYLLABLES[picks[:, 2]], "").astype(object))
+    return np.unique(np.concatenate([words, _EXTRA_WORDS]))
+
+
+def _join_genres(genre_idx: np.ndarray, n_genres: np.ndarray, names: np.ndarray,
+                 sep: str, empty: str = "") -> np.ndarray:
+    """Verbindet die ersten n_genres Genre-Indizes je Zeile zu einem String."""
+    out = np.full(len(genre_idx), "", dtype=object)
+    for k in range(genre_idx.shape[1]):
+        part = names[genre_idx[:, k]]
+        use = n_genres > k
+        out = np.where(use & (k > 0), out + sep + part, np.where(use, out + part, out))
+    if empty:
+        out = np.where(n_genres == 0, empty, out)
+    return out
+
+
+def _fmt_num(values: np.ndarray, decimals: int, missing: np.ndarray | None = None) -> np.ndarray:
+    """Zahlen als Strings; fehlende Werte als leerer String (wie in den CSVs)."""
+    text = np.char.mod(f"%.{decimals}f", values).astype(object)
+    if missing is not None:
+        text[missing] = ""
+    return text
+
+
+def _inject_quirks(df: pd.DataFrame, rng: np.random.Generator, title_col: str,
+                   year_setter, duplicate_rate: float, invalid_rate: float) -> pd.DataFrame:
+    """Streut ungültige Zeilen und exakte Duplikate ein."""
+    n = len(df)
+    if n == 0:
+        return df
+    invalid = rng.random(n) < invalid_rate
+    if invalid.any():
+        empty_title = invalid & (rng.random(n) < 0.5)
+        df.loc[empty_title, title_col] = ""
+        year_setter(df, invalid & ~empty_title)
+    n_dup = int(rng.binomial(n, duplicate_rate)) if duplicate_rate > 0 else 0
+    if n_dup:
+        dups = df.iloc[rng.integers(0, n, n_dup)]
+        df = pd.concat([df, dups], ignore_index=True)
+        df = df.iloc[rng.permutation(len(df))].reset_index(drop=True)
+    return df
+
+
+# ------------------------------------------------------------ #
+# Universum                                                    #
+# ------------------------------------------------------------ #
+def _universe_block(start: int, size: int, rng: np.random.Generator,
+                    vocab: np.ndarray, overlap: float) -> pd.DataFrame:
+    """Ein Block des Film-Universums (gemeinsame Wahrheit für alle Quellen)."""
+    n_words = rng.choice([1, 2, 3, 4], size=size, p=[0.25, 0.35, 0.25, 0.15])
+    word_idx = rng.integers(0, len(vocab), size=(size, 4))
+    title = np.full(size, "", dtype=object)
+    for k in range(4):
+        word = np.char.capitalize(vocab[word_idx[:, k]].astype(str)).astype(object)
+        title = np.where(n_words > k, np.where(k > 0, title + " " + word, word), title)
+    has_article = rng.random(size) < 0.2
+    title = np.where(has_article, "The " + title, title)
+    sequel = rng.random(size) < 0.04
+    title = np.where(sequel, title + ": Part " + rng.choice(["II", "III", "IV"], size).astype(object), title)
+
+    year = rng.integers(1915, 2025, size)
+    home = rng.integers(0, len(SOURCES), size)
+    present = rng.random((size, len(SOURCES))) < overlap
+    present[np.arange(size), home] = True
+    # Gewichtet Richtung Drama/Comedy, wie in den echten Daten
+    weights = np.array([8, 5, 2, 12, 5, 3, 18, 3, 3, 5, 2, 3, 7, 3, 6, 2, 1], dtype=float)
+    genre_idx = rng.choice(len(_GENRE_TABLE), size=(size, 3), p=weights / weights.sum())
+    # Keine doppelten Genres innerhalb eines Films
+    for k in (1, 2):
+        for _ in range(k):
+            clash = (genre_idx[:, k:k + 1] == genre_idx[:, :k]).any(axis=1)
+            genre_idx[clash, k] = (genre_idx[clash, k] + 1) % len(_GENRE_TABLE)
+    return pd.DataFrame({
+        "movie_id": np.arange(start, start + size),
+        "title": title,
+        "has_article": has_article,
+        "year": year,
+        "month": rng.integers(1, 13, size),
+        "day": rng.integers(1, 29, size),
+        "quality": rng.beta(5, 3, size),
+        "n_genres": rng.choice([0, 1, 2, 3], size=size, p=[0.03, 0.32, 0.4, 0.25]),
+        "genre_0": genre_idx[:, 0],
+        "genre_1": genre_idx[:, 1],
+        "genre_2": genre_idx[:, 2],
+        **{f"in_{name}": present[:, i] for i, name in enumerate(SOURCES)},
+    })
+
+
+def _source_rows(universe: pd.DataFrame, source: str, rng: np.random.Generator) -> pd.DataFrame:
+    """Teilmenge des Universums für eine Quelle, Jahr mit kleiner ±1-Abweichung."""
+    rows = universe[universe[f"in_{source}"]].reset_index(drop=True)
+    shift = rng.choice([-1, 0, 1], size=len(rows), p=[0.02, 0.96, 0.02])
+    rows["year"] = rows["year"] + shift
+    return rows
+
+
+def _genre_matrix(rows: pd.DataFrame) -> np.ndarray:
+    return rows[["genre_0", "genre_1", "genre_2"]].to_numpy()
+
+
+# ------------------------------------------------------------ #
+# Quellen im Originallayout                                    #
+# ------------------------------------------------------------ #
+def _imdb_block(rows: pd.DataFrame, rng: np.random.Generator) -> pd.DataFrame:
+    n = len(rows)
+    year = rows["year"].to_numpy()
+    full = _MONTHS[rows["month"].to_numpy() - 1] + " " + rows["day"].astype(str).to_numpy().astype(object) \
+        + ", " + year.astype(str).astype(object)
+    fmt = rng.random(n)
+    release = np.where(fmt < 0.05, year.astype(str).astype(object),
+                       np.where(fmt < 0.08, _MONTHS[rows["month"].to_numpy() - 1] + " "
+                                + year.astype(str).astype(object), full))
+    release = np.where(fmt > 0.99, "", release)
+    votes = rng.lognormal(8, 2, n).astype(np.int64) + 5
+    budget = np.round(rng.lognormal(16, 1.2, n), -3)
+    gross = np.round(budget * rng.lognormal(0.2, 1.0, n), 1)
+    missing_money = rng.random(n) < 0.3
+    rating = np.clip(np.round(rows["quality"].to_numpy() * 9 + 1 + rng.normal(0, 0.3, n), 1), 1, 10)
+    return pd.DataFrame({
+        "id": "tt" + pd.Series(rows["movie_id"].to_numpy() + 1).astype(str).str.zfill(7),
+        "primaryTitle": rows["title"].to_numpy(),
+        "originalTitle": rows["title"].to_numpy(),
+        "isAdult": 0,
+        "runtimeMinutes": rng.integers(70, 180, n),
+        "genres": _join_genres(_genre_matrix(rows), rows["n_genres"].to_numpy(), _GENRE_NAMES[0], ","),
+        "averageRating": _fmt_num(rating, 1),
+        "numVotes": votes,
+        "budget": _fmt_num(budget, 0, missing_money),
+        "gross": _fmt_num(gross, 1, missing_money),
+        "release_date": release,
+        "directors": rng.choice(_EXTRA_WORDS, n) + " " + rng.choice(_EXTRA_WORDS, n),
+    })
+
+
+def _set_year_imdb(df: pd.DataFrame, mask: np.ndarray) -> None:
+    df.loc[mask, "release_date"] = "January 1, 1850"
+
+
+def _metacritic_block(rows: pd.DataFrame, rng: np.random.Generator) -> pd.DataFrame:
+    n = len(rows)
+    year = rows["year"].to_numpy()
+    two_digit = np.char.zfill((year % 100).astype(str), 2).astype(object)
+    # dd-MMM-yy ohne führende Null beim Tag ("1-Jul-59")
+    release = rows["day"].astype(str).to_numpy().astype(object) + "-" \
+        + _MONTHS_ABBR[rows["month"].to_numpy() - 1] + "-" + two_digit
+    quality = rows["quality"].to_numpy()
+    metascore = np.clip(np.round(quality * 100 + rng.normal(0, 8, n)), 1, 100).astype(int)
+    userscore = np.clip(np.round(quality * 10 + rng.normal(0, 0.8, n), 1), 0, 10)
+    userscore_text = _fmt_num(userscore, 1)
+    userscore_text[rng.random(n) < 0.25] = "tbd"
+    critics = rng.integers(3, 50, n)
+    users = rng.integers(0, 500, n)
+    meta_pos = np.round(critics * quality).astype(int)
+    user_pos = np.round(users * quality).astype(int)
+    return pd.DataFrame({
+        "movie_title": rows["title"].to_numpy(),
+        "release_date": release,
+        "genre": _join_genres(_genre_matrix(rows), rows["n_genres"].to_numpy(), _GENRE_NAMES[1], ","),
+        "meta_mixed": (critics - meta_pos) // 2,
+        "meta_negative": critics - meta_pos - (critics - meta_pos) // 2,
+        "meta_positive": meta_pos,
+        "metascore": metascore,
+        "user_mixed": (users - user_pos) // 2,
+        "user_negative": users - user_pos - (users - user_pos) // 2,
+        "user_positive": user_pos,
+        "userscore": userscore_text,
+    })
+
+
+def _set_year_metacritic(df: pd.DataFrame, mask: np.ndarray) -> None:
+    df.loc[mask, "release_date"] = "not available"
+
+
+def _movielens_title(rows: pd.DataFrame, rng: np.random.Generator) -> np.ndarray:
+    """MovieLens-Schreibweise: Artikel nachgestellt und Jahr in Klammern."""
+    title = rows["title"].to_numpy()
+    has_article = rows["has_article"].to_numpy()
+    stripped = pd.Series(title).str.slice(4).to_numpy()
+    # Artikel wird nur ans Ende gestellt, wenn kein Untertitel folgt
+    suffix = has_article & ~pd.Series(title).str.contains(":", regex=False).to_numpy()
+    base = np.where(suffix, stripped + ", The", title)
+    with_year = base + " (" + rows["year"].astype(str).to_numpy().astype(object) + ")"
+    no_year = rng.random(len(rows)) < 0.005
+    return np.where(no_year, base, with_year)
+
+
+def _movielens_block(rows: pd.DataFrame, rng: np.random.Generator) -> pd.DataFrame:
+    n = len(rows)
+    count = rng.lognormal(2.5, 1.5, n).astype(np.int64) + 1
+    rating = np.clip(np.round(rows["quality"].to_numpy() * 4 + 1 + rng.normal(0, 0.25, n), 1), 0.5, 5)
+    return pd.DataFrame({
+        "movieId": rows["movie_id"].to_numpy() + 1,
+        "title": _movielens_title(rows, rng),
+        "genres": _join_genres(_genre_matrix(rows), rows["n_genres"].to_numpy(), _GENRE_NAMES[2], "|",
+                               empty="(no genres listed)"),
+        "average_rating": _fmt_num(rating, 1),
+        "rating_count": count,
+    })
+
+
+def _set_year_movielens(df: pd.DataFrame, mask: np.ndarray) -> None:
+    df.loc[mask, "title"] = df.loc[mask, "title"].str.replace(r"\(\d{4}\)$", "(1850)", regex=True)
+
+
+def _rt_block(rows: pd.DataFrame, rng: np.random.Generator) -> pd.DataFrame:
+    n = len(rows)
+    year = rows["year"].to_numpy()
+    iso = pd.Series(year.astype(str)).str.cat(
+        [pd.Series(rows["month"].to_numpy().astype(str)).str.zfill(2),
+         pd.Series(rows["day"].to_numpy().astype(str)).str.zfill(2)], sep="-").to_numpy().astype(object)
+    streaming = (year + rng.integers(0, 3, n)).astype(str).astype(object) + "-03-03"
+    kind = rng.random(n)
+    original = np.where(kind < 0.05, "", np.where(kind < 0.07, "unknown", iso))
+    quality = rows["quality"].to_numpy()
+    tomatometer = np.clip(np.round(quality * 100 + rng.normal(0, 10, n)), 0, 100)
+    audience = np.clip(np.round(quality * 100 + rng.normal(0, 12, n)), 0, 100)
+    # Titel teils in Title Case, teils unverändert
+    title = pd.Series(rows["title"].to_numpy())
+    title = title.where(rng.random(n) < 0.7, title.str.title()).to_numpy()
+    return pd.DataFrame({
+        "rotten_tomatoes_link": "m/" + pd.Series(rows["movie_id"].to_numpy()).astype(str),
+        "movie_title": title,
+        "movie_info": 'A film about "something", told in two parts.',
+        "genres": _join_genres(_genre_matrix(rows), rows["n_genres"].to_numpy(), _GENRE_NAMES[3], ", "),
+        "original_release_date": original,
+        "streaming_release_date": streaming,
+        "tomatometer_rating": _fmt_num(tomatometer, 1, rng.random(n) < 0.1),
+        "audience_rating": _fmt_num(audience, 0, rng.random(n) < 0.05),
+    })
+
+
+def _set_year_rt(df: pd.DataFrame, mask: np.ndarray) -> None:
+    df.loc[mask, ["original_release_date", "streaming_release_date"]] = "1850-01-01"
+
+
+_BUILDERS = {
+    "ImdbAdapter": (_imdb_block, "primaryTitle", _set_year_imdb),
+    "MetacriticAdapter": (_metacritic_block, "movie_title", _set_year_metacritic),
+    "MovielensAdapter": (_movielens_block, "title", _set_year_movielens),
+    "RottenTomatoesAdapter": (_rt_block, "movie_title", _set_year_rt),
+}
+
+
+def _ratings_block(rows: pd.DataFrame, rng: np.random.Generator, ratings_per_movie: float) -> pd.DataFrame:
+    """Einzelbewertungen (MovieLens-Rohmodus) passend zur Filmqualität."""
+    counts = rng.poisson(ratings_per_movie, len(rows))
+    movie_ids = np.repeat(rows["movie_id"].to_numpy() + 1, counts)
+    quality = np.repeat(rows["quality"].to_numpy(), counts)
+    stars = np.clip(np.round((quality * 4 + 1 + rng.normal(0, 0.8, len(movie_ids))) * 2) / 2, 0.5, 5)
+    return pd.DataFrame({
+        "userId": rng.integers(1, 1 + max(1000, len(rows) // 10), len(movie_ids)),
+        "movieId": movie_ids,
+        "rating": stars,
+        "timestamp": rng.integers(820_000_000, 1_700_000_000, len(movie_ids)),
+    })
+
+
+# ------------------------------------------------------------ #
+# Öffentliche API                                              #
+# ------------------------------------------------------------ #
+def dataset_paths(output_dir: str | Path, movielens_raw: bool = False) -> dict[str, Path]:
+    """Dateipfade eines erzeugten Datensatzes (Adaptername bzw. "movies"/"ratings" → Pfad)."""
+    output_dir = Path(output_dir)
+    paths = {name: output_dir / FILE_NAMES[name] for name in SOURCES}
+    if movielens_raw:
+        paths["movies"] = output_dir / "movies.csv"
+        paths["ratings"] = output_dir / "ratings.csv"
+    return paths
+
+
+def generate_sources(
+    n_movies: int,
+    output_dir: str | Path,
+    seed: int = SEED,
+    overlap: float = 0.6,
+    duplicate_rate: float = 0.01,
+    invalid_rate: float = 0.01,
+    block_size: int = 250_000,
+    movielens_raw: bool = False,
+    ratings_per_movie: float = 10.0,
+) -> dict[str, Path]:
+    """
+    Schreibt synthetische Rohdateien aller Quellen nach `output_dir`.
+
+    Args:
+        n_movies: Größe des Film-Universums (Zeilen je Quelle ≈ n_movies *
+                  (1 + 3*overlap) / 4).
+        output_dir: Zielverzeichnis (wird angelegt).
+        seed: Zufallsseed; gleicher Seed und gleiche Parameter → identische Dateien.
+        overlap: Wahrscheinlichkeit, mit der ein Film zusätzlich zu seiner
+                 Heimatquelle in jeder weiteren Quelle vorkommt.
+        duplicate_rate / invalid_rate: Anteil eingestreuter Duplikate bzw.
+                 ungültiger Zeilen je Quelle.
+        block_size: Filme je Schreibblock (begrenzt den Speicherbedarf).
+        movielens_raw: Zusätzlich movies.csv + ratings.csv schreiben.
+        ratings_per_movie: Mittlere Bewertungsanzahl je Film im Rohmodus.
+
+    Returns:
+        Dict Adaptername → Pfad der Hauptdatei (plus "movies"/"ratings" im Rohmodus).
+    """
+    if not 0.0 <= overlap <= 1.0:
+        raise ValueError(f"overlap muss zwischen 0 und 1 liegen: {overlap}")
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    paths = dataset_paths(output_dir, movielens_raw)
+    for path in paths.values():
+        path.unlink(missing_ok=True)
+
+    vocab = _vocabulary(np.random.default_rng(seed))
+    # Eigener Zufallsstrom je Block → Ergebnis unabhängig von der Blockgröße der Quellen
+    block_seeds = np.random.SeedSequence(seed).spawn((n_movies + block_size - 1) // block_size)
+    for block_no, start in enumerate(range(0, n_movies, block_size)):
+        rng = np.random.default_rng(block_seeds[block_no])
+        universe = _universe_block(start, min(block_size, n_movies - start), rng, vocab, overlap)
+        for name in SOURCES:
+            builder, title_col, year_setter = _BUILDERS[name]
+            rows = _source_rows(universe, name, rng)
+            df = _inject_quirks(builder(rows, rng), rng, title_col, year_setter,
+                                duplicate_rate, invalid_rate)
+            df.to_csv(paths[name], mode="a", header=block_no == 0, index=False)
+            if name == "MovielensAdapter" and movielens_raw:
+                df[["movieId", "title", "genres"]].drop_duplicates("movieId").to_csv(
+                    paths["movies"], mode="a", header=block_no == 0, index=False)
+                _ratings_block(rows, rng, ratings_per_movie).to_csv(
+                    paths["ratings"], mode="a", header=block_no == 0, index=False)
+    return paths
+
+
+def sources_config(paths: dict[str, Path], movielens_raw: bool = False) -> dict[str, dict]:
+    """`sources:`-Abschnitt einer Pipeline-Config für die erzeugten Dateien."""
+    config = {name: {"file_path": str(paths[name])} for name in SOURCES}
+    if movielens_raw and "movies" in paths:
+        config["MovielensAdapter"] = {"movies_path": str(paths["movies"]),
+                                      "ratings_path": str(paths["ratings"])}
+    return config
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Synthetische Rohdaten für alle Quellen erzeugen")
+    parser.add_argument("--movies", default="100k", help="Größe des Film-Universums, z. B. 100k, 1M, 10M")
+    parser.add_argument("--output-dir", type=Path, required=True, help="Zielverzeichnis")
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--overlap", type=float, default=0.6,
+                        help="Wahrscheinlichkeit für das Auftreten eines Films in jeder weiteren Quelle")
+    parser.add_argument("--duplicate-rate", type=float, default=0.01)
+    parser.add_argument("--invalid-rate", type=float, default=0.01)
+    parser.add_argument("--block-size", type=int, default=250_000)
+    parser.add_argument("--movielens-raw", action="store_true",
+                        help="Zusätzlich movies.csv + ratings.csv (MovieLens-Rohmodus) schreiben")
+    parser.add_argument("--ratings-per-movie", type=float, default=10.0)
+    args = parser.parse_args(argv)
+
+    paths = generate_sources(
+        parse_count(args.movies), args.output_dir, seed=args.seed, overlap=args.overlap,
+        duplicate_rate=args.duplicate_rate, invalid_rate=args.invalid_rate,
+        block_size=args.block_size, movielens_raw=args.movielens_raw,
+        ratings_per_movie=args.ratings_per_movie,
+    )
+    for name, path in paths.items():
+        size_mb = path.stat().st_size / (1024 * 1024)
+        print(f"{name:<24} {path}  ({size_mb:,.1f} MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,11 @@
 import pandas as pd
+from transform.genres import with_genre_lists
 
 class CsvLoader:
     def __init__(self, path: str):
         self.path = path
 
     def load(self, df: pd.DataFrame):
-        df.to_csv(self.path, index=False)
+        # Genres erst hier als Listen materialisieren
+        with_genre_lists(df).to_csv(self.path, index=False)
         print(f"✅ Merge + Genre‐Auswahl abgeschlossen. Datei unter: {self.path}")
\ No newline at end of file
@@ -18,18 +18,50 @@ als CSV ausgegeben, optional ergänzt um Zwischenstände und Validierungsreports
 Konfiguration (config.yaml)
 - logging: level, Formatierung; steuert die Protokollierung.
 - sources: Mapping von Adapternamen auf ihre spezifischen Pfad-/Parameterwerte.
+  Optional je Quelle `chunksize: <Zeilen>` → Adapter liest und bereinigt die
+  Datei blockweise (extract_chunks/transform_chunk) mit begrenztem Speicher.
 - processing:
   - min_ratings_for_superscore: Mindestanzahl verfügbarer Einzelratings, damit
     ein Superscore berechnet/gespeichert wird.
   - apply_outlier_treatment: Globaler Schalter für Ausreißerbehandlung.
   - outlier_treatment: Detailparameter (z. B. method, iqr_faktor,
     lower_percentile, upper_percentile).
+  - parallel_adapters: enabled/max_workers; führt die Adapter in einem
+    Prozesspool aus (größte Quelle zuerst, Ergebnisreihenfolge wie in `sources`).
+  - fuzzy_matching: enabled, threshold, review_threshold, year_window, …;
+    unscharfer Titelabgleich im Merge per n-Gramm-MinHash-LSH (siehe
+    transform/fuzzy_match.py), schreibt Cluster und Grenzfälle als CSV.
+- cache: enabled, dir, max_size_mb; inhaltsbasierter Cache der bereinigten
+  Adapter-DataFrames (abschaltbar per `--no-cache`).
+- raw_cache: enabled, dir, max_size_mb, max_age_days; Arrow-IPC-Abbild jeder
+  Roh-CSV (memory-mapped wiederverwendet, siehe utils/raw_cache.py; ebenfalls
+  per `--no-cache` abschaltbar).
+- title_cache: enabled, dir, max_entries, max_age_days; persistente Abbildung
+  Rohtitel → normalisierter Titel (siehe utils/title_cache.py; ebenfalls per
+  `--no-cache` abschaltbar).
+- entity_index: enabled, dir; persistenter Entitätsindex für den inkrementellen
+  Merge – nur von geänderten Adapterzeilen betroffene Entitäten werden neu
+  gemergt (siehe utils/entity_index.py; ebenfalls per `--no-cache` abschaltbar).
+- intermediate_outputs: enabled, dir, format, background, max_pending; Ziel der
+  Zwischenergebnisse aus Merge (ungefiltertes Wide-Frame, Duplikate,
+  Fuzzy-/Entitätslisten unter `dir`) und der Adapter-DataFrames (unter
+  output.intermediate_adapter_data_path) – csv, feather oder parquet, optional
+  in einem Hintergrund-Thread (siehe utils/output_sink.py).
+- checkpoints: enabled, dir; typisierte Zwischenstände nach den Stufen
+  adapters, long, merged, normalized (Fortsetzen per `--resume-from <stufe>`).
+- metrics: enabled, dir, history_file; JSON-Report je Lauf (Wall-/CPU-Zeit,
+  Peak-RSS, Zeilenzahlen, Speicherbedarf je Stufe und Adapter) plus History
+  als JSON Lines.
 - output:
   - csv_path: Zielpfad der gemergeten Rohdaten (wird auch als Basis für finalen
     Output verwendet, falls keine alternative Basis angegeben wird).
   - intermediate_adapter_data_path: Verzeichnis für einzelne Adapter-Exports.
   - save_intermediate: true/false, steuert das Speichern der Adapter-DFs.
   - final_filtered_filename: Dateiname des final gefilterten Outputs.
+  - validation_reports_path: Verzeichnis der Validierungsberichte
+    (Default: data/validation_reports).
+  - genres_multi_hot_path: optional; Sparse Multi-Hot-Matrix der Genres des
+    finalen Outputs als Pickle (für ML-Anwendungen).
 
 Nutzung
 - Ausführung als Skript (siehe if __name__ == '__main__').
@@ -39,29 +71,207 @@ Nutzung
 Hinweise zur Reproduzierbarkeit
 - Pfade aus der Konfiguration werden relativ zum Skriptverzeichnis aufgelöst,
   sofern sie nicht absolut sind.
-- Der Validator schreibt Berichte in `data/validation_reports/`.
+- Der Validator schreibt Berichte in `data/validation_reports/` (bzw.
+  `output.validation_reports_path`).
 - Duplikate (title, year) werden pro Adapter protokolliert und entfernt.
 """
 
+import argparse
+import os
 import yaml
 import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 import pandas as pd
 from datetime import datetime
 
 # Adapter-Importe
+from adapters.adapters.base_adapter import BaseAdapter
 from adapters.adapters.imdb_adapter import ImdbAdapter
 from adapters.adapters.movielens_adapter import MovielensAdapter
 from adapters.adapters.metacritic_adapter import MetacriticAdapter
 from adapters.adapters.rottentomatoes_adapter import RottenTomatoesAdapter
 
 # Transformations-Importe
-from transform.merge import merge_sources
+from transform.genres import genres_multi_hot, with_genre_lists
+from transform.merge import build_long_frame, merge_long_frame
 from transform.normalize_ratings import calculate_normalized_ratings_and_superscores
 
 # Loader-Importe
 from loaders.csv_loader import CsvLoader
 from utils.basic_validator import validate_dataframe
+from utils.adapter_cache import AdapterCache
+from utils.raw_cache import RawColumnarCache
+from utils.title_cache import TitleCache
+from utils.entity_index import EntityIndex
+from utils.output_sink import OutputSink, make_sink
+from utils.checkpoints import STAGES, CheckpointStore
+from utils.run_metrics import RunMetrics, frame_stats, measure
+
+
+# Registry der bekannten Adapter (Name in config.yaml → Klasse)
+ADAPTER_CLASSES: dict[str, type[BaseAdapter]] = {
+    "ImdbAdapter": ImdbAdapter,
+    "MovielensAdapter": MovielensAdapter,
+    "MetacriticAdapter": MetacriticAdapter,
+    "RottenTomatoesAdapter": RottenTomatoesAdapter,
+}
+
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_LOG_DATEFMT = '%Y-%m-%d %H:%M:%S'
+
+
+def _init_worker(level_value: int) -> None:
+    """Logging in Worker-Prozessen wie im Hauptprozess konfigurieren."""
+    logging.basicConfig(level=level_value, format=_LOG_FORMAT, datefmt=_LOG_DATEFMT)
+    logging.getLogger().setLevel(level_value)
+
+
+def _source_size(adapter_config: dict) -> int:
+    """Summe der Dateigrößen aller *_path/*_paths-Einträge (fehlende Dateien = 0)."""
+    total = 0
+    for key, value in adapter_config.items():
+        if not (key.endswith("_path") or key.endswith("_paths")):
+            continue
+        for path_value in (value if isinstance(value, (list, tuple)) else [value]):
+            try:
+                total += Path(path_value).stat().st_size
+            except (OSError, TypeError):
+                continue
+    return total
+
+
+def _run_adapter(
+    adapter_name: str,
+    adapter_class: type[BaseAdapter],
+    adapter_config: dict,
+    validation_reports_dir: Path,
+    duplicates_dir: Path,
+    cache: AdapterCache | None = None,
+    raw_cache: RawColumnarCache | None = None,
+    title_cache: TitleCache | None = None,
+) -> tuple[pd.DataFrame | None, dict]:
+    """
+    Führt Extract, Transform, Validierung und Duplikatbehandlung für genau
+    einen Adapter aus und misst dabei Laufzeit, Speicher und Zeilenzahlen.
+
+    Modulweite Funktion (statt Methode), damit sie auch in einem
+    ProcessPoolExecutor ausgeführt werden kann.
+
+    Ist ein `AdapterCache` übergeben und existiert ein Eintrag für
+    (Rohdateien, Adaptercode, Config), wird das bereinigte DataFrame direkt
+    aus dem Cache geliefert; Validierungsreports und Aux-Dateien des
+    vorherigen Laufs bleiben dann unverändert bestehen. Ein `RawColumnarCache`
+    erspart bei einem Cache-Miss zumindest das erneute Parsen der Roh-CSVs,
+    ein `TitleCache` das erneute Normalisieren bekannter Titel.
+
+    Returns:
+        (bereinigtes Adapter-DataFrame oder None, Metriken des Adapters).
+    """
+    with measure() as metrics:
+        df_ready = _run_adapter_steps(
+            adapter_name, adapter_class, adapter_config,
+            validation_reports_dir, duplicates_dir, cache, raw_cache, title_cache, metrics)
+        output_stats = frame_stats(df_ready)
+        metrics["output_rows"] = output_stats["rows"]
+        metrics["memory_deep_mb"] = output_stats["memory_deep_mb"]
+    return df_ready, metrics
+
+
+def _run_adapter_steps(
+    adapter_name: str,
+    adapter_class: type[BaseAdapter],
+    adapter_config: dict,
+    validation_reports_dir: Path,
+    duplicates_dir: Path,
+    cache: AdapterCache | None,
+    raw_cache: RawColumnarCache | None,
+    title_cache: TitleCache | None,
+    metrics: dict,
+) -> pd.DataFrame | None:
+    """Eigentliche Adapter-Schritte von `_run_adapter`; Zählwerte landen in `metrics`."""
+    logger = logging.getLogger(__name__)
+    metrics["cache_hit"] = False
+    cache_key = None
+    if cache is not None:
+        try:
+            cache_key = cache.key_for(adapter_class, adapter_config)
+        except OSError as e:
+            logger.warning(f"{adapter_name}: Cache-Schlüssel nicht berechenbar ({e}) – Cache wird umgangen.")
+        if cache_key is not None:
+            cached_df = cache.load(adapter_name, cache_key)
+            if cached_df is not None:
+                logger.info(f"{adapter_name}: Ergebnis aus Cache geladen ({len(cached_df)} Zeilen).")
+                metrics["cache_hit"] = True
+                return cached_df if not cached_df.empty else None
+
+    adapter_instance = adapter_class(adapter_config)
+    adapter_instance.raw_cache = raw_cache
+    adapter_instance.title_cache = title_cache
+    chunksize = adapter_config.get("chunksize")
+    if chunksize and adapter_instance.supports_chunks():
+        # Chunk-Modus: Rohdaten nie vollständig im Speicher
+        logger.info(f"{adapter_name}: Chunk-Modus mit {int(chunksize)} Zeilen je Block.")
+        df_ready, input_rows = adapter_instance.run_chunked(int(chunksize))
+        metrics["input_rows"] = int(input_rows)
+    else:
+        if chunksize:
+            logger.warning(f"{adapter_name}: Chunk-Modus nicht unterstützt – lese Datei vollständig.")
+        raw_data = adapter_instance.extract()
+        metrics["input_rows"] = int(len(raw_data[0] if isinstance(raw_data, tuple) else raw_data))
+        df_ready = adapter_instance.transform(raw_data)
+    if title_cache is not None:
+        title_cache.flush()
+    metrics["rejected_rows"] = adapter_instance.stats.get("rejected_rows", 0)
+    metrics["duplicate_rows"] = adapter_instance.stats.get("duplicate_rows", 0)
+    metrics["quarantined_rows"] = adapter_instance.quarantined_rows
+    if "rating_sources" in adapter_instance.stats:
+        metrics["rating_sources"] = adapter_instance.stats["rating_sources"]
+
+    # --- Grundvalidierung des Adapter-DataFrames ---
+    report_path = validation_reports_dir / f"{adapter_name}_report.txt"
+    invalid_path = validation_reports_dir / f"{adapter_name}_invalid_rows.csv"
+    # Duplikate lässt der Validator NICHT mehr speichern; wir handhaben sie konsolidiert unten
+    ok_adapter, errs_adapter = validate_dataframe(
+        df_ready,
+        df_name=f"{adapter_name}-DF",
+        error_report_path=str(report_path),
+        save_invalid_rows=True,
+        invalid_rows_output_path=str(invalid_path),
+        save_duplicates=False,
+    )
+    if not ok_adapter:
+        logger.warning(
+            f"Validation-Probleme im {adapter_name}: {errs_adapter}"
+        )
+
+    # --- Duplikatlogik: nur EINE Zeile pro (title, year) behalten ---
+    if "title" in df_ready.columns and "year" in df_ready.columns:
+        dupes_mask_to_remove = df_ready.duplicated(
+            subset=["title", "year"], keep='first')
+        if dupes_mask_to_remove.any():
+            n_removed = int(dupes_mask_to_remove.sum())
+            metrics["duplicate_rows"] += n_removed
+            logger.warning(
+                f"{adapter_name}: {n_removed} Duplikate (title + year) entfernt.")
+            duplicates_dir.mkdir(parents=True, exist_ok=True)
+            dupes_path = duplicates_dir / f"{adapter_name}_duplicates_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            try:
+                with_genre_lists(df_ready.loc[dupes_mask_to_remove]).to_csv(dupes_path, index=False)
+                logger.info(
+                    f"Duplikate gespeichert unter: {dupes_path}")
+            except Exception as e:
+                logger.error(
+                    f"Fehler beim Speichern der Duplikate für {adapter_name}: {e}"
+                )
+        df_ready = df_ready[~dupes_mask_to_remove].copy()
+
+    if cache is not None and cache_key is not None and df_ready is not None:
+        cache.store(adapter_name, cache_key, df_ready)
+
+    if df_ready is None or df_ready.empty:
+        return None
+    return df_ready
 
 
 class ETLPipeline:
@@ -77,7 +287,8 @@ class ETLPipeline:
     - Persistenz der Roh- und Finaldaten sowie der Validierungsartefakte (Load)
 
     Parameter
-    - config_filename: Dateiname der YAML-Konfiguration relativ zum Skript.
+    - config_filename: Dateiname der YAML-Konfiguration relativ zum Skript
+      (absolute Pfade werden unverändert übernommen).
 
     Hinweise
     - Die Klasse ist zustandsarm. Pfadauflösungen erfolgen zentral über
@@ -86,7 +297,7 @@ class ETLPipeline:
       notwendige Vorbedingungen fehlen (z. B. keine Daten geladen / Merge leer).
     """
 
-    def __init__(self, config_filename: str = 'config.yaml'):
+    def __init__(self, config_filename: str = 'config.yaml', use_cache: bool = True):
         """
         Initialisiert die ETL-Pipeline.
 
@@ -96,6 +307,9 @@ class ETLPipeline:
         Args:
             config_filename: Der Dateiname der YAML-Konfigurationsdatei,
                              relativ zum Speicherort dieses Skripts.
+            use_cache: False deaktiviert Adapter-, Raw- und Titel-Cache sowie den
+                       Entitätsindex unabhängig von `cache.enabled`/`raw_cache.enabled`/
+                       `title_cache.enabled`/`entity_index.enabled` (entspricht `--no-cache`).
 
         Raises:
             FileNotFoundError: Wenn die Konfigurationsdatei nicht gefunden wird.
@@ -132,15 +346,87 @@ class ETLPipeline:
         logging.basicConfig(
             level=
             level_value,  # Sicherstellen, dass wir den numerischen Wert übergeben
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S')
+            format=_LOG_FORMAT,
+            datefmt=_LOG_DATEFMT)
         logging.getLogger().setLevel(level_value)  # Root-Logger explizit setzen
         self.logger = logging.getLogger(__name__)  # Logger für diese Klasse
         # Verzeichnis für Validierungsreports vorbereiten
         self.validation_reports_dir: Path = self._resolve_path(
-            "data/validation_reports")
+            self.config.get("output", {}).get("validation_reports_path",
+                                              "data/validation_reports"))
         self.validation_reports_dir.mkdir(parents=True, exist_ok=True)
 
+        # Adapter-Cache (inhaltsbasiert, siehe utils/adapter_cache.py)
+        cache_cfg: dict = self.config.get("cache", {}) or {}
+        self.adapter_cache: AdapterCache | None = None
+        if use_cache and cache_cfg.get("enabled", False):
+            self.adapter_cache = AdapterCache(
+                self._resolve_path(cache_cfg.get("dir", "data/cache/adapters")),
+                max_size_mb=cache_cfg.get("max_size_mb"),
+            )
+
+        # Raw-Cache: geparste Roh-CSVs als Arrow IPC (siehe utils/raw_cache.py)
+        raw_cache_cfg: dict = self.config.get("raw_cache", {}) or {}
+        self.raw_cache: RawColumnarCache | None = None
+        if use_cache and raw_cache_cfg.get("enabled", False):
+            self.raw_cache = RawColumnarCache(
+                self._resolve_path(raw_cache_cfg.get("dir", "data/cache/raw")),
+                max_size_mb=raw_cache_cfg.get("max_size_mb"),
+                max_age_days=raw_cache_cfg.get("max_age_days"),
+            )
+
+        # Titel-Cache: Rohtitel → normalisierter Titel (siehe utils/title_cache.py)
+        title_cache_cfg: dict = self.config.get("title_cache", {}) or {}
+        self.title_cache: TitleCache | None = None
+        if use_cache and title_cache_cfg.get("enabled", False):
+            self.title_cache = TitleCache(
+                self._resolve_path(title_cache_cfg.get("dir", "data/cache/titles")),
+                max_entries=title_cache_cfg.get("max_entries"),
+                max_age_days=title_cache_cfg.get("max_age_days"),
+            )
+
+        # Entitätsindex für den inkrementellen Merge (siehe utils/entity_index.py)
+        entity_index_cfg: dict = self.config.get("entity_index", {}) or {}
+        self.entity_index: EntityIndex | None = None
+        if use_cache and entity_index_cfg.get("enabled", False):
+            self.entity_index = EntityIndex(
+                self._resolve_path(entity_index_cfg.get("dir", "data/cache/entities")))
+
+        # Stufen-Checkpoints für --resume-from (siehe utils/checkpoints.py)
+        checkpoint_cfg: dict = self.config.get("checkpoints", {}) or {}
+        self.checkpoints_enabled: bool = bool(checkpoint_cfg.get("enabled", False))
+        self.checkpoints = CheckpointStore(
+            self._resolve_path(checkpoint_cfg.get("dir", "data/checkpoints")))
+
+        # Laufzeit-/Speicher-/Zeilenmetriken je Stufe und Adapter
+        self.metrics = RunMetrics()
+
+        # Ausgabe-Sinks für Zwischenergebnisse; je Lauf in `run` geöffnet
+        self.sink: OutputSink = OutputSink()
+        self.adapter_sink: OutputSink = OutputSink()
+
+    def _open_sinks(self) -> None:
+        """
+        Öffnet die Sinks für Zwischenergebnisse (`intermediate_outputs`): Merge-
+        Nebenprodukte unter `intermediate_outputs.dir`, Adapter-DataFrames unter
+        `output.intermediate_adapter_data_path` (abschaltbar per `output.save_intermediate`).
+        """
+        sink_cfg: dict = self.config.get("intermediate_outputs", {}) or {}
+        output_cfg: dict = self.config.get("output", {}) or {}
+        self.sink = make_sink(sink_cfg, self._resolve_path(sink_cfg.get("dir", "data/processed")))
+        self.adapter_sink = make_sink(
+            {**sink_cfg, "enabled": sink_cfg.get("enabled", True) and output_cfg.get("save_intermediate", True)},
+            self._resolve_path(output_cfg.get("intermediate_adapter_data_path", "data/intermediate_adapter_outputs")))
+
+    def _close_sinks(self) -> None:
+        """Schließt die Sinks (wartet auf ausstehende Hintergrund-Schreibvorgänge)."""
+        for sink in (self.sink, self.adapter_sink):
+            try:
+                sink.close()
+            except Exception as e:
+                self.logger.error(f"Fehler beim Schließen eines Ausgabe-Sinks: {e}", exc_info=True)
+        self.sink, self.adapter_sink = OutputSink(), OutputSink()
+
     def _resolve_path(self, path_value: str | Path) -> Path:
         """
         Konvertiert einen Pfadwert aus der Konfiguration in ein absolutes Path-Objekt.
@@ -173,11 +459,39 @@ class ETLPipeline:
             return path_obj
         return (self.script_dir / path_obj).resolve()
 
+    def _adapter_jobs(self) -> list[tuple[str, type[BaseAdapter], dict]]:
+        """
+        Ermittelt alle ausführbaren Adapter in Konfigurationsreihenfolge.
+
+        Returns:
+            Liste von (Adaptername, Adapterklasse, Adapter-Config mit absoluten Pfaden).
+        """
+        jobs: list[tuple[str, type[BaseAdapter], dict]] = []
+        sources_config = self.config.get("sources", {}) or {}
+        for adapter_name, adapter_config_raw in sources_config.items():
+            adapter_class = ADAPTER_CLASSES.get(adapter_name)
+            if not adapter_class:
+                self.logger.warning(
+                    f"Keine Adapterklasse für '{adapter_name}' gefunden. Überspringe."
+                )
+                continue
+
+            # Pfade aus YAML in absolute Pfade überführen, nur für Keys mit *_path/_paths
+            processed_adapter_config = {
+                key: (
+                    self._resolve_path(value) if isinstance(value,
+                                                            (str, Path)) and
+                    (key.endswith("_path") or key.endswith("_paths")) else value
+                ) for key, value in (adapter_config_raw or {}).items()
+            }
+            jobs.append((adapter_name, adapter_class, processed_adapter_config))
+        return jobs
+
     def _extract_and_transform_sources(self) -> dict[str, pd.DataFrame]:
         """
         Führt alle in der Konfiguration definierten Adapter aus.
 
-        Schritte je Adapter
+        Schritte je Adapter (siehe `_run_adapter`)
         - Instanziierung mit vorverarbeiteten Pfaden (relative → absolute Pfade)
         - extract(): Rohdaten einlesen
         - transform(): Adapter-spezifische Bereinigung/Normalisierung
@@ -186,110 +500,98 @@ class ETLPipeline:
         - Duplikatbehandlung: nur eine Zeile pro (title, year) behalten, weitere
           entfernen und separat protokollieren
 
+        Ausführungsmodus (`processing.parallel_adapters`)
+        - enabled: false → Adapter laufen nacheinander im Hauptprozess.
+        - enabled: true  → Adapter laufen in einem ProcessPoolExecutor mit
+          `max_workers` Prozessen (Default: Anzahl Adapter bzw. CPUs). Die
+          größte Quelle (Summe der Dateigrößen) wird zuerst gestartet.
+        - Fehler eines Adapters werden isoliert protokolliert; die übrigen
+          Adapter laufen weiter.
+
         Returns:
-            Dictionary von Adapternamen auf deren bereinigte DataFrames.
+            Dictionary von Adapternamen auf deren bereinigte DataFrames, immer in
+            der Reihenfolge der Konfiguration (unabhängig vom Ausführungsmodus).
         """
         dfs_collection: dict[str, pd.DataFrame] = {}
-        adapter_classes_map: dict[str, type[ImdbAdapter | MovielensAdapter |
-                                            MetacriticAdapter |
-                                            RottenTomatoesAdapter]] = {
-                                                "ImdbAdapter":
-                                                    ImdbAdapter,
-                                                "MovielensAdapter":
-                                                    MovielensAdapter,
-                                                "MetacriticAdapter":
-                                                    MetacriticAdapter,
-                                                "RottenTomatoesAdapter":
-                                                    RottenTomatoesAdapter
-                                            }
-
-        sources_config = self.config.get("sources", {})
-        if not sources_config:
+        if not self.config.get("sources"):
             self.logger.warning(
                 "Keine Datenquellen in der Konfiguration definiert.")
             return dfs_collection
 
-        for adapter_name, adapter_config_raw in sources_config.items():
-            adapter_class = adapter_classes_map.get(adapter_name)
-            if not adapter_class:
-                self.logger.warning(
-                    f"Keine Adapterklasse für '{adapter_name}' gefunden. Überspringe."
-                )
-                continue
+        jobs = self._adapter_jobs()
+        duplicates_dir = self.validation_reports_dir / "duplicates"
+        parallel_cfg = self.config.get("processing", {}).get("parallel_adapters", {}) or {}
+        max_workers = parallel_cfg.get("max_workers") or min(len(jobs), os.cpu_count() or 1)
 
-            # Pfade aus YAML in absolute Pfade überführen, nur für Keys mit *_path/_paths
-            processed_adapter_config = {
-                key: (
-                    self._resolve_path(value) if isinstance(value,
-                                                            (str, Path)) and
-                    (key.endswith("_path") or key.endswith("_paths")) else value
-                ) for key, value in adapter_config_raw.items()
-            }
-            try:
-                adapter_instance = adapter_class(processed_adapter_config)
-                raw_data = adapter_instance.extract()
-                df_ready = adapter_instance.transform(raw_data)
-
-                # --- Grundvalidierung des Adapter-DataFrames ---
-                report_path = self.validation_reports_dir / f"{adapter_name}_report.txt"
-                invalid_path = self.validation_reports_dir / f"{adapter_name}_invalid_rows.csv"
-                # Duplikate lässt der Validator NICHT mehr speichern; wir handhaben sie konsolidiert unten
-                ok_adapter, errs_adapter = validate_dataframe(
-                    df_ready,
-                    df_name=f"{adapter_name}-DF",
-                    error_report_path=str(report_path),
-                    save_invalid_rows=True,
-                    invalid_rows_output_path=str(invalid_path),
-                    save_duplicates=False,
-                )
-                if not ok_adapter:
-                    self.logger.warning(
-                        f"Validation-Probleme im {adapter_name}: {errs_adapter}"
-                    )
-
-                # --- Duplikatlogik: nur EINE Zeile pro (title, year) behalten ---
-                if "title" in df_ready.columns and "year" in df_ready.columns:
-                    dupes_mask_to_remove = df_ready.duplicated(
-                        subset=["title", "year"], keep='first')
-                    if dupes_mask_to_remove.any():
-                        n_removed = int(dupes_mask_to_remove.sum())
-                        self.logger.warning(
-                            f"{adapter_name}: {n_removed} Duplikate (title + year) entfernt.")
-                        duplicates_dir = self._resolve_path("data/validation_reports/duplicates")
-                        duplicates_dir.mkdir(parents=True, exist_ok=True)
-                        dupes_path = duplicates_dir / f"{adapter_name}_duplicates_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-                        try:
-                            df_ready.loc[dupes_mask_to_remove].to_csv(dupes_path, index=False)
-                            self.logger.info(
-                                f"Duplikate gespeichert unter: {dupes_path}")
-                        except Exception as e:
-                            self.logger.error(
-                                f"Fehler beim Speichern der Duplikate für {adapter_name}: {e}"
-                            )
-                    df_ready = df_ready[~dupes_mask_to_remove].copy()
-
-                if df_ready is not None and not df_ready.empty:
-                    dfs_collection[adapter_name] = df_ready
-                    self.logger.info(
-                        f"Adapter '{adapter_name}' erfolgreich ausgeführt und Daten geladen."
-                    )
-                else:
-                    self.logger.info(
-                        f"Adapter '{adapter_name}' lieferte keine Daten oder ein leeres DataFrame."
-                    )
-            except Exception as e:
-                self.logger.error(
-                    f"Fehler beim Ausführen des Adapters '{adapter_name}': {e}",
-                    exc_info=True)
+        results: dict[str, pd.DataFrame | None] = {}
+        if parallel_cfg.get("enabled", False) and len(jobs) > 1 and max_workers > 1:
+            # Largest-first: lange Adapter zuerst starten, damit die Laufzeit
+            # möglichst nahe am langsamsten Einzeladapter liegt.
+            scheduled = sorted(jobs, key=lambda job: _source_size(job[2]), reverse=True)
+            self.logger.info(
+                f"Starte {len(jobs)} Adapter parallel mit {max_workers} Prozessen: "
+                f"{[name for name, _, _ in scheduled]}")
+            with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_worker,
+                    initargs=(logging.getLogger().level,)) as executor:
+                futures = {
+                    executor.submit(_run_adapter, name, adapter_class, adapter_config,
+                                    self.validation_reports_dir, duplicates_dir,
+                                    self.adapter_cache, self.raw_cache, self.title_cache): name
+                    for name, adapter_class, adapter_config in scheduled
+                }
+                for future in as_completed(futures):
+                    adapter_name = futures[future]
+                    try:
+                        results[adapter_name], self.metrics.adapters[adapter_name] = future.result()
+                    except Exception as e:
+                        self.metrics.adapters[adapter_name] = {"error": str(e)}
+                        self.logger.error(
+                            f"Fehler beim Ausführen des Adapters '{adapter_name}': {e}",
+                            exc_info=True)
+        else:
+            for adapter_name, adapter_class, adapter_config in jobs:
+                try:
+                    results[adapter_name], self.metrics.adapters[adapter_name] = _run_adapter(
+                        adapter_name, adapter_class, adapter_config,
+                        self.validation_reports_dir, duplicates_dir,
+                        self.adapter_cache, self.raw_cache, self.title_cache)
+                except Exception as e:
+                    self.metrics.adapters[adapter_name] = {"error": str(e)}
+                    self.logger.error(
+                        f"Fehler beim Ausführen des Adapters '{adapter_name}': {e}",
+                        exc_info=True)
+
+        if self.adapter_cache is not None:
+            self.adapter_cache.evict()
+        if self.raw_cache is not None:
+            self.raw_cache.evict()
+        if self.title_cache is not None:
+            self.title_cache.evict()
+
+        # Deterministische Reihenfolge: wie in der Konfiguration
+        for adapter_name, _, _ in jobs:
+            if adapter_name not in results:
                 continue
+            df_ready = results[adapter_name]
+            if df_ready is not None and not df_ready.empty:
+                dfs_collection[adapter_name] = df_ready
+                self.logger.info(
+                    f"Adapter '{adapter_name}' erfolgreich ausgeführt und Daten geladen."
+                )
+            else:
+                self.logger.info(
+                    f"Adapter '{adapter_name}' lieferte keine Daten oder ein leeres DataFrame."
+                )
 
         return dfs_collection
 
     def _save_intermediate_dfs(self,
                                dfs_collection: dict[str, pd.DataFrame]) -> None:
         """
-        Speichert die DataFrames der einzelnen Adapter als CSV-Dateien in einem
-        konfigurierten Zwischenverzeichnis.
+        Übergibt die DataFrames der einzelnen Adapter an den Adapter-Sink
+        (`<intermediate_adapter_data_path>/<Adaptername>.<format>`).
 
         Voraussetzung: `output.save_intermediate` ist true (Default true). Die
         Ausgabe dient der Nachvollziehbarkeit und erleichtert Debugging sowie
@@ -304,71 +606,47 @@ class ETLPipeline:
                 "Keine Adapter-DataFrames zum Speichern vorhanden.")
             return
 
-        # Optionales Feature-Flag aus der Config
-        save_intermediate = self.config.get("output", {}).get("save_intermediate", True)
-        if not save_intermediate:
-            self.logger.info("Speichern der Einzel-Adapter-DFs deaktiviert (output.save_intermediate=false).")
-            return
-
-        intermediate_output_dir_str = self.config.get("output", {}).get(
-            "intermediate_adapter_data_path",
-            "data/intermediate_adapter_outputs")
-        intermediate_output_dir = self._resolve_path(
-            intermediate_output_dir_str)
-
-        try:
-            intermediate_output_dir.mkdir(parents=True, exist_ok=True)
-            self.logger.info(
-                f"Speichere einzelne Adapter-DataFrames nach: {intermediate_output_dir}")
-        except OSError as e:
-            self.logger.error(
-                f"Fehler beim Erstellen des Verzeichnisses {intermediate_output_dir}: {e}",
-                exc_info=True)
-            return
-
         for name, df_adapter in dfs_collection.items():
             # Prüfen, ob df_adapter ein DataFrame ist und nicht leer
             if isinstance(df_adapter, pd.DataFrame) and not df_adapter.empty:
-                try:
-                    file_path = intermediate_output_dir / f"{name}.csv"
-                    df_adapter.to_csv(file_path, index=False)
-                    self.logger.info(
-                        f"  -> Adapter-Daten für '{name}' gespeichert: {file_path}")
-                except Exception as e:
-                    self.logger.error(
-                        f"Fehler beim Speichern des Adapter-DataFrames '{name}' nach {file_path}: {e}",
-                        exc_info=True)
+                self.adapter_sink.publish(name, df_adapter)
             else:
                 self.logger.info(
                     f"Adapter-Daten für '{name}' sind leer – überspringe Speichern.")
 
     def _merge_and_save_raw(
-            self, dfs_list: list[pd.DataFrame]) -> pd.DataFrame | None:
+            self, long_df: pd.DataFrame) -> pd.DataFrame | None:
         """
-        Führt eine Liste von DataFrames zusammen und speichert das rohe,
-        ungesäuberte Ergebnis als CSV-Datei.
+        Führt das Long-Frame der Adapterdaten (siehe `build_long_frame`) zusammen
+        und speichert das rohe, ungesäuberte Ergebnis als CSV-Datei.
 
         Schritte
-        - Mergen über `merge_sources`
+        - Mergen über `merge_long_frame` (optional mit unscharfem Titelabgleich,
+          `processing.fuzzy_matching`)
         - Typkonvertierung aller rating_*-Spalten auf numerische, nullable
           Floats (Stringwerte werden zu NaN coerct)
         - Validierung des gemergeten DataFrames
         - Optionales Speichern des Roh-Merge-Outputs (output.csv_path)
 
         Args:
-            dfs_list: Eine Liste von Pandas DataFrames, die zusammengeführt werden sollen.
+            long_df: Long-Frame aller Adapter-DataFrames.
 
         Returns:
             Das zusammengeführte DataFrame oder None, wenn ein Fehler auftritt
-            oder die Eingabeliste leer ist oder der Merge ein leeres DataFrame ergibt.
+            oder das Long-Frame leer ist oder der Merge ein leeres DataFrame ergibt.
         """
-        if not dfs_list:
+        if long_df is None or long_df.empty:
             self.logger.warning("Keine DataFrames zum Mergen vorhanden.")
             return None
 
+        # Optionaler unscharfer Titelabgleich (processing.fuzzy_matching)
+        fuzzy_cfg = dict(self.config.get("processing", {}).get("fuzzy_matching", {}) or {})
+        fuzzy = fuzzy_cfg if fuzzy_cfg.pop("enabled", False) else None
+
         self.logger.info("Starte Merge-Prozess...")
         try:
-            merged_df_raw = merge_sources(dfs_list)
+            merged_df_raw, _, _ = merge_long_frame(
+                long_df, entity_index=self.entity_index, fuzzy=fuzzy, sink=self.sink)
 
             for col in merged_df_raw.filter(regex=r"^rating_").columns:
                 merged_df_raw[col] = (
@@ -426,10 +704,9 @@ class ETLPipeline:
                 "Der rohe Merge-DataFrame wird nicht gespeichert.")
         return merged_df_raw
 
-    def _process_and_save_final(self, merged_df: pd.DataFrame) -> None:
+    def _normalize_ratings(self, merged_df: pd.DataFrame) -> pd.DataFrame | None:
         """
-        Normalisiert Ratings, berechnet Superscores basierend auf der Konfiguration
-        und speichert das finale, gefilterte Ergebnis als CSV-Datei.
+        Normalisiert Ratings und berechnet Superscores basierend auf der Konfiguration.
 
         Details
         - Die Ausreißerbehandlung kann global deaktiviert werden
@@ -437,18 +714,19 @@ class ETLPipeline:
         - Parameter für die Ausreißerbehandlung werden aus `processing.outlier_treatment`
           übernommen, sofern vorhanden; ansonsten gelten Standardwerte der
           Normalisierungsfunktion.
-        - Es wird nur gespeichert, was mindestens `min_ratings_for_superscore`
-          Einzelratings besitzt (Filterung über `num_available_ratings`).
 
         Args:
             merged_df: Das zusammengeführte DataFrame, das verarbeitet werden soll.
                        Sollte nicht None oder leer sein.
+
+        Returns:
+            Das normalisierte, validierte DataFrame (ungefiltert) oder None bei Fehlern.
         """
         if merged_df is None or merged_df.empty:
             self.logger.warning(
                 "Kein zusammengeführtes DataFrame zum Verarbeiten vorhanden. Überspringe Prozessierung."
             )
-            return
+            return None
 
         self.logger.info(
             "Starte Rating-Normalisierung und Superscore-Berechnung...")
@@ -525,7 +803,21 @@ class ETLPipeline:
             self.logger.error(
                 f"Fehler bei der Rating-Normalisierung und Superscore-Berechnung: {e}",
                 exc_info=True)
-            return  # Beende diese Methode, wenn die Prozessierung fehlschlägt
+            return None  # Beende diese Methode, wenn die Prozessierung fehlschlägt
+
+        return df_final_processed
+
+    def _save_final(self, df_final_processed: pd.DataFrame) -> None:
+        """
+        Filtert das normalisierte DataFrame auf Filme mit mindestens
+        `min_ratings_for_superscore` Einzelratings (Filterung über
+        `num_available_ratings`) und speichert es als CSV-Datei.
+
+        Args:
+            df_final_processed: Ergebnis von `_normalize_ratings`.
+        """
+        min_ratings_cfg = self.config.get("processing", {}).get("min_ratings_for_superscore", 2)
+        id_cols_from_merge = [c for c in df_final_processed.columns if str(c).startswith("ID_")]
 
         # Speichern des finalen, gefilterten Ergebnisses
         output_cfg = self.config.get("output", {})
@@ -578,6 +870,7 @@ class ETLPipeline:
                 self.logger.info(
                     f"Finaler, gefilterter DataFrame ({len(df_actually_filtered_for_saving)} Einträge) gespeichert "
                     f"unter: {path_only_movies_with_superscores}")
+                self._save_genres_multi_hot(df_actually_filtered_for_saving)
             except OSError as e:
                 self.logger.error(
                     f"Fehler beim Erstellen des Verzeichnisses für finalen Output {path_only_movies_with_superscores.parent}: {e}",
@@ -591,35 +884,194 @@ class ETLPipeline:
                 f"Keine Daten zum Speichern nach Filterung für {path_only_movies_with_superscores}. "
                 f"Der DataFrame df_actually_filtered_for_saving ist leer.")
 
-    def run(self) -> None:
-        """Führt die gesamte ETL-Pipeline aus."""
-        self.logger.info("Starte ETL-Pipeline...")
-
-        dfs_collection = self._extract_and_transform_sources()
-        if not dfs_collection:  # Prüft, ob das Dictionary leer ist
-            self.logger.error(
-                "Keine Daten von Adaptern geladen. Pipeline wird beendet.")
+    def _save_genres_multi_hot(self, df_final: pd.DataFrame) -> None:
+        """
+        Optional (`output.genres_multi_hot_path`): Sparse Multi-Hot-Matrix der
+        Genres des finalen Datensatzes als Pickle – eine Spalte je Genre,
+        Zeilen in derselben Reihenfolge wie die finale CSV (siehe
+        `transform.genres.genres_multi_hot`).
+        """
+        target = self.config.get("output", {}).get("genres_multi_hot_path")
+        if not target or "genres" not in df_final.columns:
             return
+        path = self._resolve_path(target)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            matrix = genres_multi_hot(df_final["genres"]).reset_index(drop=True)
+            matrix.to_pickle(path)
+            self.logger.info(
+                f"Genre-Multi-Hot ({matrix.shape[0]} × {matrix.shape[1]}) gespeichert unter: {path}")
+        except Exception as e:
+            self.logger.error(f"Fehler beim Speichern der Genre-Multi-Hot-Matrix nach {path}: {e}",
+                              exc_info=True)
+
+    def _load_resume_point(
+        self, resume_from: str | None
+    ) -> tuple[str | None, pd.DataFrame | dict[str, pd.DataFrame] | None]:
+        """
+        Ermittelt den Checkpoint, ab dem ein Lauf fortgesetzt wird.
 
-        self._save_intermediate_dfs(dfs_collection)
+        Fehlt der Checkpoint der gewünschten Stufe, wird auf die letzte gültige
+        frühere Stufe zurückgegriffen; gibt es keine, läuft die Pipeline komplett.
 
-        # Stelle sicher, dass dfs_collection Werte enthält, bevor list() darauf angewendet wird
-        dfs_values = list(dfs_collection.values()) if dfs_collection else []
-        merged_df = self._merge_and_save_raw(dfs_values)
+        Returns:
+            (Stufe, geladene Daten) oder (None, None) für einen vollständigen Lauf.
+        """
+        if not resume_from:
+            return None, None
+        if resume_from not in STAGES:
+            raise ValueError(
+                f"Unbekannte Stufe für --resume-from: {resume_from} (erlaubt: {', '.join(STAGES)})")
 
-        if merged_df is None or merged_df.empty:  # Explizite Prüfung auf None und leer
+        stage = self.checkpoints.latest_up_to(resume_from)
+        if stage is None:
+            self.logger.warning(
+                f"Kein Checkpoint bis Stufe '{resume_from}' vorhanden – starte vollständigen Lauf.")
+            return None, None
+        if stage != resume_from:
+            self.logger.warning(
+                f"Checkpoint '{resume_from}' fehlt – setze beim letzten gültigen Checkpoint '{stage}' fort.")
+        try:
+            data = self.checkpoints.load(stage)
+        except Exception as e:
             self.logger.error(
-                "Merge-Prozess lieferte keine Daten oder schlug fehl. Pipeline wird beendet.")
+                f"Checkpoint '{stage}' konnte nicht geladen werden: {e} – starte vollständigen Lauf.",
+                exc_info=True)
+            return None, None
+        self.logger.info(f"Setze Pipeline ab Checkpoint '{stage}' fort.")
+        return stage, data
+
+    def _save_checkpoint(self, stage: str, data: pd.DataFrame | dict[str, pd.DataFrame]) -> None:
+        """Schreibt einen Checkpoint, sofern `checkpoints.enabled` gesetzt ist."""
+        if not self.checkpoints_enabled:
+            return
+        try:
+            self.checkpoints.save(stage, data)
+        except Exception as e:
+            self.logger.error(f"Fehler beim Schreiben des Checkpoints '{stage}': {e}", exc_info=True)
+
+    def _write_metrics(self) -> None:
+        """Schreibt die Run-Metriken, sofern `metrics.enabled` gesetzt ist (Default true)."""
+        metrics_cfg: dict = self.config.get("metrics", {}) or {}
+        if not metrics_cfg.get("enabled", True):
             return
+        metrics_dir = self._resolve_path(metrics_cfg.get("dir", "data/run_metrics"))
+        history_file = metrics_cfg.get("history_file", "data/run_metrics/history.jsonl")
+        try:
+            self.metrics.write(
+                metrics_dir, self._resolve_path(history_file) if history_file else None)
+        except Exception as e:
+            self.logger.error(f"Fehler beim Speichern der Run-Metriken: {e}", exc_info=True)
+
+    def run(self, resume_from: str | None = None) -> None:
+        """
+        Führt die gesamte ETL-Pipeline aus, schließt die Ausgabe-Sinks und
+        schreibt anschließend die Run-Metriken (auch bei Abbruch, dann mit
+        status "failed").
+
+        Args:
+            resume_from: Optional eine Stufe aus `STAGES` ("adapters", "long",
+                         "merged", "normalized"). Der Lauf lädt deren Checkpoint und
+                         setzt mit der nächsten Stufe fort.
+        """
+        self.logger.info("Starte ETL-Pipeline...")
+        self.metrics = RunMetrics()
+        self._open_sinks()
+        try:
+            ok = self._run_stages(resume_from)
+            self.metrics.status = "ok" if ok else "failed"
+        except BaseException:
+            self.metrics.status = "failed"
+            raise
+        finally:
+            self._close_sinks()
+            self._write_metrics()
+
+    def _run_stages(self, resume_from: str | None) -> bool:
+        """Stufenfolge von `run`; False, wenn die Pipeline vorzeitig endet."""
+        resume_stage, resumed = self._load_resume_point(resume_from)
+        resume_idx = STAGES.index(resume_stage) if resume_stage else -1
+        if resume_stage:
+            self.metrics.stages[resume_stage] = {"resumed_from_checkpoint": True}
+
+        def _pending(stage: str) -> bool:
+            return resume_idx < STAGES.index(stage)
+
+        if _pending("adapters"):
+            with self.metrics.stage("adapters") as rec:
+                dfs_collection = self._extract_and_transform_sources()
+                rec["input_rows"] = sum(m.get("input_rows", 0) for m in self.metrics.adapters.values())
+                rec["output_rows"] = sum(len(df) for df in dfs_collection.values())
+                rec["memory_deep_mb"] = round(sum(
+                    frame_stats(df)["memory_deep_mb"] for df in dfs_collection.values()), 3)
+            if not dfs_collection:  # Prüft, ob das Dictionary leer ist
+                self.logger.error(
+                    "Keine Daten von Adaptern geladen. Pipeline wird beendet.")
+                return False
+            self._save_checkpoint("adapters", dfs_collection)
+        elif resume_stage == "adapters":
+            dfs_collection = resumed
+
+        if _pending("long"):
+            with self.metrics.stage("long") as rec:
+                self._save_intermediate_dfs(dfs_collection)
+                long_df = build_long_frame(list(dfs_collection.values()))
+                rec["input_rows"] = sum(len(df) for df in dfs_collection.values())
+                stats = frame_stats(long_df)
+                rec["output_rows"], rec["memory_deep_mb"] = stats["rows"], stats["memory_deep_mb"]
+            self._save_checkpoint("long", long_df)
+        elif resume_stage == "long":
+            long_df = resumed
+
+        if _pending("merged"):
+            with self.metrics.stage("merged") as rec:
+                merged_df = self._merge_and_save_raw(long_df)
+                rec["input_rows"] = int(len(long_df))
+                stats = frame_stats(merged_df)
+                rec["output_rows"], rec["memory_deep_mb"] = stats["rows"], stats["memory_deep_mb"]
+            if merged_df is None or merged_df.empty:  # Explizite Prüfung auf None und leer
+                self.logger.error(
+                    "Merge-Prozess lieferte keine Daten oder schlug fehl. Pipeline wird beendet.")
+                return False
+            self._save_checkpoint("merged", merged_df)
+        elif resume_stage == "merged":
+            merged_df = resumed
+
+        if _pending("normalized"):
+            with self.metrics.stage("normalized") as rec:
+                df_final_processed = self._normalize_ratings(merged_df)
+                rec["input_rows"] = int(len(merged_df))
+                stats = frame_stats(df_final_processed)
+                rec["output_rows"], rec["memory_deep_mb"] = stats["rows"], stats["memory_deep_mb"]
+            if df_final_processed is None:
+                return False
+            self._save_checkpoint("normalized", df_final_processed)
+        else:
+            df_final_processed = resumed
 
-        self._process_and_save_final(merged_df)
+        with self.metrics.stage("save_final") as rec:
+            rec["input_rows"] = int(len(df_final_processed))
+            self._save_final(df_final_processed)
 
         self.logger.info(
             "ETL-Prozess abgeschlossen. Verarbeitete Daten wurden gespeichert.")
+        return True
 
 
 if __name__ == '__main__':
     # Initialisiert und startet die Pipeline. Für reproduzierbare Ergebnisse
     # sollte die Konfiguration (Pfad-/Parameterwerte) versioniert vorliegen.
-    pipeline = ETLPipeline(config_filename='config.yaml')
-    pipeline.run()
+    arg_parser = argparse.ArgumentParser(description="ETL-Static-Pipeline")
+    arg_parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Caches und Entitätsindex ignorieren und alle Quellen neu parsen, verarbeiten und mergen.")
+    arg_parser.add_argument(
+        "--resume-from", choices=STAGES, default=None,
+        help="Lauf ab dem Checkpoint dieser Stufe fortsetzen (Fallback: letzter gültiger davor).")
+    arg_parser.add_argument(
+        "--config", default="config.yaml",
+        help="Konfigurationsdatei (relativ zum Skript oder absolut; Default: config.yaml).")
+    args = arg_parser.parse_args()
+
+    pipeline = ETLPipeline(config_filename=args.config, use_cache=not args.no_cache)
+    pipeline.run(resume_from=args.resume_from)
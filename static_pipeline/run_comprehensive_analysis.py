@@ -10,6 +10,16 @@ import matplotlib.pyplot as plt
 # --- Globale Stil-Einstellung für Plots ---
 plt.style.use('seaborn-v0_8-whitegrid')
 
+# Gemeinsame CSV-Ingestion inkl. Raw-Cache der ETL; ohne static_pipeline im Pfad → pandas
+try:
+    from utils.csv_ingest import read_csv_source
+    from utils.raw_cache import RawColumnarCache
+except ImportError:
+    RawColumnarCache = None
+
+    def read_csv_source(path, cache=None) -> pd.DataFrame:
+        return pd.read_csv(path)
+
 # === Funktionen aus rating_analysis_module.py ===
 
 def run_distribution_plots(df: pd.DataFrame, output_dir: Path, analysis_phase: str, plot_configs_override: dict | None = None):
@@ -158,13 +168,16 @@ def run_correlation_plots(df: pd.DataFrame, output_dir: Path, analysis_phase: st
 # Wenn dieses Skript komplett eigenständig sein soll und `transform.normalize` nicht einfach importierbar ist,
 # müsste die Funktion hierher kopiert werden.
 try:
-    from transform.normalize import normalize_film_title
+    from transform.normalize import normalize_film_title, normalize_titles
 except ImportError:
     logging.warning("Funktion normalize_film_title nicht gefunden. Detailanalyse in generate_merge_analysis_report könnte fehlschlagen.")
     # Fallback-Dummy-Funktion, damit das Skript nicht direkt crasht
     def normalize_film_title(title: str) -> str:
         return title.lower().strip() if isinstance(title, str) else ""
 
+    def normalize_titles(values: pd.Series) -> pd.Series:
+        return values.map(normalize_film_title)
+
 
 def generate_merge_analysis_report(
     merged_df: pd.DataFrame,
@@ -204,7 +217,12 @@ def generate_merge_analysis_report(
             report_lines.append(f"  - Filme mit {count} verfügbaren norm. Rating(s) für Superscore: {num_movies}")
 
     if "genres" in merged_df.columns:
-        num_with_genres = merged_df["genres"].apply(lambda x: bool(x) if isinstance(x, list) else False).sum()
+        genres = merged_df["genres"]
+        if isinstance(genres.dtype, pd.CategoricalDtype):
+            # interne Darstellung: NaN = keine Genres
+            num_with_genres = int(genres.notna().sum())
+        else:
+            num_with_genres = genres.apply(lambda x: bool(x) if isinstance(x, list) else False).sum()
         report_lines.append(f"\nAnzahl Filme mit mindestens einem Genre: {num_with_genres} (von {len(merged_df)})")
     
     if "release_date" in merged_df.columns:
@@ -224,7 +242,7 @@ def generate_merge_analysis_report(
         # Erstelle normalisierte Schlüssel für den gemergten DataFrame (title, year)
         merged_keys_set = set()
         if "title" in merged_df.columns:
-            key_title_merged = merged_df["title"].astype(str).apply(normalize_film_title)
+            key_title_merged = normalize_titles(merged_df["title"].astype(str))
             key_year_merged = merged_df["year"].astype(str).fillna(NO_YEAR_STR_KEY) if "year" in merged_df.columns else pd.Series([NO_YEAR_STR_KEY] * len(merged_df), index=merged_df.index)
             merged_keys_set = set(zip(key_title_merged, key_year_merged))
         else:
@@ -394,6 +412,16 @@ class ComprehensiveMovieAnalyzer:
         self.output_cfg = self.cfg.get('output', {})
         self.analysis_cfg = self.output_cfg.get('analysis', {}) # Spezifische Analyse-Output-Pfade
 
+        # Raw-Cache der ETL mitnutzen: CSVs einmal parsen, danach memory-mapped öffnen
+        raw_cache_cfg = self.cfg.get('raw_cache', {}) or {}
+        self.raw_cache = None
+        if RawColumnarCache is not None and raw_cache_cfg.get('enabled', False):
+            self.raw_cache = RawColumnarCache(
+                self._resolve_path(raw_cache_cfg.get('dir', 'data/cache/raw')),
+                max_size_mb=raw_cache_cfg.get('max_size_mb'),
+                max_age_days=raw_cache_cfg.get('max_age_days'),
+            )
+
     def _resolve_path(self, path_str: str | Path) -> Path:
         """ Löst einen Pfad relativ zum Konfigurationsdatei-Verzeichnis auf, wenn er relativ ist. """
         path_obj = Path(path_str)
@@ -401,6 +429,10 @@ class ComprehensiveMovieAnalyzer:
             return path_obj
         return (self.config_path.parent / path_obj).resolve()
 
+    def _read_csv(self, path: Path) -> pd.DataFrame:
+        """ CSV lesen (pyarrow + Raw-Cache, falls verfügbar; sonst pandas). """
+        return read_csv_source(path, cache=self.raw_cache)
+
     def load_data(self) -> tuple[pd.DataFrame | None, pd.DataFrame | None, dict[str, pd.DataFrame]]:
         merged_df_raw = None
         df_final_processed = None
@@ -411,7 +443,7 @@ class ComprehensiveMovieAnalyzer:
         if raw_merged_path_str:
             raw_merged_path = self._resolve_path(raw_merged_path_str)
             try:
-                merged_df_raw = pd.read_csv(raw_merged_path)
+                merged_df_raw = self._read_csv(raw_merged_path)
                 logging.info(f"Roher Merge-DataFrame geladen von: {raw_merged_path} ({len(merged_df_raw)} Zeilen)")
             except FileNotFoundError:
                 logging.error(f"Roher Merge-DataFrame NICHT gefunden: {raw_merged_path}")
@@ -430,7 +462,7 @@ class ComprehensiveMovieAnalyzer:
         
         path_final_filtered = base_processed_dir / final_filtered_filename
         try:
-            df_final_processed = pd.read_csv(path_final_filtered)
+            df_final_processed = self._read_csv(path_final_filtered)
             logging.info(f"Final verarbeiteter DataFrame geladen von: {path_final_filtered} ({len(df_final_processed)} Zeilen)")
         except FileNotFoundError:
             logging.warning(f"Final verarbeiteter DataFrame NICHT gefunden: {path_final_filtered} (Wird für einige Analysen benötigt)")
@@ -451,7 +483,7 @@ class ComprehensiveMovieAnalyzer:
             for adapter_name in adapter_names:
                 file_path = intermediate_dir / f"{adapter_name}.csv"
                 try:
-                    df_adapter = pd.read_csv(file_path)
+                    df_adapter = self._read_csv(file_path)
                     dfs_collection_loaded[adapter_name] = df_adapter
                     logging.info(f"Adapter-Daten für '{adapter_name}' geladen von: {file_path}")
                 except FileNotFoundError:
@@ -461,6 +493,8 @@ class ComprehensiveMovieAnalyzer:
         else:
             logging.warning(f"Verzeichnis für zwischengespeicherte Adapter-Daten NICHT gefunden: {intermediate_dir} (Wird für Merge-Bericht-Detailanalyse benötigt)")
             
+        if self.raw_cache is not None:
+            self.raw_cache.evict()
         return merged_df_raw, df_final_processed, dfs_collection_loaded
 
     def run_analyses(self):
@@ -0,0 +1,40 @@
+"""
+Gemeinsame Fixtures der Tests.
+
+Die Module der Pipeline werden wie in main_pipeline.py relativ zu
+static_pipeline/ importiert (``from transform.merge import …``).
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import utils.save_aux_csv as save_aux_csv  # noqa: E402
+from utils.output_sink import OutputSink  # noqa: E402
+
+
+class CapturingSink(OutputSink):
+    """Merkt sich das zuletzt übergebene Frame je Name (statt Dateien zu schreiben)."""
+
+    def __init__(self):
+        self.frames: dict[str, pd.DataFrame] = {}
+
+    def publish(self, name: str, df: pd.DataFrame) -> None:
+        self.frames[name] = df
+
+
+@pytest.fixture
+def capturing_sink() -> CapturingSink:
+    return CapturingSink()
+
+
+@pytest.fixture
+def aux_dirs(tmp_path, monkeypatch) -> Path:
+    """Leitet die Aux-CSVs der Adapter (invalid/duplicates/quarantine) nach tmp_path um."""
+    monkeypatch.setattr(save_aux_csv, "_AUX_DIRS", {
+        kind: str(tmp_path / "aux" / kind) for kind in ("invalid", "duplicates", "quarantine")})
+    return tmp_path / "aux"
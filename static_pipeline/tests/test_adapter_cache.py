@@ -0,0 +1,103 @@
+import os
+import sys
+import textwrap
+
+import pandas as pd
+import pytest
+
+import utils.adapter_cache as adapter_cache
+from adapters.adapters.movielens_adapter import MovielensAdapter
+from transform.genres import intern_genres
+from utils.adapter_cache import AdapterCache, adapter_code_dependencies
+
+
+def _write(path, text, mtime_ns):
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def raw_file(tmp_path):
+    path = tmp_path / "raw" / "movies.csv"
+    path.parent.mkdir()
+    _write(path, "title,year\nA,2000\n", 1_000_000_000)
+    return path
+
+
+def test_store_and_load_round_trip(tmp_path, raw_file):
+    cache = AdapterCache(tmp_path / "cache")
+    key = cache.key_for(MovielensAdapter, {"movies_path": str(raw_file)})
+    assert cache.load("MovielensAdapter", key) is None
+
+    df = pd.DataFrame({
+        "title": ["A", "B"],
+        "year": pd.array([2000, None], dtype="Int64"),
+        "genres_ml": intern_genres(pd.Series(["Drama|Comedy", None]), sep="|"),
+    })
+    cache.store("MovielensAdapter", key, df)
+    pd.testing.assert_frame_equal(cache.load("MovielensAdapter", key), df)
+    # Gleiche Dateien + Config → gleicher Schlüssel (Treffer im nächsten Lauf)
+    assert AdapterCache(tmp_path / "cache").key_for(MovielensAdapter, {"movies_path": str(raw_file)}) == key
+
+
+def test_key_changes_with_file_content_and_config(tmp_path, raw_file):
+    cache = AdapterCache(tmp_path / "cache")
+    config = {"movies_path": str(raw_file)}
+    key = cache.key_for(MovielensAdapter, config)
+
+    # Gleiche Größe, neuer Inhalt und neue mtime → Fingerprint wird neu berechnet
+    _write(raw_file, "title,year\nB,2001\n", 2_000_000_000)
+    changed = cache.key_for(MovielensAdapter, config)
+    assert changed != key
+
+    assert cache.key_for(MovielensAdapter, {**config, "min_votes": 5}) != changed
+    assert cache.key_for(MovielensAdapter, dict(reversed(list({**config, "x": 1}.items())))) == \
+        cache.key_for(MovielensAdapter, {**config, "x": 1})
+
+
+def test_code_dependencies_include_imported_project_modules():
+    modules = adapter_code_dependencies(MovielensAdapter)
+    assert "adapters.adapters.movielens_adapter" in modules
+    assert "adapters.adapters.base_adapter" in modules
+    assert "transform.rating_aggregate" in modules
+    assert "transform.genres" in modules
+    assert not any(name.startswith(("pandas", "numpy")) for name in modules)
+
+
+def test_key_changes_with_dependency_source(tmp_path, monkeypatch, raw_file):
+    pkg = tmp_path / "proj"
+    pkg.mkdir()
+    _write(pkg / "cache_dep_helper.py", "def f():\n    return 1\n", 1_000_000_000)
+    _write(pkg / "cache_dep_adapter.py", textwrap.dedent("""
+        from cache_dep_helper import f
+
+        class DummyAdapter:
+            pass
+    """), 1_000_000_000)
+    monkeypatch.setattr(adapter_cache, "_PROJECT_ROOT", pkg.resolve())
+    monkeypatch.syspath_prepend(str(pkg))
+    for name in ("cache_dep_helper", "cache_dep_adapter"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    from cache_dep_adapter import DummyAdapter
+
+    assert adapter_code_dependencies(DummyAdapter) == ["cache_dep_adapter", "cache_dep_helper"]
+    cache = AdapterCache(tmp_path / "cache")
+    config = {"movies_path": str(raw_file)}
+    key = cache.key_for(DummyAdapter, config)
+    assert cache.key_for(DummyAdapter, config) == key
+
+    # Nur das importierte Hilfsmodul ändert sich
+    _write(pkg / "cache_dep_helper.py", "def f():\n    return 2\n", 2_000_000_000)
+    assert cache.key_for(DummyAdapter, config) != key
+
+
+def test_evict_removes_least_recently_used(tmp_path):
+    cache = AdapterCache(tmp_path / "cache", max_size_mb=0.0015)
+    df = pd.DataFrame({"x": range(50)})
+    for i, name in enumerate(["old", "mid", "new"]):
+        cache.store(name, f"{i:032d}", df)
+        entry = cache._entry_path(name, f"{i:032d}")
+        os.utime(entry, ns=(i * 10**9, i * 10**9))
+    cache.evict()
+    remaining = sorted(p.name.split("_")[0] for p in (tmp_path / "cache").glob("*.pkl"))
+    assert "old" not in remaining and "new" in remaining
@@ -0,0 +1,77 @@
+import json
+
+import pandas as pd
+import pytest
+
+from transform.genres import intern_genres
+from utils.checkpoints import STAGES, CheckpointStore
+
+
+def _frame(n: int = 3) -> pd.DataFrame:
+    return pd.DataFrame({
+        "title": [f"t{i}" for i in range(n)],
+        "year": pd.array([2000 + i for i in range(n - 1)] + [None], dtype="Int64"),
+        "rating": pd.array([7.5] * (n - 1) + [None], dtype="Float64"),
+        "genres": intern_genres(pd.Series(["Drama, Comedy"] * (n - 1) + [None])),
+    })
+
+
+def test_save_and_load_keep_dtypes(tmp_path):
+    store = CheckpointStore(tmp_path)
+    adapters = {"ImdbAdapter": _frame(3), "MetacriticAdapter": _frame(2)}
+    store.save("adapters", adapters)
+    store.save("long", _frame(4))
+
+    loaded = store.load("adapters")
+    assert list(loaded) == ["ImdbAdapter", "MetacriticAdapter"]
+    for name, df in adapters.items():
+        pd.testing.assert_frame_equal(loaded[name], df)
+    pd.testing.assert_frame_equal(store.load("long"), _frame(4))
+
+    manifest = json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["adapters"]["rows"] == {"ImdbAdapter": 3, "MetacriticAdapter": 2}
+    assert manifest["long"]["rows"] == 4
+
+
+def test_save_invalidates_later_stages(tmp_path):
+    store = CheckpointStore(tmp_path)
+    for stage in STAGES:
+        store.save(stage, {"A": _frame()} if stage == "adapters" else _frame())
+    assert all(store.has(stage) for stage in STAGES)
+
+    store.save("long", _frame(5))
+    assert store.has("adapters") and store.has("long")
+    assert not store.has("merged") and not store.has("normalized")
+    with pytest.raises(FileNotFoundError):
+        store.load("merged")
+
+
+def test_missing_file_is_not_a_valid_checkpoint(tmp_path):
+    store = CheckpointStore(tmp_path)
+    store.save("adapters", {"A": _frame(), "B": _frame()})
+    store.save("merged", _frame())
+    (tmp_path / "adapters" / "B.pkl").unlink()
+    (tmp_path / "merged.pkl").unlink()
+    assert not store.has("adapters")
+    assert not store.has("merged")
+
+
+def test_latest_up_to_falls_back_to_earlier_stage(tmp_path):
+    store = CheckpointStore(tmp_path)
+    assert store.latest_up_to("normalized") is None
+
+    store.save("adapters", {"A": _frame()})
+    store.save("long", _frame())
+    assert store.latest_up_to("normalized") == "long"
+    assert store.latest_up_to("long") == "long"
+    assert store.latest_up_to("adapters") == "adapters"
+
+    # Neuer Adapter-Stand verwirft "long" → Resume fällt auf "adapters" zurück
+    store.save("adapters", {"A": _frame(2)})
+    assert store.latest_up_to("merged") == "adapters"
+    assert len(store.load("adapters")["A"]) == 2
+
+
+def test_unknown_stage_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        CheckpointStore(tmp_path).save("final", _frame())
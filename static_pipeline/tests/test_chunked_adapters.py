@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from adapters.adapters.imdb_adapter import ImdbAdapter
+
+_DATE_STYLES = ("{year}", "{month} {day}, {year}", "{month} {year}")
+_MONTHS = ("January", "March", "July", "November")
+
+
+@pytest.fixture
+def imdb_csv(tmp_path):
+    rng = np.random.default_rng(11)
+    n = 400
+    years = rng.integers(1950, 2024, n)
+    dates = [
+        _DATE_STYLES[i % 3].format(year=y, month=_MONTHS[i % 4], day=1 + i % 28)
+        for i, y in enumerate(years)
+    ]
+    df = pd.DataFrame({
+        "id": [f"tt{1000 + i:07d}" for i in range(n)],
+        # Wiederholte Titel erzeugen Duplikate über Blockgrenzen hinweg
+        "originalTitle": [f"Film {i % 150}" for i in range(n)],
+        "genres": rng.choice(["Drama", "Comedy,Drama", "Action", ""], n),
+        "averageRating": np.round(rng.random(n) * 10, 1),
+        "release_date": dates,
+    })
+    df.loc[::37, "release_date"] = "unknown"
+    path = tmp_path / "imdb.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def _comparable(df: pd.DataFrame) -> pd.DataFrame:
+    # Genre-Kategorien werden beim Zusammenfügen der Blöcke neu sortiert
+    return df.assign(genres=df["genres"].astype(object)).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("chunksize", [5, 7, 64, 10_000])
+def test_imdb_chunked_matches_full_mode(imdb_csv, aux_dirs, chunksize):
+    adapter = ImdbAdapter({"file_path": str(imdb_csv), "csv_engine": "pandas"})
+    full = adapter.transform(adapter.extract())
+    full_stats = dict(adapter.stats)
+
+    chunked, input_rows = adapter.run_chunked(chunksize)
+    assert input_rows == 400
+    pd.testing.assert_frame_equal(_comparable(chunked), _comparable(full))
+    assert adapter.stats == full_stats
@@ -0,0 +1,90 @@
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from transform.dates import INFER, YEAR_ONLY, parse_dates
+
+_MIXED = ["2018", "July 11, 2001", "2010-02-12", "Feb 2003", "garbage", " 2001-01-05 ", None]
+_EXPECTED = {
+    "2018": "2018-01-01",
+    "July 11, 2001": "2001-07-11",
+    "2010-02-12": "2010-02-12",
+    "Feb 2003": "2003-02-01",
+    " 2001-01-05 ": "2001-01-05",
+}
+
+
+def _expected(values) -> pd.Series:
+    return pd.Series([pd.Timestamp(_EXPECTED[v]) if v in _EXPECTED else pd.NaT for v in values],
+                     dtype="datetime64[ns]")
+
+
+@pytest.mark.parametrize("values", [_MIXED, _MIXED[::-1]], ids=["forward", "reversed"])
+def test_infer_parses_mixed_formats_independent_of_order(values):
+    result = parse_dates(pd.Series(values, dtype=object), [INFER])
+    pd.testing.assert_series_equal(result, _expected(values))
+
+
+@pytest.mark.parametrize("values", [
+    ["2018", "July 11, 2001", "July 2001"],
+    ["July 11, 2001", "July 2001", "2018"],
+], ids=["year-first", "date-first"])
+def test_imdb_formats_independent_of_order(values):
+    result = parse_dates(pd.Series(values), [INFER, "%B %Y", YEAR_ONLY])
+    expected = {"2018": "2018-01-01", "July 11, 2001": "2001-07-11", "July 2001": "2001-07-01"}
+    assert result.tolist() == [pd.Timestamp(expected[v]) for v in values]
+
+
+def test_formats_are_tried_in_order_and_rollover_applies():
+    values = pd.Series(["1-Jul-59", "1-Jul-05", "March 1994", "1994", "n/a", np.nan])
+    result = parse_dates(values, ["%d-%b-%y", "%B %Y", YEAR_ONLY], rollover_after=2025)
+    assert result.tolist() == [
+        pd.Timestamp("1959-07-01"), pd.Timestamp("2005-07-01"), pd.Timestamp("1994-03-01"),
+        pd.Timestamp("1994-01-01"), pd.NaT, pd.NaT,
+    ]
+
+
+def test_matches_row_wise_parsing_and_keeps_index():
+    values = pd.Series(["1994", "March 1994", "1994", None, "March 1994"], index=[10, 11, 12, 13, 14])
+    formats = ["%B %Y", YEAR_ONLY]
+    row_wise = parse_dates(values, formats)
+    one_by_one = [parse_dates(pd.Series([v]), formats).iloc[0] for v in values]
+    assert row_wise.index.tolist() == [10, 11, 12, 13, 14]
+    assert row_wise.tolist() == one_by_one
+
+
+def test_none_and_empty_input():
+    assert parse_dates(None, [INFER]).empty
+    result = parse_dates(pd.Series([None, np.nan], dtype=object), [INFER])
+    assert result.dtype == "datetime64[ns]" and result.isna().all()
+
+
+def _reference_metacritic(values: pd.Series) -> pd.Series:
+    """Bisherige Zeilenfunktion von MetacriticAdapter inkl. 100-Jahres-Korrektur."""
+    def _parse_date(val):
+        val = str(val).strip()
+        d = pd.to_datetime(val, format="%d-%b-%y", errors="coerce")
+        if pd.notna(d):
+            return d
+        m = pd.to_datetime(val, format="%B %Y", errors="coerce")
+        if pd.notna(m):
+            return m
+        if re.fullmatch(r"\d{4}", val):
+            return pd.to_datetime(f"{val}-01-01", errors="coerce")
+        return pd.NaT
+
+    parsed = values.apply(_parse_date).astype("datetime64[ns]")
+    late = parsed.dt.year > 2025
+    parsed[late] -= pd.DateOffset(years=100)
+    return parsed
+
+
+def test_metacritic_formats_match_previous_row_function():
+    rng = np.random.default_rng(3)
+    pool = ["1-Jul-59", " 12-Mar-05 ", "31-Dec-99", "January 1994", "march 2001", "1994",
+            "tbd", "", "Feb-2003", "2001-05-06", None, np.nan, "30-Feb-01"]
+    values = pd.Series(rng.choice(np.array(pool, dtype=object), 500), index=np.arange(500) * 2)
+    result = parse_dates(values, ["%d-%b-%y", "%B %Y", YEAR_ONLY], rollover_after=2025)
+    pd.testing.assert_series_equal(result, _reference_metacritic(values))
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import CapturingSink
+from transform.genres import as_genre_codes
+from transform.merge import ENTITY_UPDATES_OUT, build_long_frame, merge_long_frame
+from utils.entity_index import EntityIndex
+
+_TITLES = [f"film {i}" for i in range(60)]
+_GENRES = ["Drama", "Comedy", "Action", "Horror"]
+
+
+def _source(rng, n, id_col, rating_col, genre_col, scale, imdb_ids=False) -> pd.DataFrame:
+    df = pd.DataFrame({
+        id_col: pd.array(np.arange(1, n + 1), dtype="Int64"),
+        "title": rng.choice(_TITLES, n),
+        "year": pd.array(rng.integers(1990, 1996, n), dtype="Int64"),
+        genre_col: as_genre_codes(pd.Series(
+            [list(rng.choice(_GENRES, size=rng.integers(0, 3), replace=False)) for _ in range(n)])),
+        rating_col: pd.array(np.round(rng.random(n) * scale, 1), dtype="Float64"),
+    })
+    if imdb_ids:
+        ids = rng.integers(0, 40, n).astype(float)
+        ids[rng.random(n) < 0.5] = np.nan
+        df["imdb_id"] = pd.array(ids, dtype="Int64")
+    return df
+
+
+def _renumber(df: pd.DataFrame) -> pd.DataFrame:
+    """Zeilenbasierte IDs wie `BaseAdapter._next_ids` neu vergeben."""
+    id_col = next(c for c in df.columns if c.startswith("ID_"))
+    return df.reset_index(drop=True).assign(**{id_col: pd.array(np.arange(1, len(df) + 1), dtype="Int64")})
+
+
+@pytest.fixture
+def sources() -> list[pd.DataFrame]:
+    rng = np.random.default_rng(7)
+    return [
+        _source(rng, 120, "ID_IMDB", "rating_imdb", "genres", 10, imdb_ids=True),
+        _source(rng, 120, "ID_METACRITIC", "rating_metacritic", "genres", 100),
+        _source(rng, 120, "ID_MOVIELENS", "rating_movielens", "genres_ml", 5, imdb_ids=True),
+        _source(rng, 120, "ID_RT", "rating_rt_audience", "genres_rt", 100),
+    ]
+
+
+def _assert_incremental_matches_full(dfs, index) -> pd.DataFrame:
+    long_df = build_long_frame(dfs)
+    full_final, full_wide, _ = merge_long_frame(long_df)
+    sink = CapturingSink()
+    inc_final, inc_wide, _ = merge_long_frame(long_df, entity_index=index, sink=sink)
+    pd.testing.assert_frame_equal(inc_final.reset_index(drop=True), full_final.reset_index(drop=True))
+    pd.testing.assert_frame_equal(
+        inc_wide.reset_index(drop=True).assign(norm_title=inc_wide["norm_title"].astype(object)),
+        full_wide.reset_index(drop=True).assign(norm_title=full_wide["norm_title"].astype(object)),
+    )
+    return sink.frames[ENTITY_UPDATES_OUT]
+
+
+def test_incremental_merge_matches_full_merge(tmp_path, sources):
+    index = EntityIndex(tmp_path)
+    dfs = [_renumber(df) for df in sources]
+    assert _assert_incremental_matches_full(dfs, index).empty
+
+    # Einfügen oben (alle folgenden IDs verschieben sich) und Löschen weiter unten
+    top = dfs[1].iloc[[4]].assign(title="brand new film")
+    dfs[1] = _renumber(pd.concat([top, dfs[1].drop(index=17)]))
+    dfs[3] = _renumber(dfs[3].drop(index=[3, 50]))
+    updates = _assert_incremental_matches_full(dfs, index)
+    assert (updates["change"] == "new").any()
+
+    # Titel, den nur eine Quelle hat, vollständig löschen
+    unique_row = dfs[2].iloc[[0]].assign(title="before and after", imdb_id=pd.array([pd.NA], dtype="Int64"))
+    dfs[2] = _renumber(pd.concat([dfs[2], unique_row]))
+    _assert_incremental_matches_full(dfs, index)
+    dfs[2] = _renumber(dfs[2][dfs[2]["title"] != "before and after"])
+    updates = _assert_incremental_matches_full(dfs, index)
+    assert updates.loc[updates["change"] == "removed", "norm_title"].tolist() == ["before and after"]
+
+    # Reihenfolge ändern (Aggregation nimmt den ersten Wert in Eingabereihenfolge)
+    dfs[0] = _renumber(dfs[0].iloc[::-1])
+    _assert_incremental_matches_full(dfs, index)
+
+    # Unverändert: keine Updates
+    assert _assert_incremental_matches_full(dfs, index).empty
@@ -0,0 +1,75 @@
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from transform.genres import (
+    as_genre_codes,
+    concat_genre_frames,
+    genre_lists,
+    genre_vocabulary,
+    genres_multi_hot,
+    intern_genres,
+    with_genre_lists,
+)
+
+_RAW = ["Drama, Comedy", "Action|Thriller", " Horror ", "", ",", None, np.nan, "Drama,Comedy", "Comedy, Drama"]
+
+
+def _reference_lists(values: pd.Series, sep: str) -> list[list[str]]:
+    """Bisherige Listenbildung je Zeile (z. B. ImdbAdapter: re.split + strip, NA → [])."""
+    return [
+        [g.strip() for g in re.split(sep, str(v)) if g.strip()] if pd.notna(v) else []
+        for v in values
+    ]
+
+
+@pytest.mark.parametrize("sep", [",", "[|,]"])
+def test_intern_genres_matches_previous_lists(sep):
+    rng = np.random.default_rng(4)
+    values = pd.Series(rng.choice(np.array(_RAW, dtype=object), 300), index=np.arange(300) + 10)
+    interned = intern_genres(values, sep=sep)
+    assert isinstance(interned.dtype, pd.CategoricalDtype)
+    assert interned.index.equals(values.index)
+    assert genre_lists(interned).tolist() == _reference_lists(values, sep)
+
+
+def test_list_column_round_trip():
+    lists = pd.Series([["Drama", "Comedy"], [], ["Sci-Fi|Fantasy"], ["Drama", "Comedy"], None])
+    codes = as_genre_codes(lists)
+    assert len(codes.cat.categories) == 2
+    assert genre_lists(codes).tolist() == [["Drama", "Comedy"], [], ["Sci-Fi|Fantasy"], ["Drama", "Comedy"], []]
+    # Bereits kategoriale Spalten bleiben unverändert
+    assert as_genre_codes(codes) is codes
+
+
+def test_with_genre_lists_materializes_only_genre_columns():
+    df = pd.DataFrame({
+        "title": ["a", "b"],
+        "genres_ml": intern_genres(pd.Series(["Drama|Comedy", None]), sep="|"),
+        "kind": pd.Categorical(["x", "y"]),
+    })
+    out = with_genre_lists(df)
+    assert out["genres_ml"].tolist() == [["Drama", "Comedy"], []]
+    assert isinstance(out["kind"].dtype, pd.CategoricalDtype)
+    assert isinstance(df["genres_ml"].dtype, pd.CategoricalDtype)  # Eingabe unverändert
+    plain = df.drop(columns="genres_ml")
+    assert with_genre_lists(plain) is plain
+
+
+def test_concat_genre_frames_keeps_categorical_values():
+    a = pd.DataFrame({"genres": intern_genres(pd.Series(["Drama", "Comedy"]))})
+    b = pd.DataFrame({"genres": intern_genres(pd.Series(["Horror", None, "Drama"]))})
+    out = concat_genre_frames([a, b])
+    assert isinstance(out["genres"].dtype, pd.CategoricalDtype)
+    assert genre_lists(out["genres"]).tolist() == [["Drama"], ["Comedy"], ["Horror"], [], ["Drama"]]
+
+
+def test_multi_hot_matches_lists():
+    values = intern_genres(pd.Series(["Drama, Comedy", "", "Comedy", "Action, Drama"]))
+    vocabulary = genre_vocabulary(values)
+    assert vocabulary == ["Drama", "Comedy", "Action"]
+    dense = genres_multi_hot(values).sparse.to_dense()
+    expected = [[int(g in row) for g in vocabulary] for row in genre_lists(values)]
+    assert dense.to_numpy().tolist() == expected
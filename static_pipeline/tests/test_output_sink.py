@@ -0,0 +1,121 @@
+import ast
+import logging
+import threading
+
+import pandas as pd
+import pytest
+
+from conftest import CapturingSink
+from transform.genres import genre_lists, intern_genres
+from utils.output_sink import BackgroundSink, FileSink, OutputSink, make_sink
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        "norm_title": ["alien", "se7en", "up"],
+        "year": pd.array([1979, 1995, None], dtype="Int64"),
+        "rating": [8.5, 8.6, 8.3],
+        "genres": intern_genres(pd.Series(["Horror, Sci-Fi", None, "Animation"], index=[4, 7, 9])),
+    }, index=[4, 7, 9])
+
+
+def test_csv_writes_genres_as_lists(tmp_path):
+    FileSink(tmp_path, "csv").publish("wide", _frame())
+    out = pd.read_csv(tmp_path / "wide.csv")
+    assert out["norm_title"].tolist() == ["alien", "se7en", "up"]
+    assert [ast.literal_eval(g) for g in out["genres"]] == [["Horror", "Sci-Fi"], [], ["Animation"]]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+@pytest.mark.parametrize("fmt, reader", [("feather", pd.read_feather), ("parquet", pd.read_parquet)])
+def test_columnar_formats_round_trip(tmp_path, fmt, reader):
+    pytest.importorskip("pyarrow")
+    df = _frame()
+    FileSink(tmp_path, fmt).publish("wide", df)
+    out = reader(tmp_path / f"wide.{fmt}")
+    pd.testing.assert_frame_equal(out.drop(columns="genres"), df.drop(columns="genres").reset_index(drop=True))
+    assert isinstance(out["genres"].dtype, pd.CategoricalDtype)
+    assert genre_lists(out["genres"]).tolist() == genre_lists(df["genres"]).tolist()
+
+
+def test_write_failure_is_logged_and_keeps_old_file(tmp_path, caplog):
+    pytest.importorskip("pyarrow")
+    sink = FileSink(tmp_path, "parquet")
+    sink.publish("wide", _frame())
+    before = (tmp_path / "wide.parquet").read_bytes()
+
+    broken = pd.DataFrame({"mixed": [1, "a", object()]})
+    with caplog.at_level(logging.ERROR):
+        sink.publish("wide", broken)
+    assert "konnte nicht" in caplog.text
+    assert (tmp_path / "wide.parquet").read_bytes() == before
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        FileSink(tmp_path, "xlsx")
+
+
+def test_background_sink_writes_everything_before_close():
+    inner = CapturingSink()
+    frames = {f"part_{i}": _frame().assign(rating=float(i)) for i in range(10)}
+    with BackgroundSink(inner, max_pending=2) as sink:
+        for name, df in frames.items():
+            sink.publish(name, df)
+    assert list(inner.frames) == list(frames)
+    for name, df in frames.items():
+        pd.testing.assert_frame_equal(inner.frames[name], df)
+    with pytest.raises(RuntimeError):
+        sink.publish("late", _frame())
+
+
+def test_background_sink_survives_failing_inner(caplog):
+    class _Failing(CapturingSink):
+        def publish(self, name, df):
+            if name == "bad":
+                raise OSError("disk full")
+            super().publish(name, df)
+
+    inner = _Failing()
+    sink = BackgroundSink(inner)
+    with caplog.at_level(logging.ERROR):
+        sink.publish("bad", _frame())
+        sink.publish("good", _frame())
+        sink.close()
+    assert list(inner.frames) == ["good"]
+    assert "disk full" in caplog.text
+
+
+def test_background_publish_blocks_at_max_pending():
+    release = threading.Event()
+
+    class _Slow(CapturingSink):
+        def publish(self, name, df):
+            release.wait()
+            super().publish(name, df)
+
+    inner = _Slow()
+    sink = BackgroundSink(inner, max_pending=1)
+    sink.publish("a", _frame())       # wird vom Thread übernommen und blockiert dort
+    sink.publish("b", _frame())       # füllt die Warteschlange
+    blocked = threading.Thread(target=sink.publish, args=("c", _frame()))
+    blocked.start()
+    blocked.join(timeout=0.2)
+    assert blocked.is_alive()
+    release.set()
+    blocked.join()
+    sink.close()
+    assert list(inner.frames) == ["a", "b", "c"]
+
+
+def test_make_sink(tmp_path):
+    assert type(make_sink({"enabled": False}, tmp_path)) is OutputSink
+    default = make_sink(None, tmp_path)
+    assert isinstance(default, FileSink) and default.fmt == "csv"
+
+    background = make_sink({"background": True, "format": "csv", "max_pending": 1}, tmp_path)
+    assert isinstance(background, BackgroundSink) and isinstance(background.inner, FileSink)
+    background.publish("wide", _frame())
+    background.close()
+    assert (tmp_path / "wide.csv").exists()
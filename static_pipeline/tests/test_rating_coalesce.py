@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+
+from transform.rating_coalesce import coalesce_ratings, rating_candidate
+
+
+def _reference_metacritic(df: pd.DataFrame, columns: list[str]) -> pd.Series:
+    """Bisherige Zeilenfunktion `_best_rating` von MetacriticAdapter."""
+    def _best_rating(row):
+        for col in columns:
+            raw = row[col]
+            if isinstance(raw, str) and raw.lower() == "tbd":
+                continue
+            num = pd.to_numeric(raw, errors="coerce")
+            if pd.notna(num):
+                if "user" in col.lower() and num <= 10:
+                    num *= 10
+                return float(num)
+        return pd.NA
+
+    return df.apply(_best_rating, axis=1).astype("Float64")
+
+
+def test_metacritic_candidates_match_previous_row_function():
+    rng = np.random.default_rng(9)
+    n = 400
+    df = pd.DataFrame({
+        "metascore": rng.choice(np.array(["tbd", "TBD", "", None, "85", "12", "abc"], dtype=object), n),
+        "user_score": rng.choice(np.array(["tbd", "7.5", "10", "0", "55", None], dtype=object), n),
+        "critic_rating": rng.choice([np.nan, 40.0, 99.5], n),
+    })
+    columns = ["metascore", "user_score", "critic_rating"]
+    candidates = [
+        rating_candidate(col, sentinels=("tbd",), rescale_max=10 if "user" in col else None, rescale_factor=10)
+        for col in columns
+    ]
+    rating, winner = coalesce_ratings(df, candidates)
+    pd.testing.assert_series_equal(rating, _reference_metacritic(df, columns))
+
+    # Gewinnende Spalte = erste Spalte mit gültigem Wert
+    for i in range(n):
+        valid = [c for c in columns
+                 if not (isinstance(df.at[i, c], str) and df.at[i, c].lower() == "tbd")
+                 and pd.notna(pd.to_numeric(df.at[i, c], errors="coerce"))]
+        assert winner.iat[i] == (valid[0] if valid else None)
+
+
+def test_missing_columns_are_skipped_and_index_kept():
+    df = pd.DataFrame({"audience_rating": ["80", None, "x"]}, index=[5, 6, 7])
+    rating, winner = coalesce_ratings(df, [rating_candidate("tomatometer_rating"),
+                                           rating_candidate("audience_rating")])
+    assert rating.index.tolist() == [5, 6, 7]
+    assert rating.tolist()[0] == 80.0 and rating.isna().tolist() == [False, True, True]
+    assert winner.tolist() == ["audience_rating", None, None]
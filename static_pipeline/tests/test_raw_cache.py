@@ -0,0 +1,106 @@
+import os
+
+import pandas as pd
+import pytest
+
+from utils.csv_ingest import iter_csv_source, read_csv_source
+from utils.raw_cache import RawColumnarCache
+
+pytestmark = pytest.mark.skipif(not RawColumnarCache.available(), reason="pyarrow nicht installiert")
+
+_SCHEMA = {"title": "string", "year": "int64", "rating": "float64"}
+_CSV = "title,year,rating\nA,2000,7.5\nB,2001,6.0\nC,2002,8.1,extra\nD,2003,5.5\nE,2004,\n"
+
+
+class _SpyCache(RawColumnarCache):
+    """Zählt Treffer/Fehlschläge von load()."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path, variant):
+        result = super().load(path, variant)
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+
+def _write(path, text, mtime_ns):
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def _read(path, cache):
+    bad: list[dict] = []
+    df = read_csv_source(path, schema=_SCHEMA, on_bad_line=bad.append, engine="pyarrow", cache=cache)
+    return df, bad
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "ratings.csv"
+    _write(path, _CSV, 1_000_000_000)
+    return path
+
+
+def test_second_read_hits_cache_with_identical_result(tmp_path, csv_path):
+    expected, expected_bad = _read(csv_path, None)
+    assert len(expected_bad) == 1
+
+    cache = _SpyCache(tmp_path / "cache")
+    first, first_bad = _read(csv_path, cache)
+    second, second_bad = _read(csv_path, cache)
+    assert (cache.misses, cache.hits) == (1, 1)
+    for df, bad in ((first, first_bad), (second, second_bad)):
+        pd.testing.assert_frame_equal(df, expected)
+        # Fehlerhafte Zeilen werden auch bei einem Treffer erneut gemeldet
+        assert bad == expected_bad
+
+
+def test_chunked_read_fills_and_hits_cache(tmp_path, csv_path):
+    expected, expected_bad = _read(csv_path, None)
+    cache = _SpyCache(tmp_path / "cache")
+    for _ in range(2):
+        bad: list[dict] = []
+        chunks = list(iter_csv_source(csv_path, 2, schema=_SCHEMA, on_bad_line=bad.append,
+                                      engine="pyarrow", cache=cache))
+        assert all(len(c) <= 2 for c in chunks)
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
+        assert bad == expected_bad
+    assert (cache.misses, cache.hits) == (1, 1)
+    # Voll- und Blockmodus teilen sich den Eintrag
+    _read(csv_path, cache)
+    assert cache.hits == 2
+
+
+def test_changed_csv_invalidates_entry(tmp_path, csv_path):
+    cache = _SpyCache(tmp_path / "cache")
+    _read(csv_path, cache)
+    _write(csv_path, _CSV.replace("A,2000,7.5", "Z,1999,1.5"), 2_000_000_000)
+    df, _ = _read(csv_path, cache)
+    assert (cache.misses, cache.hits) == (2, 0)
+    assert df["title"].iloc[0] == "Z"
+    # Andere Lesevariante (Spaltenauswahl) → eigener Eintrag
+    read_csv_source(csv_path, schema={"title": "string"}, engine="pyarrow", cache=cache)
+    assert cache.misses == 3
+
+
+def test_evict_by_age_and_size(tmp_path, csv_path):
+    cache = RawColumnarCache(tmp_path / "cache", max_age_days=1)
+    _read(csv_path, cache)
+    entries = list((tmp_path / "cache").glob("*.arrow"))
+    assert len(entries) == 1
+    old = 1_000_000_000
+    os.utime(entries[0], (old, old))
+    cache.evict()
+    assert not list((tmp_path / "cache").glob("*.arrow"))
+    assert not list((tmp_path / "cache").glob("*.json"))
+
+    cache = RawColumnarCache(tmp_path / "cache", max_size_mb=1e-6)
+    _read(csv_path, cache)
+    cache.evict()
+    assert not list((tmp_path / "cache").glob("*.arrow"))
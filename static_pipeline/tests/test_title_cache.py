@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from transform.normalize import RULES_VERSION, normalize_film_title, normalize_titles
+from utils.title_cache import TitleCache, normalize_cached, rules_version
+
+pytestmark = pytest.mark.skipif(not TitleCache.available(), reason="pyarrow nicht installiert")
+
+_TITLES = pd.Series(
+    ["The Matrix (1999)", "Amélie", "  Alien: Director's Cut ", None, "The Matrix (1999)", "", "Se7en"],
+    index=np.arange(7) * 3,
+)
+
+
+def test_normalize_titles_with_cache_matches_uncached(tmp_path):
+    expected = normalize_titles(_TITLES)
+    assert expected.tolist() == [normalize_film_title(t) if t is not None else "" for t in _TITLES]
+
+    cache = TitleCache(tmp_path)
+    first = normalize_titles(_TITLES, cache=cache)
+    cache.flush()
+    second = normalize_titles(_TITLES, cache=TitleCache(tmp_path))
+    pd.testing.assert_series_equal(first, expected)
+    pd.testing.assert_series_equal(second, expected)
+
+
+def test_hit_after_flush_and_rules_version_miss(tmp_path):
+    cache = TitleCache(tmp_path)
+    cache.store(RULES_VERSION, ["Se7en"], ["cached value"])
+    # Vorgemerkte Einträge sind schon vor flush() sichtbar
+    assert cache.lookup(RULES_VERSION, ["Se7en", "Alien"]).tolist() == ["cached value", None]
+    cache.flush()
+
+    reopened = TitleCache(tmp_path)
+    assert reopened.lookup(RULES_VERSION, ["Se7en"]).tolist() == ["cached value"]
+    # Treffer werden übernommen statt neu normalisiert
+    assert normalize_titles(pd.Series(["Se7en"]), cache=reopened).tolist() == ["cached value"]
+    # Andere Regelversion → eigene Datei, kein Treffer
+    assert reopened.lookup("other-rules", ["Se7en"]).tolist() == [None]
+
+
+def test_normalize_cached_calls_normalizer_once_per_new_title(tmp_path):
+    calls: list = []
+
+    def normalizer(title):
+        calls.append(title)
+        return str(title).lower()
+
+    values = pd.Series(["A", "B", "A", None])
+    out = normalize_cached(values, normalizer, TitleCache(tmp_path))
+    assert out.tolist() == ["a", "b", "a", "nan"]
+    assert sorted(c for c in calls if isinstance(c, str)) == ["A", "B"]
+
+    calls.clear()
+    out = normalize_cached(pd.Series(["B", "C"]), normalizer, TitleCache(tmp_path))
+    assert out.tolist() == ["b", "c"]
+    assert calls == ["C"]
+    assert (tmp_path / f"titles_{rules_version(normalizer)}.arrow").exists()
+
+
+def test_flush_keeps_most_recent_entries(tmp_path):
+    cache = TitleCache(tmp_path, max_entries=2)
+    cache.store("r", ["old"], ["o"])
+    cache.flush()
+    cache.store("r", ["new1", "new2"], ["n1", "n2"])
+    cache.flush()
+    assert TitleCache(tmp_path).lookup("r", ["old", "new1", "new2"]).tolist() == [None, "n1", "n2"]
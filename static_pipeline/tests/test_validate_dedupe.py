@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from adapters.adapters.metacritic_adapter import MetacriticAdapter
+
+
+@pytest.fixture
+def adapter() -> MetacriticAdapter:
+    return MetacriticAdapter({"file_path": "unused.csv"})
+
+
+@pytest.mark.parametrize("dtype", [object, "string", "string[pyarrow]"])
+def test_string_dtypes_are_validated_like_object(adapter, dtype):
+    df = pd.DataFrame({
+        "title": pd.Series(["Heat", "  ", None, "heat", "Alien"], dtype=dtype),
+        "year": [1995, 1995, 1995, 1995, 1700],
+    })
+    reason, duplicate, invalid = adapter._validate_and_dedupe(df)
+    assert reason.tolist() == [None, "empty title", "empty title", None, "invalid year"]
+    assert duplicate.tolist() == [False, False, False, True, False]
+    assert invalid.tolist() == [False, True, True, False, True]
+
+
+def _reference(df: pd.DataFrame, with_rating: bool) -> tuple[list, list, list]:
+    """Bisherige Zeilenschleife der Adapter (z. B. MetacriticAdapter.transform)."""
+    seen_keys: set = set()
+    reasons, duplicates, invalids = [], [], []
+    for _, row in df.iterrows():
+        reason = None
+        title = row["title"]
+        if not isinstance(title, str) or not title.strip():
+            reason = "empty title"
+        year = row["year"]
+        if pd.isna(year) or not (1870 <= year <= 2025):
+            reason = reason or "invalid year"
+        if with_rating and pd.isna(row["rating"]):
+            reason = reason or "missing rating"
+        key = (title.lower(), int(year) if pd.notna(year) else None)
+        if key in seen_keys:
+            reasons.append(None)
+            duplicates.append(True)
+            invalids.append(False)
+            continue
+        seen_keys.add(key)
+        reasons.append(reason)
+        duplicates.append(False)
+        invalids.append(reason is not None)
+    return reasons, duplicates, invalids
+
+
+@pytest.mark.parametrize("with_rating", [False, True])
+@pytest.mark.parametrize("chunksize", [7, 1000])
+def test_matches_previous_row_loop_across_chunks(adapter, with_rating, chunksize):
+    rng = np.random.default_rng(5)
+    n = 600
+    df = pd.DataFrame({
+        "title": rng.choice(["Heat", "heat", "HEAT ", "Alien", "  ", "", "Up"], n),
+        "year": pd.array(rng.choice([1995, 1996, 1700, 2030, -1], n), dtype="Int64"),
+        "rating": pd.array(np.where(rng.random(n) < 0.2, np.nan, rng.random(n)), dtype="Float64"),
+    })
+    df.loc[df["year"] == -1, "year"] = pd.NA
+    expected = _reference(df, with_rating)
+
+    adapter.begin_stream()
+    reasons, duplicates, invalids = [], [], []
+    for start in range(0, n, chunksize):
+        chunk = df.iloc[start:start + chunksize]
+        reason, duplicate, invalid = adapter._validate_and_dedupe(
+            chunk, rating=chunk["rating"] if with_rating else None)
+        reasons += reason.where(invalid, None).tolist()
+        duplicates += duplicate.tolist()
+        invalids += invalid.tolist()
+    assert (reasons, duplicates, invalids) == expected
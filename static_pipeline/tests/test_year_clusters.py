@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from transform.merge import year_cluster, year_clusters
+
+
+# Bisherige Implementierung (Zeilenschleife je Titel) als Referenz
+def _reference_cluster_years(unique_years: list[int]) -> dict[int, int]:
+    clusters: list[list[int]] = []
+    mapping: dict[int, int] = {}
+    for y in sorted(unique_years):
+        placed = False
+        for cid, members in enumerate(clusters):
+            if any(abs(y - m) <= 1 for m in members):
+                members.append(y)
+                mapping[y] = cid
+                placed = True
+                break
+        if not placed:
+            clusters.append([y])
+            mapping[y] = len(clusters) - 1
+    return mapping
+
+
+def _reference_year_cluster(series: pd.Series) -> pd.Series:
+    years = [int(y) for y in series.dropna()]
+    mapping = _reference_cluster_years(years)
+    next_id = (max(mapping.values()) + 1) if mapping else 0
+    return series.map(mapping).fillna(next_id).astype(int)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_year_clusters_match_reference(seed):
+    rng = np.random.default_rng(seed)
+    n = 2000
+    titles = pd.Series(rng.choice([f"t{i}" for i in range(150)], n))
+    years = pd.Series(pd.array(rng.integers(1990, 2005, n), dtype="Int32"))
+    years[rng.random(n) < 0.05] = pd.NA
+    long_df = pd.DataFrame({"norm_title": titles, "release_year": years})
+
+    expected = long_df.groupby("norm_title", group_keys=False)["release_year"].apply(_reference_year_cluster)
+    result = year_clusters(long_df["norm_title"], long_df["release_year"])
+    pd.testing.assert_series_equal(result, expected.reindex(long_df.index).astype("int64"), check_names=False)
+
+
+def test_year_cluster_single_title():
+    years = pd.Series([2001, 1999, None, 2000, 2005, 2006, 1990], dtype="Float64")
+    # 1990 | 1999–2001 | 2005–2006 | ohne Jahr
+    assert year_cluster(years).tolist() == [1, 1, 3, 1, 2, 2, 0]
+    assert year_cluster(years).tolist() == _reference_year_cluster(years).tolist()
+
+
+def test_titles_without_years_get_cluster_zero():
+    titles = pd.Series(["a", "a", "b"])
+    years = pd.Series([None, None, 1999], dtype="Float64")
+    assert year_clusters(titles, years).tolist() == [0, 0, 0]
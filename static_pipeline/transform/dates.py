@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+from typing import Sequence
+
+# Sonderformate neben strftime-Formaten
+INFER = "infer"       # pd.to_datetime mit format="mixed" (Format je Wert, unabhängig von der Reihenfolge)
+YEAR_ONLY = "year"    # reines Jahr "1994" → 1994-01-01
+
+_YEAR_PATTERN = r"\d{4}"
+
+
+def _parse_step(text: pd.Series, raw: pd.Series, fmt: str) -> pd.Series:
+    """Ein Formatversuch, vektorisiert auf den noch offenen Werten."""
+    if fmt == INFER:
+        # Rohwerte direkt an pd.to_datetime; "mixed" leitet das Format je Wert ab –
+        # ohne würde das Format des ersten Werts für alle gelten, und das Ergebnis
+        # hinge von der Reihenfolge (bzw. im Blockmodus von den Blockgrenzen) ab
+        return pd.to_datetime(raw, format="mixed", errors="coerce")
+    if fmt == YEAR_ONLY:
+        years = text.where(text.str.fullmatch(_YEAR_PATTERN, na=False))
+        return pd.to_datetime(years + "-01-01", format="%Y-%m-%d", errors="coerce")
+    return pd.to_datetime(text, format=fmt, errors="coerce")
+
+
+def parse_dates(
+    values: pd.Series | None,
+    formats: Sequence[str],
+    rollover_after: int | None = None,
+) -> pd.Series:
+    """
+    Mehrformat-Datumsparser mit Memoisierung je eindeutigem Rohwert.
+
+    - Jeder verschiedene Rohwert wird genau einmal geparst (pd.factorize),
+      das Ergebnis anschließend per Index auf alle Zeilen verteilt.
+    - Die Formate werden der Reihe nach ausprobiert, jeweils vektorisiert auf
+      den Werten, die noch kein Datum haben. Explizite Formate und YEAR_ONLY
+      arbeiten auf dem getrimmten String, INFER auf dem Rohwert (Format je
+      Wert, das Ergebnis hängt also nicht von der Reihenfolge der Werte ab).
+      INFER ist für Nicht-ISO-Texte deutlich langsamer als explizite Formate;
+      bekannte Formate daher vor INFER angeben.
+    - rollover_after: Zweistellige Jahresrollen korrigieren – Datumswerte mit
+      Jahr > rollover_after werden um 100 Jahre zurückgesetzt ("1-Jul-59" →
+      1959 statt 2059).
+
+    Args:
+        values: Rohwerte (Strings, NaN, …); None → leere/NaT-Series.
+        formats: Reihenfolge der Formatversuche (strftime-Formate, INFER, YEAR_ONLY).
+        rollover_after: Grenzjahr für die 100-Jahres-Korrektur oder None.
+
+    Returns:
+        datetime64[ns]-Series mit dem Index von `values` (NaT, wenn kein
+        Format passt oder der Rohwert fehlt).
+    """
+    if values is None:
+        return pd.Series(dtype="datetime64[ns]")
+
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    if len(uniques) == 0:
+        return pd.Series(pd.NaT, index=values.index, dtype="datetime64[ns]")
+    raw = pd.Series(uniques, dtype=object)
+    text = raw.astype(str).str.strip()
+
+    parsed = pd.Series(pd.NaT, index=raw.index, dtype="datetime64[ns]")
+    open_mask = pd.Series(True, index=raw.index)
+    for fmt in formats:
+        if not open_mask.any():
+            break
+        result = _parse_step(text[open_mask], raw[open_mask], fmt)
+        hit = result.notna()
+        parsed[result.index[hit]] = result[hit].astype("datetime64[ns]")
+        open_mask &= parsed.isna()
+
+    if rollover_after is not None:
+        too_late = parsed.dt.year > rollover_after
+        if too_late.any():
+            parsed[too_late] = parsed[too_late] - pd.DateOffset(years=100)
+
+    # Zurück auf alle Zeilen verteilen; fehlende Rohwerte (Code -1) → NaT
+    per_row = parsed.to_numpy()[codes]
+    per_row[codes < 0] = np.datetime64("NaT")
+    return pd.Series(per_row, index=values.index, dtype="datetime64[ns]")
@@ -0,0 +1,277 @@
+import numpy as np
+import pandas as pd
+
+# Primzahl für die MinHash-Familie h(x) = (a·x + b) mod p (Werte < 2^31)
+_MINHASH_PRIME = (1 << 31) - 1
+
+
+# ------------------------------------------------------------ #
+# Unscharfer Titelabgleich mit LSH-Blocking                    #
+# ------------------------------------------------------------ #
+#
+# Einträge sind die verschiedenen (norm_title, Jahr)-Paare des Long-Frames.
+# Je Titel entsteht die Menge seiner Zeichen-n-Gramme (Leerzeichen entfernt,
+# "spider man" ≙ "spiderman"), daraus eine MinHash-Signatur in `bands`
+# Bändern à `rows_per_band` Werten. Kandidaten sind Einträge, die in
+# mindestens einem Band denselben Bucket teilen UND deren Jahre höchstens
+# `year_window` auseinanderliegen (Eintrag wird dazu in die Jahres-Bins
+# y … y+year_window gelegt). Nur Kandidaten werden exakt verglichen
+# (Jaccard der n-Gramm-Mengen) – Aufwand linear in Einträgen + Kandidaten
+# statt O(n²).
+
+def _shingles(titles: np.ndarray, ngram: int) -> tuple[np.ndarray, np.ndarray, int]:
+    """
+    n-Gramm-Mengen je Titel (ohne Leerzeichen; kürzere Titel = ein n-Gramm).
+
+    Returns:
+        (Titelposition je n-Gramm, n-Gramm-Code je n-Gramm, Anzahl Codes);
+        sortiert nach (Titel, Code), ohne Wiederholungen je Titel.
+    """
+    owners: list[int] = []
+    grams: list[str] = []
+    for i, title in enumerate(titles):
+        compact = title.replace(" ", "")
+        parts = {compact[k:k + ngram] for k in range(max(1, len(compact) - ngram + 1))}
+        owners.extend([i] * len(parts))
+        grams.extend(parts)
+    codes, uniques = pd.factorize(pd.Series(grams, dtype=object))
+    owner = np.asarray(owners, dtype="int64")
+    order = np.lexsort((codes, owner))
+    return owner[order], codes[order].astype("int64"), len(uniques)
+
+
+def _band_keys(owner: np.ndarray, codes: np.ndarray, n_titles: int,
+               bands: int, rows_per_band: int, seed: int):
+    """Bucket-Schlüssel (uint64) je Titel und Band, Band für Band berechnet."""
+    rng = np.random.default_rng(seed)
+    starts = np.flatnonzero(np.r_[True, owner[1:] != owner[:-1]])
+    x = codes.astype("uint64")
+    for _ in range(bands):
+        minima = np.empty((n_titles, rows_per_band), dtype="uint64")
+        for r in range(rows_per_band):
+            a, b = rng.integers(1, _MINHASH_PRIME, 2, dtype="int64").astype("uint64")
+            minima[owner[starts], r] = np.minimum.reduceat((a * x + b) % _MINHASH_PRIME, starts)
+        yield pd.util.hash_pandas_object(pd.DataFrame(minima), index=False).to_numpy()
+
+
+def _bucket_pairs(bucket: np.ndarray, members: np.ndarray, max_bucket: int) -> tuple[np.ndarray, np.ndarray, int]:
+    """
+    Alle Paare von `members` innerhalb gleicher Buckets (Buckets mit mehr als
+    `max_bucket` Einträgen werden übersprungen).
+
+    Returns:
+        (linke Einträge, rechte Einträge, Anzahl übersprungener Buckets)
+    """
+    order = np.argsort(bucket, kind="stable")
+    bucket, members = bucket[order], members[order]
+    run_start = np.r_[True, bucket[1:] != bucket[:-1]]
+    run_id = np.cumsum(run_start) - 1
+    run_size = np.bincount(run_id)[run_id]
+    oversized = int(((run_size > max_bucket) & run_start).sum())
+    keep = (run_size >= 2) & (run_size <= max_bucket)
+    run_id, run_size, members = run_id[keep], run_size[keep], members[keep]
+
+    left, right = [], []
+    d = 1
+    while len(run_id) > d:
+        # Partner im Abstand d innerhalb desselben Buckets
+        same = run_id[:-d] == run_id[d:]
+        left.append(members[:-d][same])
+        right.append(members[d:][same])
+        d += 1
+        # Nur Buckets mit mehr als d Einträgen haben noch Partner im Abstand d
+        longer = run_size > d
+        run_id, run_size, members = run_id[longer], run_size[longer], members[longer]
+    if not left:
+        return np.empty(0, dtype="int64"), np.empty(0, dtype="int64"), oversized
+    return np.concatenate(left), np.concatenate(right), oversized
+
+
+def _jaccard(owner: np.ndarray, codes: np.ndarray, n_codes: int, n_titles: int,
+             ti: np.ndarray, tj: np.ndarray, min_similarity: float = 0.0,
+             chunk_size: int = 250_000) -> np.ndarray:
+    """
+    Exakte Jaccard-Ähnlichkeit der n-Gramm-Mengen für die Titelpaare (ti, tj).
+
+    Paare, deren Mengengrößen schon keine Ähnlichkeit ≥ `min_similarity`
+    zulassen (|A ∩ B| / |A ∪ B| ≤ min(|A|, |B|) / max(|A|, |B|)), werden
+    nicht verglichen und erhalten 0.
+    """
+    starts = np.searchsorted(owner, np.arange(n_titles + 1))
+    counts = np.diff(starts)
+    lookup = pd.Index(owner * n_codes + codes)  # eindeutig je (Titel, n-Gramm)
+
+    similarity = np.zeros(len(ti), dtype="float64")
+    n_i, n_j = counts[ti], counts[tj]
+    todo = np.flatnonzero(np.minimum(n_i, n_j) >= min_similarity * np.maximum(n_i, n_j))
+    for lo in range(0, len(todo), chunk_size):
+        chunk = todo[lo:lo + chunk_size]
+        # n-Gramme des kleineren Titels je Paar ausrollen und im größeren nachschlagen
+        swap = n_i[chunk] > n_j[chunk]
+        small, large = np.where(swap, tj[chunk], ti[chunk]), np.where(swap, ti[chunk], tj[chunk])
+        n_small = counts[small]
+        pair = np.repeat(np.arange(len(chunk)), n_small)
+        offset = np.arange(int(n_small.sum())) - np.repeat(np.cumsum(n_small) - n_small, n_small)
+        probe = large[pair] * n_codes + codes[starts[small][pair] + offset]
+        shared = np.bincount(pair, weights=lookup.get_indexer(probe) >= 0, minlength=len(chunk))
+        similarity[chunk] = shared / (n_small + counts[large] - shared)
+    return similarity
+
+
+def _components(n: int, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Zusammenhangskomponenten (kleinste Position je Komponente) per Label-Propagation."""
+    labels = np.arange(n)
+    while True:
+        low = np.minimum(labels[left], labels[right])
+        np.minimum.at(labels, left, low)
+        np.minimum.at(labels, right, low)
+        labels = labels[labels]
+        if (labels[left] == labels[right]).all():
+            return labels
+
+
+def fuzzy_title_clusters(
+    titles: pd.Series,
+    years: pd.Series,
+    threshold: float = 0.9,
+    review_threshold: float = 0.7,
+    year_window: int = 1,
+    ngram: int = 3,
+    bands: int = 20,
+    rows_per_band: int = 3,
+    max_bucket: int = 100,
+    seed: int = 42,
+) -> tuple[pd.Series, pd.DataFrame, pd.DataFrame]:
+    """
+    Fasst nahezu gleiche Titel ("spider man" / "spiderman") im Jahresfenster zusammen.
+
+    Kandidatenpaare entstehen per MinHash-LSH über Zeichen-n-Gramme (siehe
+    oben); Paare verschiedener Titel mit Jaccard ≥ `threshold` werden
+    verbunden, die Zusammenhangskomponenten erhalten den häufigsten Titel
+    (Gleichstand: längster, dann zuerst vorkommender). Zeilen ohne Jahr oder
+    Titel bleiben unverändert.
+
+    Args:
+        titles: norm_title je Zeile.
+        years: Jahr je Zeile.
+        threshold: Mindest-Jaccard für eine Zusammenführung.
+        review_threshold: Paare mit review_threshold ≤ Jaccard < threshold
+                          landen in der Prüfliste (nicht zusammengeführt).
+        year_window: maximaler Jahresabstand eines Kandidatenpaars.
+        ngram: Länge der Zeichen-n-Gramme.
+        bands, rows_per_band: LSH-Bänder × Hashes je Band; Paare mit Jaccard s
+                              werden mit Wahrscheinlichkeit 1-(1-s^r)^b Kandidaten.
+        max_bucket: größere Buckets (sehr kurze/generische Titel) werden
+                    übersprungen, damit die Paaranzahl linear bleibt.
+        seed: Seed der MinHash-Funktionen (gleicher Seed → gleiches Ergebnis).
+
+    Returns:
+        (kanonischer Titel je Zeile mit dem Index von `titles`,
+         Cluster: fuzzy_cluster, norm_title, release_year, rows, canonical_title
+         je Eintrag in Komponenten mit ≥ 2 Titeln,
+         Prüfliste: title_a, year_a, title_b, year_b, similarity)
+    """
+    empty_clusters = pd.DataFrame(columns=["fuzzy_cluster", "norm_title", "release_year", "rows", "canonical_title"])
+    empty_review = pd.DataFrame(columns=["title_a", "year_a", "title_b", "year_b", "similarity"])
+    title_values = titles.astype(object).to_numpy()
+    year_values = pd.to_numeric(years, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    usable = ~np.isnan(year_values) & pd.Series(title_values).fillna("").astype(bool).to_numpy()
+    if usable.sum() < 2:
+        return pd.Series(title_values, index=titles.index), empty_clusters, empty_review
+
+    # Einträge = verschiedene (Titel, Jahr) mit Zeilenzahl und erstem Vorkommen
+    rows = np.flatnonzero(usable)
+    entries = (
+        pd.DataFrame({"title": title_values[rows], "year": year_values[rows].astype("int64"), "position": rows})
+          .groupby(["title", "year"], sort=False)["position"].agg(["size", "min"])
+          .reset_index()
+    )
+    title_codes, unique_titles = pd.factorize(entries["title"])
+    owner, codes, n_codes = _shingles(np.asarray(unique_titles, dtype=object), ngram)
+
+    # Kandidaten: gleicher Bucket in einem Band und gemeinsamer Jahres-Bin
+    entry_ids = np.tile(np.arange(len(entries)), year_window + 1)
+    year_bins = (entries["year"].to_numpy()[:, None] + np.arange(year_window + 1)).T.ravel()
+    # Je Band: Kandidaten → Größenfilter → noch nicht verglichene Titelpaare
+    # exakt vergleichen; behalten werden nur Paare ≥ min_similarity. Alle
+    # Eintragspaare eines Titelpaars fallen im selben Band an (Band-Schlüssel
+    # je Titel), daher genügt der Vergleich im ersten Band des Titelpaars.
+    min_similarity = min(review_threshold, threshold)
+    n_entries, n_titles = len(entries), len(unique_titles)
+    n_shingles = np.bincount(owner, minlength=n_titles)
+    checked = np.empty(0, dtype="int64")
+    found_entries, found_titles, found_similarity, skipped = [], [], [], 0
+    for band_key in _band_keys(owner, codes, n_titles, bands, rows_per_band, seed):
+        bucket = pd.util.hash_pandas_object(
+            pd.DataFrame({"band": band_key[title_codes][entry_ids], "bin": year_bins}), index=False).to_numpy()
+        a, b, oversized = _bucket_pairs(bucket, entry_ids, max_bucket)
+        skipped += oversized
+        ta, tb = np.minimum(title_codes[a], title_codes[b]), np.maximum(title_codes[a], title_codes[b])
+        size_a, size_b = n_shingles[ta], n_shingles[tb]
+        keep = (ta != tb) & (np.minimum(size_a, size_b) >= min_similarity * np.maximum(size_a, size_b))
+        title_key = ta[keep] * n_titles + tb[keep]
+        entry_key = np.minimum(a, b)[keep] * n_entries + np.maximum(a, b)[keep]
+        fresh = np.unique(title_key)
+        fresh = fresh[~np.isin(fresh, checked, assume_unique=True)]
+        checked = np.union1d(checked, fresh)
+        similarity = _jaccard(owner, codes, n_codes, n_titles, fresh // n_titles, fresh % n_titles, min_similarity)
+        similar = fresh[similarity >= min_similarity]
+        found_titles.append(similar)
+        found_similarity.append(similarity[similarity >= min_similarity])
+        found_entries.append(np.unique(entry_key[np.isin(title_key, similar)]))
+
+    pair_keys = np.concatenate(found_entries)
+    a, b = pair_keys // n_entries, pair_keys % n_entries
+    similar_titles = np.concatenate(found_titles)
+    order = np.argsort(similar_titles)
+    title_key = np.minimum(title_codes[a], title_codes[b]) * n_titles + np.maximum(title_codes[a], title_codes[b])
+    similarity = np.concatenate(found_similarity)[order][np.searchsorted(similar_titles[order], title_key)]
+    if skipped:
+        print(f"⚠️ Fuzzy-Matching: {skipped} übergroße Buckets (> {max_bucket} Einträge) übersprungen")
+
+    review_mask = (similarity >= review_threshold) & (similarity < threshold)
+    review = pd.DataFrame({
+        "title_a": entries["title"].to_numpy()[a[review_mask]],
+        "year_a": entries["year"].to_numpy()[a[review_mask]],
+        "title_b": entries["title"].to_numpy()[b[review_mask]],
+        "year_b": entries["year"].to_numpy()[b[review_mask]],
+        "similarity": similarity[review_mask].round(4),
+    }).sort_values(["similarity", "title_a", "title_b"], ascending=[False, True, True], kind="stable")
+
+    merge_mask = similarity >= threshold
+    if not merge_mask.any():
+        return pd.Series(title_values, index=titles.index), empty_clusters, review.reset_index(drop=True)
+
+    # Komponenten und kanonischer Titel: Anzahl ↓, Länge ↓, erstes Vorkommen ↑
+    entries["component"] = _components(len(entries), a[merge_mask], b[merge_mask])
+    title_stats = (
+        entries.groupby(["component", "title"], sort=False)
+               .agg(count=("size", "sum"), first=("min", "min"))
+               .reset_index()
+    )
+    title_stats["length"] = title_stats["title"].str.len()
+    best = (
+        title_stats.sort_values(["component", "count", "length", "first"],
+                                ascending=[True, False, False, True], kind="stable")
+                   .drop_duplicates("component")
+                   .set_index("component")["title"]
+    )
+    entries["canonical_title"] = best.reindex(entries["component"]).to_numpy()
+    titles_per_component = entries.groupby("component")["title"].transform("nunique")
+    clustered = entries[titles_per_component >= 2]
+
+    # Kanonischen Titel auf die Zeilen zurückverteilen
+    canonical = title_values.copy()
+    lookup = pd.MultiIndex.from_frame(clustered[["title", "year"]]).get_indexer(
+        pd.MultiIndex.from_arrays([title_values[rows], year_values[rows].astype("int64")]))
+    hit = lookup >= 0
+    canonical[rows[hit]] = clustered["canonical_title"].to_numpy()[lookup[hit]]
+
+    clusters = (
+        clustered.rename(columns={"component": "fuzzy_cluster", "title": "norm_title",
+                                  "year": "release_year", "size": "rows"})
+                 [["fuzzy_cluster", "norm_title", "release_year", "rows", "canonical_title"]]
+                 .sort_values(["fuzzy_cluster", "rows"], ascending=[True, False], kind="stable")
+                 .reset_index(drop=True)
+    )
+    return pd.Series(canonical, index=titles.index), clusters, review.reset_index(drop=True)
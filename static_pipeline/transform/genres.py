@@ -0,0 +1,165 @@
+import re
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+# Trennzeichen im internen Schlüssel einer Genre-Kombination ("Drama\x1fComedy");
+# ein Steuerzeichen, damit Genres mit "|" oder "," (bei anderem `sep`) ganz bleiben
+GENRE_SEP = "\x1f"
+
+
+# ------------------------------------------------------------ #
+# Interne Darstellung: internierte Genre-Kombinationen          #
+# ------------------------------------------------------------ #
+#
+# Eine Genre-Spalte ist eine kategoriale Series: jede Kategorie ist eine
+# Genre-Kombination in Quellreihenfolge (Schlüssel mit GENRE_SEP), je Zeile bleibt nur
+# ein Integer-Code. Leere Genre-Listen sind NaN. Die Spalte ist hashbar
+# (drop_duplicates, groupby.first), Listen entstehen erst bei der Ausgabe.
+
+def intern_genres(values: pd.Series | None, sep: str = ",", index: pd.Index | None = None) -> pd.Series:
+    """
+    Roh-Genres ("Comedy, Drama") → kategoriale Genre-Spalte.
+
+    Jeder verschiedene Rohwert wird genau einmal zerlegt (pd.factorize);
+    Einträge werden getrimmt, leere Einträge verworfen, die Reihenfolge bleibt
+    erhalten. NA, "" und reine Trennzeichen → NaN (keine Genres).
+
+    Args:
+        values: Rohwerte; None → Spalte ohne Genres (erfordert `index`).
+        sep: Trennzeichen bzw. Regex-Zeichenklasse (z. B. "[|,]").
+        index: Index für den Fall values=None.
+    """
+    if values is None:
+        return empty_genres(index if index is not None else pd.RangeIndex(0))
+
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    splitter = re.compile(sep) if len(sep) > 1 else None
+    keys = []
+    for raw in uniques:
+        parts = splitter.split(str(raw)) if splitter else str(raw).split(sep)
+        parts = [p.strip() for p in parts if p.strip()]
+        keys.append(GENRE_SEP.join(parts) if parts else None)
+    return _from_unique_keys(codes, keys, values.index)
+
+
+def as_genre_codes(values: pd.Series) -> pd.Series:
+    """
+    Bringt eine Genre-Spalte in die interne Darstellung.
+
+    Bereits kategoriale Spalten bleiben unverändert; Listen-Spalten (alte
+    Cache-/Checkpoint-Stände, externe Adapter) werden interniert.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values
+    keys = values.map(lambda g: GENRE_SEP.join(g) if isinstance(g, (list, tuple)) and g else None)
+    codes, uniques = pd.factorize(keys, use_na_sentinel=True)
+    return _from_unique_keys(codes, list(uniques), values.index)
+
+
+def empty_genres(index: pd.Index) -> pd.Series:
+    """Genre-Spalte ohne Einträge (alle NaN)."""
+    return pd.Series(pd.Categorical([None] * len(index), categories=[]), index=index)
+
+
+def _from_unique_keys(codes: np.ndarray, keys: list, index: pd.Index) -> pd.Series:
+    """Zeilencodes auf Rohwert-Ebene + Schlüssel je Rohwert → kategoriale Series."""
+    key_codes, categories = pd.factorize(pd.Series(keys, dtype=object), use_na_sentinel=True)
+    key_codes = np.append(key_codes, -1)     # Code -1 (fehlender Rohwert) → letzter Eintrag → NaN
+    row_codes = key_codes[codes]
+    return pd.Series(pd.Categorical.from_codes(row_codes, categories=pd.Index(categories, dtype=object)), index=index)
+
+
+def concat_genre_frames(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """
+    pd.concat für Frames mit Genre-Spalten aus verschiedenen Blöcken/Quellen.
+
+    Kategoriale Spalten werden vorher auf die Vereinigung ihrer Kategorien
+    gebracht, damit das Ergebnis kategorial bleibt (statt object).
+    """
+    if len(frames) > 1:
+        cat_cols = [
+            col for col in frames[0].columns
+            if all(col in f.columns and isinstance(f[col].dtype, pd.CategoricalDtype) for f in frames)
+        ]
+        if cat_cols:
+            frames = [f.copy(deep=False) for f in frames]
+            for col in cat_cols:
+                categories = union_categoricals([f[col] for f in frames], ignore_order=True).categories
+                for f in frames:
+                    f[col] = f[col].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=True)
+
+
+# ------------------------------------------------------------ #
+# Ausgabe: Listen und Multi-Hot                                #
+# ------------------------------------------------------------ #
+def _category_lists(values: pd.Series) -> list[list[str]]:
+    return [str(c).split(GENRE_SEP) for c in values.cat.categories]
+
+
+def genre_lists(values: pd.Series) -> pd.Series:
+    """Genre-Spalte → object-Series mit list[str] je Zeile (NaN → [])."""
+    values = as_genre_codes(values)
+    lookup = np.empty(len(values.cat.categories) + 1, dtype=object)
+    for i, parts in enumerate(_category_lists(values)):
+        lookup[i] = parts
+    lookup[-1] = []
+    # Zeilen mit gleicher Kombination teilen sich das Listenobjekt
+    return pd.Series(lookup[values.cat.codes.to_numpy()], index=values.index, dtype=object)
+
+
+def with_genre_lists(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Materialisiert alle kategorialen genres*-Spalten als Listen (für CSV-Ausgaben).
+
+    Ohne solche Spalten wird `df` unverändert (ohne Kopie) zurückgegeben.
+    """
+    genre_cols = [
+        c for c in df.columns
+        if str(c).startswith("genres") and isinstance(df[c].dtype, pd.CategoricalDtype)
+    ]
+    if not genre_cols:
+        return df
+    out = df.copy()
+    for col in genre_cols:
+        out[col] = genre_lists(out[col])
+    return out
+
+
+def genre_vocabulary(values: pd.Series) -> list[str]:
+    """Alle vorkommenden Einzelgenres in Reihenfolge ihres ersten Auftretens."""
+    values = as_genre_codes(values)
+    vocabulary: dict[str, None] = {}
+    for parts in _category_lists(values):
+        vocabulary.update(dict.fromkeys(parts))
+    return list(vocabulary)
+
+
+def genres_multi_hot(values: pd.Series, vocabulary: list[str] | None = None) -> pd.DataFrame:
+    """
+    Sparse Multi-Hot-Matrix für ML-Anwendungen.
+
+    Eine Spalte je Genre aus `vocabulary` (Default: `genre_vocabulary`),
+    dtype Sparse[uint8] (1 = Genre vorhanden), Index wie `values`. Die
+    Zuordnung wird einmal je Genre-Kombination berechnet und über die
+    Zeilencodes verteilt. Mit scipy lässt sich das Ergebnis per
+    `.sparse.to_coo()` weiterreichen.
+    """
+    values = as_genre_codes(values)
+    if vocabulary is None:
+        vocabulary = genre_vocabulary(values)
+    position = {g: j for j, g in enumerate(vocabulary)}
+
+    # Kombination × Genre (klein); letzte Zeile = keine Genres
+    per_category = np.zeros((len(values.cat.categories) + 1, len(vocabulary)), dtype=np.uint8)
+    for i, parts in enumerate(_category_lists(values)):
+        for g in parts:
+            if g in position:
+                per_category[i, position[g]] = 1
+
+    codes = values.cat.codes.to_numpy()
+    return pd.DataFrame(
+        {g: pd.arrays.SparseArray(per_category[codes, j], fill_value=0) for g, j in position.items()},
+        index=values.index,
+    )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import re
 from pathlib import Path
@@ -7,7 +8,11 @@ from typing import List
 
 import numpy as np
 import pandas as pd
-from transform.normalize import normalize_film_title
+from transform.fuzzy_match import fuzzy_title_clusters
+from transform.genres import as_genre_codes, concat_genre_frames, empty_genres
+from transform.normalize import RULES_VERSION, normalize_film_title, normalize_titles
+from utils.entity_index import EntityIndex
+from utils.output_sink import OutputSink
 
 # Fallback für unidecode
 try:
@@ -15,201 +20,652 @@ try:
 except ImportError:  # pragma: no cover
     unidecode = lambda s: s  # type: ignore
 
-# Pfade wie bei dir
-UNFILTERED_OUT = Path("static_pipeline/data/processed/all_movies_wide_unfiltered.csv")
-DUPLICATES_OUT = Path("static_pipeline/data/processed/all_movies_fuzzy_duplicates.csv")
+# Namen der Zwischenergebnisse im Ausgabe-Sink (utils/output_sink.py)
+UNFILTERED_OUT = "all_movies_wide_unfiltered"
+DUPLICATES_OUT = "all_movies_fuzzy_duplicates"
+FUZZY_CLUSTERS_OUT = "all_movies_fuzzy_clusters"
+FUZZY_REVIEW_OUT = "all_movies_fuzzy_review"
+ENTITY_UPDATES_OUT = "all_movies_wide_updates"
+
+# Quellübergreifende externe ID (IMDb-Nummer) für den exakten Crosswalk-Join
+CROSSWALK_ID_COLUMN = "imdb_id"
 
 def norm_title(title: str) -> str:
     # exakt dieselbe Normalisierung wie in deinen Adaptern
     return normalize_film_title(title) if isinstance(title, str) else ""
 
-def _cluster_years(unique_years: list[int]) -> dict[int, int]:
-    clusters: list[list[int]] = []
-    mapping: dict[int, int] = {}
-    for y in sorted(unique_years):
-        placed = False
-        for cid, members in enumerate(clusters):
-            if any(abs(y - m) <= 1 for m in members):
-                members.append(y)
-                mapping[y] = cid
-                placed = True
-                break
-        if not placed:
-            clusters.append([y])
-            mapping[y] = len(clusters) - 1
-    return mapping
+def year_clusters(titles: pd.Series, years: pd.Series) -> pd.Series:
+    """
+    ±1-Jahr-Cluster je Titel, vektorisiert über den ganzen Long-Frame.
+
+    Sortiert nach (Titel, Jahr); ein neuer Cluster beginnt bei einem neuen
+    Titel oder einer Jahreslücke > 1, die Cluster-ID ist die kumulierte Summe
+    dieser Brüche relativ zum ersten Cluster des Titels (0, 1, … in
+    aufsteigender Jahresfolge). Zeilen ohne Jahr bilden je Titel einen
+    eigenen Cluster mit der nächsten freien ID.
+
+    Returns:
+        int64-Series mit dem Index von `titles`.
+    """
+    codes, _ = pd.factorize(titles, use_na_sentinel=False)
+    year = pd.to_numeric(years, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    has_year = ~np.isnan(year)
+
+    rows = np.flatnonzero(has_year)
+    order = rows[np.lexsort((year[rows], codes[rows]))]
+    sorted_codes, sorted_years = codes[order], year[order]
+    new_title = np.ones(len(order), dtype=bool)
+    new_title[1:] = sorted_codes[1:] != sorted_codes[:-1]
+    gap = np.zeros(len(order), dtype=bool)
+    gap[1:] = np.diff(sorted_years) > 1
+    breaks = np.cumsum(new_title | gap)
+    title_start = np.maximum.accumulate(np.where(new_title, breaks, 0))
+
+    clusters = np.empty(len(codes), dtype="int64")
+    clusters[order] = breaks - title_start
+    # Ohne Jahr: nächste freie ID des Titels (0, wenn der Titel kein Jahr hat)
+    n_clusters = np.zeros(codes.max() + 1 if len(codes) else 0, dtype="int64")
+    np.maximum.at(n_clusters, sorted_codes, clusters[order] + 1)
+    clusters[~has_year] = n_clusters[codes[~has_year]]
+    return pd.Series(clusters, index=titles.index)
 
 def year_cluster(series: pd.Series) -> pd.Series:
-    years = [int(y) for y in series.dropna()]
-    mapping = _cluster_years(years)
-    next_id = (max(mapping.values()) + 1) if mapping else 0
-    return series.map(mapping).fillna(next_id).astype(int)
+    """±1-Jahr-Cluster für die Jahre eines einzelnen Titels (siehe `year_clusters`)."""
+    return year_clusters(pd.Series(0, index=series.index), series)
 
-def _first(series: pd.Series):
-    for val in series:
-        if isinstance(val, list) and val:
-            return val
-        if isinstance(val, str) and val.strip():
-            return val
-    return []
+def _crosswalk_clusters(long_df: pd.DataFrame) -> pd.Series | None:
+    """
+    Exakter ID-Join vor dem Year-Clustering (Crosswalk, z. B. MovieLens links.csv).
 
-def _first_valid(series: pd.Series):
-    s = series.dropna()
-    return s.iloc[0] if not s.empty else pd.NA
+    Zeilen, deren `imdb_id` in mindestens zwei Quellen vorkommt, bilden eine
+    Gruppe per Hash-Join – unabhängig von Titel und Jahr. Die Gruppe erhält
+    den häufigsten norm_title (bei Gleichstand den längsten) und den
+    Cluster-Schlüssel -(imdb_id) - 1 (kollidiert nicht mit Year-Clustern ≥ 0).
 
-def merge_sources(dfs: List[pd.DataFrame]) -> pd.DataFrame:
+    Der Rest läuft wie bisher durch das ±1-Jahr-Clustering, zusammen mit je
+    je einer Stellvertreterzeile pro (Gruppe, ursprünglicher norm_title, Jahr).
+    Restzeilen ohne eigene
+    `imdb_id` (z. B. Metacritic), die dabei im Cluster eines Stellvertreters
+    landen, schließen sich dessen Gruppe an (bei mehreren: kleinste ID).
+
+    Setzt norm_title der Gruppenzeilen und angeschlossenen Zeilen in `long_df` um.
+
+    Returns:
+        year_cluster je Zeile oder None, wenn keine ID quellübergreifend
+        vorkommt (dann gilt das reine Year-Clustering).
     """
-    Statischer Merge mit:
-      • Titel-Normalisierung (zentral)
-      • ±1-Jahr-Cluster pro norm_title
-      • Long→Wide Aggregation
-      • Genres: erste nicht-leere Liste
-      • Filter: nur Filme mit ≥2 vorhandenen Ratings
-    Rückgabe: EIN DataFrame (wie zuvor), damit main_pipeline.py NICHT bricht.
-    Duplikate werden zusätzlich als CSV persistiert (Nebenwirkung), aber NICHT zurückgegeben.
+    if CROSSWALK_ID_COLUMN not in long_df.columns:
+        return None
+    ids = long_df[CROSSWALK_ID_COLUMN]
+    has_id = ids.notna()
+    sources_per_id = long_df.loc[has_id].groupby(CROSSWALK_ID_COLUMN)["source"].nunique()
+    linked_ids = sources_per_id.index[sources_per_id >= 2]
+    if len(linked_ids) == 0:
+        return None
+    in_group = (has_id & ids.isin(linked_ids)).to_numpy()
+
+    # Kanonischer Titel je Gruppe: häufigster, bei Gleichstand längster
+    group = long_df.loc[in_group, [CROSSWALK_ID_COLUMN, "norm_title", "release_year"]]
+    counts = group.groupby([CROSSWALK_ID_COLUMN, "norm_title"], observed=True).size().rename("n").reset_index()
+    counts["length"] = counts["norm_title"].str.len()
+    canonical = (
+        counts.sort_values(["n", "length"], ascending=False, kind="stable")
+              .drop_duplicates(CROSSWALK_ID_COLUMN)
+              .set_index(CROSSWALK_ID_COLUMN)["norm_title"]
+    )
+    group_ids = group[CROSSWALK_ID_COLUMN].to_numpy(dtype="int64")
+    long_df.loc[in_group, "norm_title"] = canonical.reindex(group_ids).to_numpy()
+
+    clusters = np.empty(len(long_df), dtype="int64")
+    clusters[in_group] = -group_ids - 1
+
+    # Rest + Stellvertreter gemeinsam clustern
+    rest = long_df.loc[~in_group, ["norm_title", "release_year"]]
+    reps = group.dropna(subset=["release_year"]).drop_duplicates()
+    pool = pd.concat([rest, reps[["norm_title", "release_year"]]], ignore_index=True)
+    pool_clusters = year_clusters(pool["norm_title"], pool["release_year"]).to_numpy()
+    rest_clusters = pool_clusters[:len(rest)]
+
+    # Rep-Cluster → Gruppe (kleinste ID) und Anschluss der Restzeilen ohne eigene ID
+    rep_keys = pd.DataFrame({
+        "norm_title": reps["norm_title"].to_numpy(),
+        "cluster": pool_clusters[len(rest):],
+        "key": -reps[CROSSWALK_ID_COLUMN].to_numpy(dtype="int64") - 1,
+    }).groupby(["norm_title", "cluster"])["key"].max()
+    attached = pd.MultiIndex.from_arrays([rest["norm_title"].to_numpy(), rest_clusters])
+    attach_key = rep_keys.reindex(attached).to_numpy()
+    attach = ~np.isnan(attach_key) & ~has_id.to_numpy()[~in_group]
+    attach_key = np.nan_to_num(attach_key).astype("int64")
+    rest_clusters = np.where(attach, attach_key, rest_clusters)
+    clusters[~in_group] = rest_clusters
+    long_df.loc[rest.index[attach], "norm_title"] = canonical.reindex(-attach_key[attach] - 1).to_numpy()
+    return pd.Series(clusters, index=long_df.index)
+
+
+def _unify_film_signatures(long_df: pd.DataFrame) -> None:
+    """
+    Vereinheitlicht Zeilen mit gleicher ID-Signatur (in-place, spaltenweise).
+
+    Signatur = Menge der vorhandenen ID_*-Werte einer Zeile (als Text, wie
+    "ID_IMDB=5"); Zeilen ganz ohne IDs bleiben unberührt. Jede Signatur mit
+    mindestens zwei Zeilen erhält
+      • den häufigsten norm_title (Gleichstand: längster, dann zuerst
+        vorkommender) und
+      • das kleinste release_year der Gruppe.
+    """
+    id_cols = [c for c in long_df.columns if str(c).startswith("ID_")]
+    if not id_cols:
+        return
+
+    # Signatur als Gruppen-ID über die Textform aller ID-Spalten (NA = fehlt)
+    present = long_df[id_cols].notna()
+    keys = [long_df[c].astype(str).where(present[c], "") for c in id_cols]
+    sig = pd.Series(
+        pd.MultiIndex.from_arrays(keys).factorize()[0], index=long_df.index)
+    sig_size = sig.map(sig.value_counts())
+    unify = (present.any(axis=1) & (sig_size >= 2)).to_numpy()
+    if not unify.any():
+        return
+
+    sub = pd.DataFrame({
+        "sig": sig.to_numpy()[unify],
+        "norm_title": long_df["norm_title"].to_numpy()[unify],
+        "position": np.arange(int(unify.sum())),
+    })
+    # Titel-Modus je Signatur: Anzahl ↓, Länge ↓, erstes Vorkommen ↑
+    title_stats = (
+        sub.groupby(["sig", "norm_title"], sort=False)
+           .agg(count=("position", "size"), first=("position", "min"))
+           .reset_index()
+    )
+    title_stats["length"] = title_stats["norm_title"].map(lambda t: len(t) if isinstance(t, str) else 0)
+    best_title = (
+        title_stats.sort_values(["sig", "count", "length", "first"],
+                                ascending=[True, False, False, True], kind="stable")
+                   .drop_duplicates("sig")
+                   .set_index("sig")["norm_title"]
+    )
+    years = pd.to_numeric(long_df["release_year"], errors="coerce")[unify]
+    min_year = years.groupby(sub["sig"].to_numpy()).transform("min")
+
+    long_df.loc[unify, "norm_title"] = best_title.reindex(sub["sig"]).to_numpy()
+    long_df.loc[unify, "release_year"] = min_year.astype(long_df["release_year"].dtype).to_numpy()
+
+
+def _title_keys(long_df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sortierschlüssel für den Wide-Titel: erster Titel in (source, title)-Reihenfolge.
+
+    Schlüssel = Rang der Quelle × Anzahl Titel + Rang des Titels (float64,
+    NaN für Zeilen ohne Titel); das Minimum je Gruppe bestimmt den Titel.
+
+    Returns:
+        (Schlüssel je Zeile, Titel je Schlüssel)
+    """
+    source_codes, _ = pd.factorize(long_df["source"], sort=True)
+    title_codes, titles = pd.factorize(long_df["title"], sort=True)
+    key = source_codes.astype("float64") * len(titles) + title_codes
+    key[title_codes < 0] = np.nan
+    # Schlüssel → Titel (über die Quelle hinweg wiederholt)
+    return key, np.tile(np.asarray(titles, dtype=object), source_codes.max() + 1 if len(source_codes) else 0)
+
+
+def _genre_keys(long_df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sortierschlüssel für die Wide-Genres: erste nicht-leere Kombination nach
+    Quelle (Reihenfolge innerhalb einer Quelle wie bisher aus dem
+    Quicksort nach source).
+
+    Returns:
+        (Rang je Zeile, NaN ohne Genres; Zeilenposition je Rang)
+    """
+    order = long_df["source"].to_numpy().argsort(kind="quicksort")
+    rank = np.empty(len(order), dtype="float64")
+    rank[order] = np.arange(len(order))
+    rank[long_df["genres"].isna().to_numpy()] = np.nan
+    return rank, order
+
+
+def _pick(values: np.ndarray, keys: pd.Series, missing) -> np.ndarray:
+    """values[key] je Gruppe; NaN-Schlüssel (kein gültiger Wert) → `missing`."""
+    valid = keys.notna().to_numpy()
+    picked = np.full(len(keys), missing, dtype=values.dtype)
+    picked[valid] = values[keys.to_numpy()[valid].astype("int64")]
+    return picked
+
+
+def _rating_source(df: pd.DataFrame) -> tuple[str | None, str | None]:
+    """(Rating-Spalte, Quellname) eines Adapter-DataFrames; (None, None) ohne Rating."""
+    for col in df.columns:
+        if col.startswith("rating_") and col != "rating_count":
+            return col, col.replace("rating_", "")
+        if col == "tomatometer_rating":
+            return col, "rt_audience"
+    return None, None
+
+
+def build_long_frame(dfs: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Erster Merge-Schritt: Adapter-DataFrames → ein Long-Frame.
+
+    Je Quelle werden title, release_year (Int32), release_date, genres, source,
+    die Rating-Spalte und alle ID_*-Spalten übernommen, dazu `imdb_id`
+    (Crosswalk), sofern vorhanden; anschließend wird norm_title ergänzt.
+    source und norm_title sind kategorial (Kategorien sortiert). Die
+    Adapter-Frames werden nicht kopiert: je Quelle entsteht ein Frame aus
+    Spaltenansichten, kopiert wird erst beim Zusammenfügen. Leere Eingabe →
+    leeres DataFrame.
     """
     if not dfs:
         return pd.DataFrame()
 
-    frames: list[pd.DataFrame] = []
+    inputs = []
     for df in dfs:
         if df is None or df.empty:
             continue
+        rating_col, source = _rating_source(df)
+        if rating_col is not None:
+            inputs.append((df, rating_col, source))
+    if not inputs:
+        return pd.DataFrame()
+    sources = sorted({source for _, _, source in inputs})
 
-        tmp = df.copy()
-
-        # Rating-Spalte identifizieren
-        rating_col, source = None, None
-        for col in tmp.columns:
-            if col.startswith("rating_"):
-                rating_col = col
-                source = col.replace("rating_", "")
-                break
-            if col == "tomatometer_rating":
-                rating_col, source = col, "rt_audience"
-                break
-        if rating_col is None:
-            continue
+    frames: list[pd.DataFrame] = []
+    for df, rating_col, source in inputs:
+        # Genres übernehmen (erste "genres*"-Spalte, sonst ohne Genres);
+        # Listen-Spalten (z. B. alte Cache-Stände) werden interniert
+        genre_col = next((c for c in df.columns if c.startswith("genres")), None)
+
+        columns = {
+            "title": df["title"],
+            "release_year": pd.to_numeric(df["year"], errors="coerce").astype("Int32"),
+            # release_date absichern
+            "release_date": df["release_date"] if "release_date" in df.columns
+                            else pd.Series(pd.NaT, index=df.index, dtype="datetime64[ns]"),
+            "genres": as_genre_codes(df[genre_col]) if genre_col else empty_genres(df.index),
+            "source": pd.Categorical.from_codes(
+                np.full(len(df), sources.index(source), dtype=np.int8), categories=sources),
+            rating_col: df[rating_col],
+        }
+        # ID-Spalten (ID_*) mitführen
+        for col in df.columns:
+            if str(col).startswith("ID_"):
+                columns[col] = df[col]
+        if CROSSWALK_ID_COLUMN in df.columns:
+            columns[CROSSWALK_ID_COLUMN] = df[CROSSWALK_ID_COLUMN]
+        frames.append(pd.DataFrame(columns, index=df.index, copy=False))
+
+    long_df = concat_genre_frames(frames)
+    if CROSSWALK_ID_COLUMN in long_df.columns:
+        long_df[CROSSWALK_ID_COLUMN] = long_df[CROSSWALK_ID_COLUMN].astype("Int64")
+
+    # Titel normalisieren (Adapter-Titel sind meist schon normalisiert → übersprungen)
+    long_df["norm_title"] = normalize_titles(long_df["title"], skip_normalized=True).astype("category")
+    return long_df
+
+
+def _aggregate_wide(
+    long_df: pd.DataFrame,
+    genre_keys: tuple[np.ndarray, np.ndarray] | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Signatur-Vereinheitlichung, Crosswalk-Join, Year-Cluster und Aggregation.
 
-        tmp["source"] = source
+    Args:
+        genre_keys: (Rang je Zeile, Zeilenposition je Rang) wie `_genre_keys`;
+                    Default: aus `long_df` selbst. Teilmengen des Long-Frames
+                    übergeben hier die Ränge des ganzen Frames.
 
-        # Genres übernehmen (erste "genres*"-Spalte, sonst leere Liste)
-        genre_col = next((c for c in tmp.columns if c.startswith("genres")), None)
-        tmp["genres"] = tmp[genre_col] if genre_col else [[]] * len(tmp)
+    Returns:
+        (ungefiltertes Wide-Frame je (norm_title, year_cluster),
+         Gruppenschlüssel je Long-Zeile mit dem Index von `long_df`)
+    """
+    # Flache Kopie; nur die Spalten, die der Merge umschreibt, werden kopiert
+    long_df = long_df.copy(deep=False)
+    for col in ("norm_title", "release_year"):
+        long_df[col] = long_df[col].copy()
 
-        # release_date absichern
-        if "release_date" not in tmp.columns:
-            tmp["release_date"] = pd.NaT
+    # Optional: film_sig-Kanalisierung (IDs bündeln)
+    _unify_film_signatures(long_df)
 
-        # ID-Spalten (ID_*) mitführen
-        id_cols = [c for c in tmp.columns if str(c).startswith("ID_")]
+    # Exakter ID-Join (Crosswalk), Rest: Year-Cluster pro norm_title
+    clusters = _crosswalk_clusters(long_df)
+    if clusters is None:
+        clusters = year_clusters(long_df["norm_title"], long_df["release_year"])
+    long_df["year_cluster"] = clusters
 
-        cols_to_keep = ["title", "year", "release_date", "genres", "source", rating_col] + id_cols
-        frames.append(tmp[cols_to_keep])
+    # Wide-Frame in einem Durchgang (eine Sortierung, eine Reduktion, keine Joins)
+    group_cols = ["norm_title", "year_cluster"]
+    rating_cols_present = [c for c in long_df.columns if str(c).startswith("rating_")]
+    id_cols_in_long = [c for c in long_df.columns if str(c).startswith("ID_")]
+    title_key, title_values = _title_keys(long_df)
+    genre_key, genre_rows = genre_keys if genre_keys is not None else _genre_keys(long_df)
+    keyed = long_df.assign(_title_key=title_key, _genre_key=genre_key)
+    wide = keyed.groupby(group_cols, as_index=False, sort=True, observed=True).agg(
+        # Ratings/IDs: erster gültiger Wert in Eingabereihenfolge
+        **{col: (col, "first") for col in rating_cols_present},
+        _title_key=("_title_key", "min"),
+        year=("release_year", "min"),
+        release_date=("release_date", "min"),
+        _genre_key=("_genre_key", "min"),
+        **{col: (col, "first") for col in id_cols_in_long},
+    )
+    # Schlüssel → Werte (reine Array-Zugriffe; Gruppen ohne gültigen Wert → NA)
+    wide["_title_key"] = _pick(title_values, wide["_title_key"], None)
+    wide["_genre_key"] = long_df["genres"].array.take(_pick(genre_rows, wide["_genre_key"], -1), allow_fill=True)
+    wide = wide.rename(columns={"_title_key": "title", "_genre_key": "genres"})
+    return wide, long_df[group_cols]
+
+
+# ------------------------------------------------------------ #
+# Inkrementeller Merge über den Entitätsindex                  #
+# ------------------------------------------------------------ #
+#
+# Der Index (utils/entity_index.py) kennt je Long-Zeile ihren Inhalts-Hash und
+# ihre Entität sowie die Wide-Zeile je Entität. Der Inhalts-Hash lässt die
+# ID_*-Spalten aus: sie sind meist Zeilennummern der Quelle (`_next_ids`) und
+# verschieben sich beim Einfügen oder Löschen einer Zeile für alle folgenden.
+# Ein Lauf vergleicht die Zeilen-Hashes mit dem Index; betroffen sind die
+# norm_titles neuer und entfallener Zeilen sowie der Zeilen, deren Gruppe
+# gleicher ID-Signatur oder deren Reihenfolge sich geändert hat, erweitert um
+# alle Titel, die über imdb_id oder eine gemeinsame ID-Signatur mit ihnen
+# verbunden sind (bis nichts mehr hinzukommt). Da Vereinheitlichung, Crosswalk und Year-Cluster nur innerhalb
+# solcher Komponenten wirken, genügt es, deren Zeilen neu zu mergen. Die
+# übrigen Wide-Zeilen kommen aus dem Index; haben sich nur die ID-Werte ihrer
+# Zeilen verschoben, werden lediglich ihre ID_*-Spalten neu bestimmt.
+
+_MERGE_SOURCE_HASH = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+
+def _index_version(long_df: pd.DataFrame) -> str:
+    """Version des Entitätsindex: Merge-Code, Normalisierungsregeln, Spaltenschema."""
+    schema = ";".join(f"{col}:{dtype}" for col, dtype in long_df.dtypes.astype(str).items())
+    digest = hashlib.sha256(f"{_MERGE_SOURCE_HASH}|{RULES_VERSION}|{schema}".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _member_keys(long_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Schlüssel je Long-Zeile für den Entitätsindex.
 
-    if not frames:
-        return pd.DataFrame()
+    Spalten: row_key (Hash über den Zeileninhalt ohne ID_*-Spalten und das
+    wievielte gleiche Vorkommen), norm_title (vor dem Merge, object), imdb_id
+    (Int64), sig (Hash der ID-Signatur wie in `_unify_film_signatures`;
+    0 = keine IDs) und sig_group (kleinster row_key der Zeilen mit gleicher
+    Signatur, sofern es mehrere sind; sonst 0).
+    """
+    id_cols = [c for c in long_df.columns if str(c).startswith("ID_")]
+    content = long_df.drop(columns=id_cols)
+    row_hash = pd.util.hash_pandas_object(content, index=False).to_numpy()
+    occurrence = pd.Series(row_hash).groupby(row_hash).cumcount().to_numpy()
+    row_key = pd.util.hash_pandas_object(
+        pd.DataFrame({"hash": row_hash, "occurrence": occurrence}), index=False).to_numpy()
+
+    sig = np.zeros(len(long_df), dtype="uint64")
+    sig_group = np.zeros(len(long_df), dtype="uint64")
+    if id_cols:
+        # Gleiche ID-Werte ⇔ gleiche Textform, daher genügt der Hash der Werte
+        has_ids = long_df[id_cols].notna().any(axis=1).to_numpy()
+        sig[has_ids] = pd.util.hash_pandas_object(long_df[id_cols], index=False).to_numpy()[has_ids]
+        grouped = pd.Series(row_key[has_ids]).groupby(sig[has_ids])
+        shared = (grouped.transform("size") >= 2).to_numpy()
+        sig_group[np.flatnonzero(has_ids)[shared]] = grouped.transform("min").to_numpy()[shared]
+
+    imdb_id = (long_df[CROSSWALK_ID_COLUMN].astype("Int64") if CROSSWALK_ID_COLUMN in long_df.columns
+               else pd.Series(pd.NA, index=long_df.index, dtype="Int64"))
+    return pd.DataFrame({
+        "row_key": row_key,
+        "norm_title": long_df["norm_title"].astype(object).to_numpy(),
+        "imdb_id": imdb_id.array,
+        "sig": sig,
+        "sig_group": sig_group,
+    })
+
+
+def _affected_titles(seeds: pd.Series, members: list[pd.DataFrame]) -> np.ndarray:
+    """
+    Hülle der betroffenen norm_titles: Titel der Startzeilen plus alle Titel,
+    die über gemeinsame imdb_id oder Signatur-Gruppe (sig_group) erreichbar sind.
+    """
+    keys = pd.concat([m[["norm_title", "imdb_id", "sig_group"]] for m in members], ignore_index=True)
+    has_group = keys["sig_group"].to_numpy() != 0
+    titles = pd.unique(seeds)
+    while True:
+        rows = keys["norm_title"].isin(titles).to_numpy()
+        ids = keys.loc[rows, "imdb_id"].dropna().unique()
+        groups = keys.loc[rows & has_group, "sig_group"].unique()
+        rows |= keys["imdb_id"].isin(ids).to_numpy() | (keys["sig_group"].isin(groups).to_numpy() & has_group)
+        grown = pd.unique(keys.loc[rows, "norm_title"])
+        if len(grown) == len(titles):
+            return grown
+        titles = grown
 
-    long_df = pd.concat(frames, ignore_index=True)
-
-    # Titel normalisieren + release_year sauber typisieren
-    long_df["norm_title"] = long_df["title"].apply(norm_title)
-    long_df["release_year"] = pd.to_numeric(long_df["year"], errors="coerce").astype("Int64")
-
-    # Optional: film_sig-Kanalisierung (IDs bündeln) – identisch wie bei dir
-    id_cols_sig = [c for c in long_df.columns if str(c).startswith("ID_")]
-    if id_cols_sig:
-        def _build_film_sig(row: pd.Series) -> str:
-            parts = []
-            for c in id_cols_sig:
-                v = row.get(c, pd.NA)
-                if pd.notna(v):
-                    parts.append(f"{c}={str(v)}")
-            if not parts:
-                return ""
-            parts.sort()
-            return "|".join(parts)
-
-        long_df["film_sig"] = long_df.apply(_build_film_sig, axis=1)
-
-        def _unify_group(g: pd.DataFrame) -> pd.DataFrame:
-            # nur echte Signaturen mit >=2 Zeilen vereinheitlichen
-            if not isinstance(g.name, str) or g.name == "" or len(g) < 2:
-                return g
-            counts = g["norm_title"].value_counts(dropna=False)
-            max_count = counts.max()
-            candidates = counts[counts == max_count].index.tolist()
-            best_title = max(candidates, key=lambda s: len(s) if isinstance(s, str) else 0)
-            min_year = pd.to_numeric(g["release_year"], errors="coerce").min()
-            g = g.copy()
-            g["norm_title"] = best_title
-            g["release_year"] = pd.Series([min_year] * len(g), index=g.index).astype("Int64")
-            return g
-
-        # FutureWarning vermeiden: include_groups=False (wo verfügbar)
-        try:
-            long_df = long_df.groupby("film_sig", group_keys=False, include_groups=False).apply(_unify_group)
-        except TypeError:
-            long_df = long_df.groupby("film_sig", group_keys=False).apply(_unify_group)
-
-    # Year-Cluster pro norm_title
-    long_df["year_cluster"] = (
-        long_df.groupby("norm_title", group_keys=False)["release_year"].apply(year_cluster)
-    )
 
-    # Ratings aggregieren (first_valid)
-    group_cols = ["norm_title", "year_cluster"]
-    rating_cols_present = [c for c in long_df.columns if str(c).startswith("rating_")]
-    if rating_cols_present:
-        ratings_wide = (
-            long_df.groupby(group_cols, as_index=False)[rating_cols_present].agg(_first_valid)
-        )
+def _entity_keys(frame: pd.DataFrame, title_col: str = "norm_title", cluster_col: str = "year_cluster") -> pd.MultiIndex:
+    return pd.MultiIndex.from_arrays([frame[title_col].astype(object).to_numpy(), frame[cluster_col].to_numpy()])
+
+
+def _wide_row_hashes(wide: pd.DataFrame) -> np.ndarray:
+    return pd.util.hash_pandas_object(wide.drop(columns="entity_id"), index=False).to_numpy()
+
+
+def _insert_sorted(kept: pd.DataFrame, fresh: pd.DataFrame) -> pd.DataFrame:
+    """
+    Fügt die (sortierten) neu gemergten Entitäten in die nach (norm_title,
+    year_cluster) sortierten übrigen ein – ohne das ganze Frame neu zu sortieren.
+    """
+    titles = kept["norm_title"].to_numpy()
+    clusters = kept["year_cluster"].to_numpy()
+    fresh_titles = fresh["norm_title"].to_numpy()
+    lo = np.searchsorted(titles, fresh_titles, side="left")
+    hi = np.searchsorted(titles, fresh_titles, side="right")
+    positions = lo.copy()
+    for i in np.flatnonzero(hi > lo):
+        positions[i] += np.searchsorted(clusters[lo[i]:hi[i]], fresh["year_cluster"].iat[i])
+    # Einfügen vor der Zielposition, bei Gleichstand in Reihenfolge von `fresh`
+    order = np.argsort(np.concatenate([np.arange(len(kept)), positions - 0.5]), kind="stable")
+    return concat_genre_frames([kept, fresh]).iloc[order].reset_index(drop=True)
+
+
+def _publish_entity_updates(updates: pd.DataFrame, sink: OutputSink) -> None:
+    """Übergibt die geänderten Entitäten (change, entity_id vorne) als ENTITY_UPDATES_OUT."""
+    leading = ["change", "entity_id"]
+    sink.publish(ENTITY_UPDATES_OUT, updates[leading + [c for c in updates.columns if c not in leading]])
+
+
+def _incremental_wide(long_df: pd.DataFrame, entity_index: EntityIndex, sink: OutputSink) -> pd.DataFrame:
+    """
+    Ungefiltertes Wide-Frame über den Entitätsindex: nur von geänderten Zeilen
+    betroffene Entitäten werden neu gemergt, geänderte Entitäten zusätzlich
+    als ENTITY_UPDATES_OUT an `sink` übergeben (Spalten change =
+    new/updated/removed und entity_id; leer nach einem Neuaufbau).
+    Aktualisiert den Index.
+    """
+    version = _index_version(long_df)
+    members = _member_keys(long_df)
+    state = entity_index.load(version)
+
+    if state is None:
+        wide, keys = _aggregate_wide(long_df)
+        entities = wide.assign(norm_title=wide["norm_title"].astype(object), entity_id=np.arange(len(wide)))
+        members["entity_title"] = keys["norm_title"].astype(object).to_numpy()
+        members["entity_cluster"] = keys["year_cluster"].to_numpy()
+        entity_index.save(version, members, entities, len(entities))
+        # Ohne Vorstand gibt es keine Änderungen (leere Liste ersetzt die alte)
+        _publish_entity_updates(entities.iloc[:0].assign(change=pd.Series(dtype=object)), sink)
+        print(f"🗂️ Entitätsindex neu aufgebaut: {len(entities)} Entitäten")
+        return wide
+
+    stored_members, entities = state["members"], state["entities"]
+    previous_row = pd.Index(stored_members["row_key"]).get_indexer(members["row_key"])
+    added = previous_row < 0
+    removed = ~stored_members["row_key"].isin(members["row_key"]).to_numpy()
+    kept_rows = np.flatnonzero(~added)
+    stored_sig = np.zeros(len(members), dtype="uint64")
+    stored_sig[kept_rows] = stored_members["sig"].to_numpy()[previous_row[kept_rows]]
+    stored_group = np.zeros(len(members), dtype="uint64")
+    stored_group[kept_rows] = stored_members["sig_group"].to_numpy()[previous_row[kept_rows]]
+    # Gleicher Inhalt, aber andere ID-Werte (z. B. nach Einfügen weiter oben in der Quelle)
+    ids_moved = ~added & (stored_sig != members["sig"].to_numpy())
+    regrouped = ~added & (stored_group != members["sig_group"].to_numpy())
+    # Aggregiert wird in Eingabereihenfolge: Zeilen, die vor eine früher folgende
+    # Zeile gerückt sind, gelten als geändert (Einfügen/Löschen allein zählt nicht)
+    kept_order = previous_row[kept_rows]
+    reordered = np.zeros(len(members), dtype=bool)
+    reordered[kept_rows] = kept_order < np.maximum.accumulate(kept_order)
+    if not (added.any() or removed.any() or ids_moved.any() or reordered.any()):
+        _publish_entity_updates(entities.iloc[:0].assign(change=pd.Series(dtype=object)), sink)
+        print(f"🗂️ Entitätsindex: keine Änderungen ({len(entities)} Entitäten)")
+        return entities.drop(columns="entity_id")
+
+    # Betroffene Komponenten bestimmen und nur deren Zeilen neu mergen
+    seeds = pd.concat([members.loc[added | regrouped | reordered, "norm_title"],
+                       stored_members.loc[removed, "norm_title"]])
+    titles = _affected_titles(seeds, [members, stored_members])
+    affected = members["norm_title"].isin(titles).to_numpy()
+    stale_keys = _entity_keys(stored_members[stored_members["norm_title"].isin(titles)],
+                              "entity_title", "entity_cluster").unique()
+    is_stale = _entity_keys(entities).isin(stale_keys)
+    stale, kept = entities[is_stale], entities[~is_stale]
+
+    next_entity_id = state["next_entity_id"]
+    if affected.any():
+        # Genre-Ränge aus dem ganzen Long-Frame, damit die Wahl wie beim vollständigen Merge ausfällt
+        genre_rank, genre_order = _genre_keys(long_df)
+        subset_position = np.full(len(long_df), -1, dtype="int64")
+        subset_position[affected] = np.arange(int(affected.sum()))
+        fresh, keys = _aggregate_wide(long_df.loc[affected], (genre_rank[affected], subset_position[genre_order]))
+        fresh["norm_title"] = fresh["norm_title"].astype(object)
     else:
-        ratings_wide = long_df[group_cols].drop_duplicates()
-
-    # Meta (Titel, min Jahr, min release_date)
-    meta = (
-        long_df.sort_values(["source", "title"])
-               .groupby(group_cols)
-               .agg(
-                   title=("title", "first"),
-                   year=("release_year", "min"),
-                   release_date=("release_date", "min"),
-               )
-               .reset_index()
-    )
-    wide = ratings_wide.merge(meta, on=group_cols, how="left")
-
-    # Genres: erste nicht-leere Liste
-    genres_map = (
-        long_df.sort_values("source")
-               .groupby(group_cols)["genres"]
-               .apply(_first)
-               .reset_index()
-    )
-    wide = wide.merge(genres_map, on=group_cols, how="left")
+        # Nur entfallene Titel: alle betroffenen Entitäten landen unten in `dropped`
+        fresh, keys = stale.iloc[:0].drop(columns="entity_id"), pd.DataFrame({"norm_title": [], "year_cluster": []})
+    # entity_id bleibt je (norm_title, year_cluster) erhalten, neue Entitäten zählen weiter
+    previous = _entity_keys(stale).get_indexer(_entity_keys(fresh))
+    is_new = previous < 0
+    entity_ids = np.arange(next_entity_id, next_entity_id + len(fresh)) - np.cumsum(~is_new)
+    entity_ids[~is_new] = stale["entity_id"].to_numpy()[previous[~is_new]]
+    fresh["entity_id"] = entity_ids
+    next_entity_id += int(is_new.sum())
+
+    changed = is_new.copy()
+    changed[~is_new] = _wide_row_hashes(fresh[~is_new]) != _wide_row_hashes(stale.iloc[previous[~is_new]])
+    dropped = stale[~_entity_keys(stale).isin(_entity_keys(fresh))]
+    entities = _insert_sorted(kept, fresh)
+
+    # Zugeordnete Entität je Zeile: neu gemergte Zeilen aus dem Merge, übrige aus dem Index
+    members["entity_title"] = stored_members["entity_title"].to_numpy()[np.maximum(previous_row, 0)]
+    members["entity_cluster"] = stored_members["entity_cluster"].to_numpy()[np.maximum(previous_row, 0)]
+    members.loc[affected, "entity_title"] = keys["norm_title"].astype(object).to_numpy()
+    members.loc[affected, "entity_cluster"] = keys["year_cluster"].to_numpy()
+    members["entity_cluster"] = members["entity_cluster"].astype("int64")
+
+    # Unberührte Entitäten mit verschobenen ID-Werten: nur die ID_*-Spalten neu bestimmen
+    refreshed = _refresh_entity_ids(long_df, members, entities, ids_moved & ~affected)
+    updates = concat_genre_frames([
+        fresh[changed].assign(change=np.where(is_new[changed], "new", "updated")),
+        entities.iloc[refreshed].assign(change="updated"),
+        dropped.assign(change="removed"),
+    ])
+    _publish_entity_updates(updates, sink)
+    print(f"🗂️ Entitätsindex: {int(added.sum())} neue/geänderte, {int(removed.sum())} entfallene Zeilen → "
+          f"{int(affected.sum())} Zeilen neu gemergt; {int(is_new[changed].sum())} neue, "
+          f"{int((~is_new[changed]).sum())} geänderte, {len(dropped)} entfernte Entitäten, "
+          f"{len(refreshed)} mit neuen IDs")
+
+    entity_index.save(version, members, entities, next_entity_id)
+    return entities.drop(columns="entity_id")
+
+
+def _refresh_entity_ids(long_df: pd.DataFrame, members: pd.DataFrame, entities: pd.DataFrame,
+                        moved: np.ndarray) -> np.ndarray:
+    """
+    Bestimmt die ID_*-Spalten der Entitäten der Zeilen `moved` neu (erster
+    gültiger Wert in Eingabereihenfolge, wie in `_aggregate_wide`); ändert
+    `entities` an Ort und Stelle.
 
-    # IDs je Film (erste gültige je Quelle)
-    id_cols_in_long = [c for c in long_df.columns if str(c).startswith("ID_")]
-    if id_cols_in_long:
-        ids_map = (
-            long_df.groupby(group_cols, as_index=False)[id_cols_in_long].agg(_first_valid)
-        )
-        wide = wide.merge(ids_map, on=group_cols, how="left")
+    Returns:
+        Positionen der Entitäten, deren ID-Werte sich geändert haben.
+    """
+    id_cols = [c for c in long_df.columns if str(c).startswith("ID_")]
+    if not id_cols or not moved.any():
+        return np.array([], dtype="int64")
+    member_keys = _entity_keys(members, "entity_title", "entity_cluster")
+    rows = member_keys.isin(member_keys[moved].unique())
+    ids = long_df.loc[rows, id_cols].groupby(member_keys[rows], sort=False).first()
+    positions = _entity_keys(entities).get_indexer(ids.index)
+    before = _wide_row_hashes(entities.iloc[positions])
+    for col in id_cols:
+        entities[col] = entities[col].array.copy()
+        entities.loc[positions, col] = ids[col].array
+    return positions[_wide_row_hashes(entities.iloc[positions]) != before]
+
+
+def _apply_fuzzy_matching(long_df: pd.DataFrame, fuzzy: dict, sink: OutputSink) -> pd.DataFrame:
+    """
+    Unscharfer Titelabgleich (siehe `transform.fuzzy_match`): setzt norm_title
+    nahezu gleicher Titel im Jahresfenster auf den kanonischen Titel und
+    übergibt Cluster (FUZZY_CLUSTERS_OUT) und Prüfliste (FUZZY_REVIEW_OUT) an `sink`.
+
+    Returns:
+        Flache Kopie von `long_df` mit neuem norm_title (kategorial).
+    """
+    canonical, clusters, review = fuzzy_title_clusters(long_df["norm_title"], long_df["release_year"], **fuzzy)
+    long_df = long_df.copy(deep=False)
+    long_df["norm_title"] = pd.Categorical(canonical, categories=long_df["norm_title"].cat.categories)
+
+    sink.publish(FUZZY_CLUSTERS_OUT, clusters)
+    sink.publish(FUZZY_REVIEW_OUT, review)
+    print(f"🔗 Fuzzy-Matching: {clusters['fuzzy_cluster'].nunique()} Cluster "
+          f"({len(clusters)} Titel/Jahr-Einträge), {len(review)} Grenzfälle zur Prüfung")
+    return long_df
+
+
+def merge_long_frame(
+    long_df: pd.DataFrame,
+    entity_index: EntityIndex | None = None,
+    fuzzy: dict | None = None,
+    sink: OutputSink | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Zweiter Merge-Schritt: Long-Frame (aus `build_long_frame`) → Wide-Ergebnis.
+
+    Signatur-Vereinheitlichung, Crosswalk-Join, Year-Cluster, Aggregation, Filter k ≥ 2 –
+    Details siehe `merge_sources`. Mit `entity_index` werden nur die von
+    geänderten Zeilen betroffenen Entitäten neu gemergt (siehe `_incremental_wide`).
+
+    Args:
+        fuzzy: Parameter für `fuzzy_title_clusters` (threshold, review_threshold,
+               year_window, …); None = nur exakter norm_title-Abgleich.
+        sink: erhält die Zwischenergebnisse (UNFILTERED_OUT, DUPLICATES_OUT,
+              FUZZY_*_OUT, ENTITY_UPDATES_OUT); None = nichts wird geschrieben.
+
+    Returns:
+        (Ergebnis, ungefiltertes Wide-Frame, Duplikate nach title + release_year
+        im Ergebnis); leeres Long-Frame → drei leere DataFrames.
+    """
+    if long_df is None or long_df.empty:
+        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+    sink = sink if sink is not None else OutputSink()
+
+    if fuzzy is not None:
+        long_df = _apply_fuzzy_matching(long_df, fuzzy, sink)
+
+    if entity_index is not None:
+        wide = _incremental_wide(long_df, entity_index, sink)
+    else:
+        wide, _ = _aggregate_wide(long_df)
 
     # Erwartete Rating-Spalten sicherstellen
     for col in ["rating_imdb","rating_movielens","rating_metacritic","rating_rt_audience"]:
         if col not in wide.columns:
             wide[col] = pd.NA
 
-    # Unfiltered-Snapshot schreiben (wie bisher)
-    UNFILTERED_OUT.parent.mkdir(parents=True, exist_ok=True)
-    wide.to_csv(UNFILTERED_OUT, index=False)
-    print(f"💾 Ungefiltertes Wide-Ergebnis gespeichert: {UNFILTERED_OUT}")
+    # Unfiltered-Snapshot (wird danach nicht mehr verändert)
+    sink.publish(UNFILTERED_OUT, wide)
 
     # Count ratings & Filter k ≥ 2
-    wide["count_ratings"] = wide[["rating_imdb","rating_movielens","rating_metacritic","rating_rt_audience"]].notna().sum(axis=1)
-    df_final = wide[wide["count_ratings"] >= 2].copy()
+    count_ratings = wide[["rating_imdb","rating_movielens","rating_metacritic","rating_rt_audience"]].notna().sum(axis=1)
+    df_final = wide[count_ratings >= 2].assign(count_ratings=count_ratings[count_ratings >= 2])
 
     # Sortierung (deine Logik)
     df_final = df_final.sort_values(["count_ratings", "year"], ascending=[False, False]).reset_index(drop=True)
@@ -217,13 +673,12 @@ def merge_sources(dfs: List[pd.DataFrame]) -> pd.DataFrame:
     # Spaltenharmonisierung: year → release_year (release_date behalten!)
     df_final = df_final.rename(columns={"year": "release_year"})
 
-    # Duplikate identifizieren & als Datei persistieren (aber NICHT zurückgeben)
+    # Duplikate identifizieren (bleiben im Ergebnis, werden separat zurückgegeben)
     dup_mask = df_final.duplicated(subset=["title", "release_year"], keep=False)
     duplicates = df_final[dup_mask].copy()
     if not duplicates.empty:
-        DUPLICATES_OUT.parent.mkdir(parents=True, exist_ok=True)
-        duplicates.to_csv(DUPLICATES_OUT, index=False)
-        print(f"🟠 Duplikate persistiert: {DUPLICATES_OUT} (Zeilen: {len(duplicates)})")
+        sink.publish(DUPLICATES_OUT, duplicates)
+        print(f"🟠 Duplikate (title + release_year): {len(duplicates)} Zeilen")
 
     # Finale Spaltenauswahl
     id_cols_final = [c for c in df_final.columns if str(c).startswith("ID_")]
@@ -242,4 +697,24 @@ def merge_sources(dfs: List[pd.DataFrame]) -> pd.DataFrame:
     df_final = df_final[[c for c in final_columns if c in df_final.columns]]
 
     # Rückgabe
-    return df_final
\ No newline at end of file
+    return df_final, wide, duplicates
+
+
+def merge_sources(
+    dfs: List[pd.DataFrame],
+    fuzzy: dict | None = None,
+    sink: OutputSink | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Statischer Merge mit:
+      • Titel-Normalisierung (zentral)
+      • optional: unscharfer Titelabgleich mit LSH-Blocking (`fuzzy`, siehe `merge_long_frame`)
+      • Crosswalk: exakter Join über `imdb_id` (z. B. MovieLens links.csv), falls vorhanden
+      • ±1-Jahr-Cluster pro norm_title (für alle nicht per ID verknüpften Zeilen)
+      • Long→Wide Aggregation
+      • Genres: erste nicht-leere Genre-Kombination (kategorial, Listen erst bei der Ausgabe)
+      • Filter: nur Filme mit ≥2 vorhandenen Ratings
+    Rückgabe: (Ergebnis, ungefiltertes Wide-Frame, Duplikate) wie `merge_long_frame`.
+    Dateien entstehen nur über einen übergebenen `sink` (siehe utils/output_sink.py).
+    """
+    return merge_long_frame(build_long_frame(dfs), fuzzy=fuzzy, sink=sink)
@@ -1,24 +1,92 @@
+import hashlib
+import inspect
 import re
 import unicodedata
 
+import numpy as np
+import pandas as pd
+
+from utils.title_cache import cached_normalize
+
+# Vorkompilierte Muster (Schritte wie in normalize_film_title)
+_YEAR_SUFFIX = re.compile(r"\s*\(\d{4}\)\s*$")
+_PAREN_SUFFIX = re.compile(r"\s*\([^)]*\)\s*$")
+_TRAILING_THE = re.compile(r"\bthe\s*$")
+# Nach Schritt 1 ist der Titel reines ASCII: Interpunktion ([^\w\s]) → Leerzeichen
+# per Übersetzungstabelle, abgeleitet aus demselben Regex
+_PUNCT_TO_SPACE = str.maketrans({chr(c): " " for c in range(128) if re.match(r"[^\w\s]", chr(c))})
+# Bereits normalisierte Titel: ASCII-Wortzeichen, einfache Leerzeichen, ...
+_NORMALIZED_FORM = re.compile(r"[a-z0-9_]+(?: [a-z0-9_]+)*")
+# ... ohne doppeltes Token und ohne "the" am Ende
+_REPEATED_TOKEN = re.compile(r"(?:^| )([a-z0-9_]+) (?:.* )?\1(?: |$)")
+_ENDS_WITH_THE = re.compile(r"(?:^| )the$")
+
 def normalize_film_title(title: str) -> str:
 	if not isinstance(title, str):
 		return ""
 	# 1) ASCII + lower
 	t = unicodedata.normalize("NFKD", title).encode("ascii", "ignore").decode("utf-8").lower()
 	# 2) trailing "(YYYY)" entfernen
-	t = re.sub(r"\s*\(\d{4}\)\s*$", "", t)
+	t = _YEAR_SUFFIX.sub("", t)
 	# 3) ein weiteres trailing "(...)" entfernen
-	t = re.sub(r"\s*\([^)]*\)\s*$", "", t)
+	t = _PAREN_SUFFIX.sub("", t)
 	# 4) Interpunktion → Leerzeichen
-	t = re.sub(r"[^\w\s]", " ", t)
+	t = t.translate(_PUNCT_TO_SPACE)
 	# 5) Spaces kollabieren + trimmen
-	t = re.sub(r"\s+", " ", t).strip()
+	t = " ".join(t.split())
 	# 6) trailing "the" löschen
-	t = re.sub(r"\bthe\s*$", "", t).strip()
+	t = _TRAILING_THE.sub("", t).strip()
 	# 7) Duplicate‑Tokens entfernen (Reihenfolge beibehalten)
-	seen, toks = set(), []
-	for tok in t.split():
-		if tok not in seen:
-			seen.add(tok); toks.append(tok)
-	return " ".join(toks)
\ No newline at end of file
+	return " ".join(dict.fromkeys(t.split()))
+
+def _rules_version() -> str:
+	"""Hash über die Normalisierungsregeln (Quelltext, Muster, Unicode-Version)."""
+	try:
+		source = inspect.getsource(normalize_film_title)
+	except OSError:
+		source = normalize_film_title.__code__.co_code.hex()
+	parts = [source, _YEAR_SUFFIX.pattern, _PAREN_SUFFIX.pattern, _TRAILING_THE.pattern,
+		repr(sorted(_PUNCT_TO_SPACE.items())), unicodedata.unidata_version]
+	return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()[:16]
+
+# Version der Regeln, z. B. für den persistenten Titel-Cache (utils/title_cache.py)
+RULES_VERSION = _rules_version()
+
+def _is_normalized(title) -> bool:
+	"""True, wenn normalize_film_title(title) == title (Fixpunkt)."""
+	return (
+		isinstance(title, str)
+		and _NORMALIZED_FORM.fullmatch(title) is not None
+		and _REPEATED_TOKEN.search(title) is None
+		and _ENDS_WITH_THE.search(title) is None
+	)
+
+def normalize_titles(values: pd.Series, skip_normalized: bool = False, cache=None) -> pd.Series:
+	"""
+	Batch-Variante von `normalize_film_title` (Ergebnis identisch).
+
+	Jeder verschiedene Titel wird genau einmal normalisiert (pd.factorize) und
+	über die Zeilencodes zurückverteilt; NA → "".
+
+	Args:
+		values: Rohtitel (object/string).
+		skip_normalized: Titel, die bereits Fixpunkt der Normalisierung sind
+			(z. B. Adapter-Ausgaben), werden per Regex erkannt und
+			unverändert übernommen statt erneut normalisiert.
+		cache: optionaler persistenter Cache (`utils.title_cache.TitleCache`);
+			nur Titel, die dort fehlen, werden normalisiert und nachgetragen.
+	"""
+	codes, uniques = pd.factorize(values, use_na_sentinel=True)
+	uniques = pd.Series(uniques, dtype=object)
+	result = uniques.copy()
+	todo = np.ones(len(uniques), dtype=bool)
+	if skip_normalized:
+		todo = np.array([not _is_normalized(t) for t in uniques], dtype=bool)
+	titles = uniques.to_numpy()[todo]
+	if cache is not None:
+		result[todo] = cached_normalize(titles, normalize_film_title, cache, RULES_VERSION)
+	else:
+		result[todo] = [normalize_film_title(t) for t in titles]
+	# Code -1 (NA) → letzter Eintrag ""
+	lookup = np.append(result.to_numpy(dtype=object), "")
+	return pd.Series(lookup[codes], index=values.index, dtype=object)
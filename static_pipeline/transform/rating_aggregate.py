@@ -0,0 +1,99 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+
+# ------------------------------------------------------------ #
+# Blockweise Rating-Aggregation (Anzahl + Summe je ID)          #
+# ------------------------------------------------------------ #
+#
+# Akkumulatoren sind dichte Arrays, deren Index die (ganzzahlige) ID ist:
+# counts[id] = Anzahl Ratings, sums[id] = Summe der Ratings. Ein Block wird
+# mit np.bincount reduziert; der Speicherbedarf hängt nur von der größten ID
+# ab, nicht von der Zahl der Ratings (MovieLens 32M: ~90k Filme, IDs < 300k).
+
+def ratings_partial(ids: np.ndarray, ratings: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduziert einen Block auf (counts, sums) je ID.
+
+    Zeilen ohne ID/Rating oder mit negativer ID werden ignoriert.
+    """
+    ids = np.asarray(ids)
+    ratings = np.asarray(ratings, dtype=np.float64)
+    keep = ~np.isnan(ratings)
+    if ids.dtype.kind == "f":
+        keep &= ~np.isnan(ids)
+    keep &= ids >= 0
+    ids = ids[keep].astype(np.int64, copy=False)
+    if ids.size == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+    return np.bincount(ids), np.bincount(ids, weights=ratings[keep])
+
+
+def _add_into(total: np.ndarray, part: np.ndarray) -> np.ndarray:
+    """total += part; wächst bei Bedarf auf die Länge von part."""
+    if len(part) > len(total):
+        total = np.concatenate([total, np.zeros(len(part) - len(total), dtype=total.dtype)])
+    total[:len(part)] += part
+    return total
+
+
+def aggregate_ratings(
+    chunks: Iterable[pd.DataFrame],
+    id_col: str = "movieId",
+    rating_col: str = "rating",
+    workers: int = 1,
+) -> pd.DataFrame:
+    """
+    Mittelwert und Anzahl der Ratings je ID über beliebig viele Blöcke.
+
+    Args:
+        chunks: DataFrames mit (mindestens) `id_col` und `rating_col`,
+                z. B. aus `iter_csv_source` mit kompakten dtypes (int32/float32).
+        id_col: Spalte mit der ganzzahligen ID.
+        rating_col: Spalte mit dem Rating.
+        workers: > 1 → die Reduktion der Blöcke läuft in einem Thread-Pool,
+                 während der nächste Block gelesen wird. Teilergebnisse werden
+                 in Blockreihenfolge addiert (Ergebnis wie bei workers=1).
+
+    Returns:
+        DataFrame mit Index `id_col` (nur IDs mit mindestens einem Rating)
+        und den Spalten "mean" (float64) und "count" (int64).
+    """
+    counts = np.zeros(0, dtype=np.int64)
+    sums = np.zeros(0, dtype=np.float64)
+
+    def _reduce(chunk: pd.DataFrame):
+        ids = pd.to_numeric(chunk[id_col], errors="coerce")
+        if isinstance(ids.dtype, np.dtype) and ids.dtype.kind in "iu":
+            ids = ids.to_numpy()
+        else:
+            ids = ids.to_numpy(dtype=np.float64, na_value=np.nan)
+        ratings = pd.to_numeric(chunk[rating_col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        return ratings_partial(ids, ratings)
+
+    if workers > 1:
+        pending: deque = deque()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for chunk in chunks:
+                pending.append(executor.submit(_reduce, chunk))
+                # Höchstens `workers` Blöcke gleichzeitig im Speicher halten
+                while len(pending) >= workers:
+                    part_counts, part_sums = pending.popleft().result()
+                    counts, sums = _add_into(counts, part_counts), _add_into(sums, part_sums)
+            while pending:
+                part_counts, part_sums = pending.popleft().result()
+                counts, sums = _add_into(counts, part_counts), _add_into(sums, part_sums)
+    else:
+        for chunk in chunks:
+            part_counts, part_sums = _reduce(chunk)
+            counts, sums = _add_into(counts, part_counts), _add_into(sums, part_sums)
+
+    present = np.flatnonzero(counts)
+    return pd.DataFrame(
+        {"mean": sums[present] / counts[present], "count": counts[present]},
+        index=pd.Index(present, name=id_col),
+    )
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+
+def rating_candidate(
+    column: str,
+    sentinels: tuple[str, ...] = (),
+    rescale_max: float | None = None,
+    rescale_factor: float = 1.0,
+) -> dict:
+    """
+    Beschreibt eine Kandidatenspalte für `coalesce_ratings`.
+
+    Args:
+        column: Spaltenname im Roh-DataFrame.
+        sentinels: Platzhalter, die als "kein Wert" gelten (z. B. "tbd";
+                   Vergleich ohne Groß-/Kleinschreibung).
+        rescale_max: Werte ≤ rescale_max werden mit rescale_factor multipliziert
+                     (z. B. User-Score 0–10 → 0–100); None = keine Umskalierung.
+        rescale_factor: Faktor für die Umskalierung.
+    """
+    return {
+        "column": column,
+        "sentinels": tuple(s.lower() for s in sentinels),
+        "rescale_max": rescale_max,
+        "rescale_factor": rescale_factor,
+    }
+
+
+def coalesce_ratings(df: pd.DataFrame, candidates: list[dict]) -> tuple[pd.Series, pd.Series]:
+    """
+    Wählt je Zeile den ersten gültigen Wert aus einer geordneten Kandidatenliste.
+
+    Vektorisiert Spalte für Spalte (statt `df.apply(..., axis=1)`):
+      1. Spalte numerisch parsen (nicht parsebar → NaN), Sentinels → NaN
+      2. optionale Umskalierung (Werte ≤ rescale_max × rescale_factor)
+      3. Zeilen ohne bisherigen Treffer übernehmen den Wert
+
+    Fehlende Spalten werden übersprungen.
+
+    Returns:
+        (Rating als Float64-Series, Name der gewinnenden Spalte je Zeile bzw. None)
+    """
+    n = len(df)
+    values = np.full(n, np.nan)
+    winner = np.full(n, None, dtype=object)
+    still_open = np.ones(n, dtype=bool)
+
+    for spec in candidates:
+        column = spec["column"]
+        if column not in df.columns or not still_open.any():
+            continue
+        raw = df[column]
+        numbers = pd.to_numeric(raw, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+
+        if spec.get("sentinels") and raw.dtype == object:
+            is_sentinel = raw.astype(str).str.lower().isin(spec["sentinels"]).to_numpy(dtype=bool)
+            numbers[is_sentinel] = np.nan
+
+        if spec.get("rescale_max") is not None:
+            rescale = numbers <= spec["rescale_max"]
+            numbers[rescale] = numbers[rescale] * spec.get("rescale_factor", 1.0)
+
+        take = still_open & ~np.isnan(numbers)
+        values[take] = numbers[take]
+        winner[take] = column
+        still_open &= ~take
+
+    return (
+        pd.Series(values, index=df.index, dtype="Float64"),
+        pd.Series(winner, index=df.index, dtype=object),
+    )
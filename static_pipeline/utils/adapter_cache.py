@@ -0,0 +1,217 @@
+import ast
+import hashlib
+import importlib
+import importlib.util
+import inspect
+import json
+import logging
+import os
+from pathlib import Path
+
+import pandas as pd
+
+# Projektwurzel (static_pipeline/): nur Module darunter zählen als Adapter-Abhängigkeiten
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_CHUNK_SIZE = 1 << 20
+_FINGERPRINT_DIR = "fingerprints"
+
+
+def _path_values(adapter_config: dict) -> list[Path]:
+    """Alle Dateipfade aus *_path/*_paths-Einträgen der Adapter-Config."""
+    paths: list[Path] = []
+    for key in sorted(adapter_config):
+        if not (key.endswith("_path") or key.endswith("_paths")):
+            continue
+        value = adapter_config[key]
+        for path_value in (value if isinstance(value, (list, tuple)) else [value]):
+            paths.append(Path(path_value))
+    return paths
+
+
+def _is_project_module(module_name: str) -> bool:
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        return False
+    # Eingebaute/eingefrorene Module haben keinen Dateipfad als origin
+    if spec is None or not spec.has_location:
+        return False
+    return Path(spec.origin).resolve().is_relative_to(_PROJECT_ROOT)
+
+
+def _project_imports(module_name: str) -> set[str]:
+    """Projektmodule, die `module_name` importiert (absolute Imports, auch in Funktionen)."""
+    try:
+        tree = ast.parse(inspect.getsource(importlib.import_module(module_name)))
+    except (ImportError, OSError, TypeError, SyntaxError):
+        return set()
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.add(node.module)
+    return {name for name in names if _is_project_module(name)}
+
+
+def adapter_code_dependencies(adapter_class: type) -> list[str]:
+    """
+    Module, deren Code das Adapter-Ergebnis beeinflusst: die Module der
+    Adapterklasse und ihrer Basisklassen plus alle (transitiv) von ihnen
+    importierten Projektmodule. Wird aus den Imports abgeleitet, damit neue
+    Hilfsmodule den Cache-Schlüssel automatisch mitbestimmen.
+    """
+    pending = [
+        cls.__module__ for cls in inspect.getmro(adapter_class)
+        if cls.__module__ not in ("builtins", "abc")
+    ]
+    modules: set[str] = set()
+    while pending:
+        module_name = pending.pop()
+        if module_name in modules:
+            continue
+        modules.add(module_name)
+        pending.extend(_project_imports(module_name) - modules)
+    return sorted(modules)
+
+
+def _class_source_hash(adapter_class: type) -> str:
+    """Hash über den Quellcode der Adapterklasse, ihrer Basisklassen und Abhängigkeiten."""
+    digest = hashlib.sha256()
+    for module_name in adapter_code_dependencies(adapter_class):
+        try:
+            source = inspect.getsource(importlib.import_module(module_name))
+        except (ImportError, OSError, TypeError):
+            source = module_name
+        digest.update(module_name.encode("utf-8"))
+        digest.update(source.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def file_fingerprint(path: Path, index_dir: Path) -> str:
+    """
+    SHA-256 des Dateiinhalts, gemerkt je (Pfad, Größe, mtime) unter `index_dir`.
+
+    Unveränderte Dateien werden dadurch nicht bei jedem Lauf erneut gelesen;
+    auch vom Raw-Cache (utils/raw_cache.py) genutzt.
+    """
+    path = Path(path)
+    stat = path.stat()
+    path_id = hashlib.sha1(str(path).encode("utf-8")).hexdigest()
+    index_path = Path(index_dir) / f"{path_id}.json"
+    try:
+        entry = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        entry = {}
+    if entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+        return entry["sha256"]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(block)
+    sha = digest.hexdigest()
+
+    entry = {"path": str(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha}
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = index_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(entry, indent=2), encoding="utf-8")
+        os.replace(tmp_path, index_path)
+    except OSError as e:
+        logging.debug(f"Fingerprint für {path} nicht schreibbar: {e}")
+    return sha
+
+
+class AdapterCache:
+    """
+    Inhaltsbasierter Cache für bereinigte Adapter-DataFrames.
+
+    Schlüssel = SHA-256 über
+      • Fingerprint (Inhalts-Hash) aller Rohdateien der Adapter-Config
+      • Quellcode-Hash der Adapterklasse (inkl. Basisklassen, Normalisierung)
+      • die Adapter-Config selbst
+
+    Einträge werden als Pickle (schnell, dtype-treu inkl. Listen-Spalten und
+    nullable dtypes) unter ``<cache_dir>/<adapter>_<key>.pkl`` abgelegt. Ist
+    die Gesamtgröße größer als ``max_size_mb``, werden die am längsten nicht
+    genutzten Einträge entfernt.
+
+    Inhalts-Hashes der Rohdateien werden je (Pfad, Größe, mtime) unter
+    ``<cache_dir>/fingerprints/`` gemerkt, damit unveränderte Dateien nicht bei jedem
+    Lauf erneut gelesen werden müssen.
+    """
+
+    def __init__(self, cache_dir: str | Path, max_size_mb: float | None = None):
+        self.cache_dir = Path(cache_dir)
+        self.max_size_mb = max_size_mb
+
+    # ------------------------------------------------------------ #
+    # Schlüsselbildung                                             #
+    # ------------------------------------------------------------ #
+    def _file_fingerprint(self, path: Path) -> str:
+        return file_fingerprint(path, self.cache_dir / _FINGERPRINT_DIR)
+
+    def key_for(self, adapter_class: type, adapter_config: dict) -> str:
+        """Berechnet den Cache-Schlüssel für eine Adapterklasse + Config."""
+        digest = hashlib.sha256()
+        for path in _path_values(adapter_config):
+            digest.update(str(path).encode("utf-8"))
+            digest.update(self._file_fingerprint(path).encode("utf-8"))
+        digest.update(_class_source_hash(adapter_class).encode("utf-8"))
+        digest.update(json.dumps(adapter_config, sort_keys=True, default=str).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _entry_path(self, adapter_name: str, key: str) -> Path:
+        return self.cache_dir / f"{adapter_name}_{key[:32]}.pkl"
+
+    # ------------------------------------------------------------ #
+    # Lesen / Schreiben                                            #
+    # ------------------------------------------------------------ #
+    def load(self, adapter_name: str, key: str) -> pd.DataFrame | None:
+        """Liefert das gecachte DataFrame oder None (Cache-Miss)."""
+        entry = self._entry_path(adapter_name, key)
+        if not entry.exists():
+            return None
+        try:
+            df = pd.read_pickle(entry)
+        except Exception as e:
+            logging.warning(f"AdapterCache: Eintrag {entry} unlesbar, wird ignoriert: {e}")
+            return None
+        # Zugriffszeit für LRU-Eviction aktualisieren
+        os.utime(entry)
+        return df
+
+    def store(self, adapter_name: str, key: str, df: pd.DataFrame) -> None:
+        """Speichert das DataFrame atomar (tmp-Datei + rename)."""
+        entry = self._entry_path(adapter_name, key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = entry.with_suffix(f".{os.getpid()}.tmp")
+            df.to_pickle(tmp_path, protocol=5)
+            os.replace(tmp_path, entry)
+        except Exception as e:
+            logging.warning(f"AdapterCache: Schreiben von {entry} fehlgeschlagen: {e}")
+
+    def evict(self) -> None:
+        """Entfernt die ältesten Einträge, bis max_size_mb eingehalten ist."""
+        if not self.max_size_mb or not self.cache_dir.exists():
+            return
+        limit = int(self.max_size_mb * 1024 * 1024)
+        entries = []
+        for entry in self.cache_dir.glob("*.pkl"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= limit:
+                break
+            try:
+                entry.unlink()
+                total -= size
+                logging.info(f"AdapterCache: Eintrag entfernt (Größenlimit): {entry.name}")
+            except FileNotFoundError:
+                continue
@@ -3,6 +3,7 @@ from typing import List, Tuple
 from datetime import datetime
 import pandas as pd
 from pathlib import Path
+from transform.genres import with_genre_lists
 
 CURRENT_YEAR: int = datetime.now().year
 YEAR_MIN: int = 1888
@@ -19,10 +20,14 @@ RATING_COLUMN_RANGES: dict[str, Tuple[float, float]] = {
 }
 
 
+# Spalten mit "rating_"-Präfix, die keine Bewertung sind
+NON_RATING_COLUMNS = {"rating_count"}
+
+
 def _detect_rating_columns(df: pd.DataFrame) -> List[str]:
     return [
-        col for col in df.columns if col.startswith("rating_") or
-        col.endswith("_norm") or col.startswith("superscore_")
+        col for col in df.columns if col not in NON_RATING_COLUMNS and (
+            col.startswith("rating_") or col.endswith("_norm") or col.startswith("superscore_"))
     ]
 
 
@@ -124,10 +129,10 @@ def validate_dataframe(
                 out_dup_path = Path(duplicates_output_path)
                 out_dup_path.parent.mkdir(parents=True, exist_ok=True)
                 if dupes.any():
-                    df[dupes].to_csv(out_dup_path, index=False)
+                    with_genre_lists(df[dupes]).to_csv(out_dup_path, index=False)
                 else:
                     # Leere CSV mit Header speichern
-                    df.head(0).to_csv(out_dup_path, index=False)
+                    with_genre_lists(df.head(0)).to_csv(out_dup_path, index=False)
                 logging.info(
                     f"{name}: Duplikate gespeichert unter {out_dup_path} (Anzahl: {dupes.sum()})"
                 )
@@ -146,14 +151,14 @@ def validate_dataframe(
                 try:
                     invalid_df = invalid_df.drop_duplicates()
                 except TypeError:
-                    # Manche Spalten enthalten Listen/ungehashbare Objekte -> ohne Duplikat-Entfernung fortfahren
+                    # Ungehashbare Objekte (z. B. Listen aus externen Adaptern) -> ohne Duplikat-Entfernung fortfahren
                     invalid_df = invalid_df.reset_index(drop=True)
             else:
                 # Leere CSV mit Spaltenkopf erstellen
                 invalid_df = df.head(0).copy()
             out_path = Path(invalid_rows_output_path)
             out_path.parent.mkdir(parents=True, exist_ok=True)
-            invalid_df.to_csv(out_path, index=False)
+            with_genre_lists(invalid_df).to_csv(out_path, index=False)
             logging.info(
                 f"{name}: Fehlerhafte Zeilen gespeichert unter {out_path} (Anzahl: {len(invalid_df)})"
             )
@@ -0,0 +1,115 @@
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+# Reihenfolge der Pipeline-Stufen, nach denen ein Checkpoint geschrieben wird
+STAGES: tuple[str, ...] = ("adapters", "long", "merged", "normalized")
+
+_MANIFEST = "manifest.json"
+
+
+class CheckpointStore:
+    """
+    Typisierte Zwischenstände je Pipeline-Stufe für wiederaufnehmbare Läufe.
+
+    Layout unter ``checkpoint_dir``:
+      • adapters/<Adaptername>.pkl  – bereinigte Adapter-DataFrames
+      • long.pkl / merged.pkl / normalized.pkl
+      • manifest.json – je Stufe Zeitstempel, Zeilenzahl und Adapterreihenfolge
+
+    Die Frames werden gepickelt, damit kategoriale ``genres`` und nullable
+    dtypes (Int64, Float64) exakt erhalten bleiben. Eine Stufe gilt erst als
+    gültig, wenn sie vollständig geschrieben und im Manifest eingetragen ist;
+    das Schreiben einer Stufe verwirft alle späteren Stufen.
+    """
+
+    def __init__(self, checkpoint_dir: str | Path):
+        self.checkpoint_dir = Path(checkpoint_dir)
+
+    # ------------------------------------------------------------ #
+    # Manifest                                                     #
+    # ------------------------------------------------------------ #
+    def _read_manifest(self) -> dict:
+        try:
+            return json.loads((self.checkpoint_dir / _MANIFEST).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _write_manifest(self, manifest: dict) -> None:
+        path = self.checkpoint_dir / _MANIFEST
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _write_frame(df: pd.DataFrame, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        df.to_pickle(tmp_path, protocol=5)
+        os.replace(tmp_path, path)
+
+    # ------------------------------------------------------------ #
+    # Schreiben / Lesen                                            #
+    # ------------------------------------------------------------ #
+    def save(self, stage: str, data: pd.DataFrame | dict[str, pd.DataFrame]) -> None:
+        """Schreibt den Checkpoint einer Stufe und trägt ihn im Manifest ein."""
+        if stage not in STAGES:
+            raise ValueError(f"Unbekannte Checkpoint-Stufe: {stage} (erlaubt: {', '.join(STAGES)})")
+
+        manifest = self._read_manifest()
+        # Stufe und alle späteren zunächst invalidieren: ein Abbruch hinterlässt so
+        # keinen halben Stand, und ein Resume kombiniert nie eine neue Stufe mit
+        # späteren Ständen eines älteren Laufs
+        for later in STAGES[STAGES.index(stage):]:
+            manifest.pop(later, None)
+        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        self._write_manifest(manifest)
+
+        entry: dict = {"created": datetime.now().isoformat(timespec="seconds")}
+        if stage == "adapters":
+            for name, df in data.items():
+                self._write_frame(df, self.checkpoint_dir / "adapters" / f"{name}.pkl")
+            entry["adapters"] = list(data.keys())
+            entry["rows"] = {name: len(df) for name, df in data.items()}
+        else:
+            self._write_frame(data, self.checkpoint_dir / f"{stage}.pkl")
+            entry["rows"] = len(data)
+
+        manifest[stage] = entry
+        self._write_manifest(manifest)
+        logging.info(f"Checkpoint '{stage}' gespeichert unter {self.checkpoint_dir}")
+
+    def has(self, stage: str) -> bool:
+        """True, wenn für die Stufe ein vollständiger Checkpoint vorliegt."""
+        entry = self._read_manifest().get(stage)
+        if not entry:
+            return False
+        if stage == "adapters":
+            return all(
+                (self.checkpoint_dir / "adapters" / f"{name}.pkl").exists()
+                for name in entry.get("adapters", [])
+            )
+        return (self.checkpoint_dir / f"{stage}.pkl").exists()
+
+    def load(self, stage: str) -> pd.DataFrame | dict[str, pd.DataFrame]:
+        """Lädt den Checkpoint einer Stufe (adapters → dict in Originalreihenfolge)."""
+        if not self.has(stage):
+            raise FileNotFoundError(f"Kein gültiger Checkpoint für Stufe '{stage}' in {self.checkpoint_dir}")
+        if stage == "adapters":
+            names = self._read_manifest()[stage].get("adapters", [])
+            return {
+                name: pd.read_pickle(self.checkpoint_dir / "adapters" / f"{name}.pkl")
+                for name in names
+            }
+        return pd.read_pickle(self.checkpoint_dir / f"{stage}.pkl")
+
+    def latest_up_to(self, stage: str) -> str | None:
+        """Letzte gültige Stufe ≤ `stage` (oder None, wenn keine vorhanden ist)."""
+        for candidate in reversed(STAGES[:STAGES.index(stage) + 1]):
+            if self.has(candidate):
+                return candidate
+        return None
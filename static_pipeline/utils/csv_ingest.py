@@ -0,0 +1,481 @@
+"""
+Gemeinsame CSV-Ingestion für alle Adapter.
+
+- Spaltenauswahl + explizite dtypes je Adapter (`schema`: Spalte → dtype);
+  nicht benötigte Spalten werden gar nicht erst geparst. Fehlende Spalten
+  werden ignoriert, Spalten außerhalb des Schemas nicht gelesen.
+- Schneller Pfad mit pyarrow.csv (mehrere Threads, spaltenweise); ohne
+  pyarrow oder bei nicht konvertierbaren Werten Fallback auf den pandas-C-Parser.
+  Im Blockmodus werden typisierte Spalten als Text gestreamt und je Batch
+  konvertiert; Ausreißer wie "tbd" werden dort zu fehlenden Werten.
+- Komprimierte Eingaben (.gz, .bz2, .zst) werden anhand der Endung
+  transparent entpackt.
+- Abweichende Formate (TSV, ohne Quoting, eigene NA-Platzhalter) über
+  `dialect` (siehe `csv_dialect`); `where` filtert Zeilen nach Spaltenwerten,
+  bevor sie in pandas-Objekte umgewandelt werden.
+- Fehlerhafte Zeilen (falsche Feldanzahl) werden nicht stillschweigend
+  verworfen, sondern mit Zeilennummer an `on_bad_line` gemeldet
+  (Datensatz: line, expected_columns, actual_columns, text).
+
+- Optional mit Raw-Cache (`cache`, utils/raw_cache.py): das Parse-Ergebnis
+  des pyarrow-Pfads wird als Arrow-IPC-Datei abgelegt und bei unveränderter
+  CSV memory-mapped wiederverwendet; gemerkte fehlerhafte Zeilen werden dabei
+  erneut an `on_bad_line` gemeldet.
+- Ohne Schema (Typinferenz) bleiben Datumswerte wie bei pandas.read_csv Text.
+
+Unterschiede der Pfade: pyarrow meldet auch zu kurze Zeilen als fehlerhaft,
+der pandas-Parser füllt sie (wie bisher) mit NaN auf; im pandas-Blockmodus
+fehlt die Zeilennummer (line=None).
+"""
+
+import csv
+import io
+import json
+import logging
+import re
+import warnings
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterator
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pa_compute
+    import pyarrow.csv as pa_csv
+except ImportError:  # pragma: no cover
+    pa = None
+    pa_compute = None
+    pa_csv = None
+
+# Wie pandas.read_csv: diese Rohwerte gelten als fehlend
+NA_VALUES: list[str] = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+
+
+def csv_dialect(delimiter: str = ",", quoted: bool = True, null_values: tuple[str, ...] = ()) -> dict:
+    """
+    Beschreibt das Dateiformat für `read_csv_source`/`iter_csv_source`.
+
+    Args:
+        delimiter: Feldtrenner (z. B. "\\t" für TSV).
+        quoted: False → Anführungszeichen sind gewöhnliche Zeichen (IMDb-Dumps).
+        null_values: zusätzliche Platzhalter für fehlende Werte (z. B. "\\N").
+    """
+    return {"delimiter": delimiter, "quoted": quoted, "null_values": tuple(null_values)}
+
+
+DEFAULT_DIALECT = csv_dialect()
+
+_ARROW_TYPES = {
+    "string": "string",
+    "float64": "float64",
+    "float32": "float32",
+    "int64": "int64",
+    "int32": "int32",
+}
+_BLOCK_SIZE = 1 << 24
+_PANDAS_BAD_LINE = re.compile(r"Skipping line (\d+): expected (\d+) fields, saw (\d+)")
+
+BadLineHandler = Callable[[dict], None]
+
+if TYPE_CHECKING:
+    from utils.raw_cache import RawColumnarCache
+
+
+def _arrow_available() -> bool:
+    return pa_csv is not None
+
+
+def read_header(path: str | Path, dialect: dict | None = None) -> list[str]:
+    """Spaltennamen der ersten Zeile (auch für komprimierte Dateien)."""
+    dialect = dialect or DEFAULT_DIALECT
+    if _arrow_available():
+        with pa.input_stream(str(path), compression="detect") as stream:
+            head = stream.read(1 << 16)
+        text = head.decode("utf-8-sig", errors="replace")
+        reader = csv.reader(io.StringIO(text), delimiter=dialect["delimiter"],
+                            quoting=csv.QUOTE_MINIMAL if dialect["quoted"] else csv.QUOTE_NONE)
+        return next(reader, [])
+    return list(pd.read_csv(path, nrows=0, **_pandas_dialect(dialect)).columns)
+
+
+def _select_columns(path: str | Path, schema: dict[str, str] | None, dialect: dict) -> dict[str, str] | None:
+    """Schema auf die tatsächlich vorhandenen Spalten reduzieren (Reihenfolge der Datei)."""
+    if schema is None:
+        return None
+    return {col: schema[col] for col in read_header(path, dialect) if col in schema}
+
+
+# ------------------------------------------------------------ #
+# pyarrow                                                      #
+# ------------------------------------------------------------ #
+def _arrow_options(columns: dict[str, str] | None, dialect: dict, use_threads: bool, on_invalid: Callable):
+    read_options = pa_csv.ReadOptions(use_threads=use_threads, block_size=_BLOCK_SIZE)
+    parse_options = pa_csv.ParseOptions(
+        delimiter=dialect["delimiter"],
+        quote_char='"' if dialect["quoted"] else False,
+        newlines_in_values=dialect["quoted"],
+        invalid_row_handler=on_invalid,
+    )
+    convert_options = pa_csv.ConvertOptions(
+        include_columns=list(columns) if columns is not None else None,
+        column_types={c: _ARROW_TYPES.get(t, t) for c, t in columns.items()} if columns else None,
+        null_values=NA_VALUES + list(dialect["null_values"]),
+        strings_can_be_null=True,
+        quoted_strings_can_be_null=True,
+        timestamp_parsers=[],
+    )
+    return read_options, parse_options, convert_options
+
+
+def _dates_as_text(data):
+    """Von der Typinferenz erkannte Datums-/Zeitspalten zurück in Text (wie pandas.read_csv)."""
+    temporal = [i for i, field in enumerate(data.schema) if pa.types.is_temporal(field.type)]
+    if not temporal:
+        return data
+    arrays = [
+        data.column(i).cast(pa.string()) if i in temporal else data.column(i)
+        for i in range(data.num_columns)
+    ]
+    return type(data).from_arrays(arrays, names=data.schema.names)
+
+
+def _cache_variant(columns: dict[str, str] | None, dialect: dict) -> str:
+    """Lesevariante als Teil des Raw-Cache-Schlüssels (der Zeilenfilter gehört nicht dazu)."""
+    variant = "*" if columns is None else json.dumps(columns)
+    if dialect != DEFAULT_DIALECT:
+        variant += json.dumps(dialect)
+    return variant
+
+
+def _report_bad_lines(bad: list[dict], on_bad_line: BadLineHandler | None) -> None:
+    if on_bad_line is not None:
+        for rec in bad:
+            on_bad_line(rec)
+
+
+def _arrow_to_pandas(table, where: dict[str, list] | None = None) -> pd.DataFrame:
+    if where:
+        mask = None
+        for col, allowed in where.items():
+            hit = pa_compute.is_in(table.column(col), value_set=pa.array(allowed))
+            mask = hit if mask is None else pa_compute.and_(mask, hit)
+        table = table.filter(mask)
+    df = table.to_pandas()
+    # pyarrow liefert fehlende Strings als None, pandas.read_csv als NaN
+    # (komplett leere Spalten werden dabei wie bei pandas zu float64)
+    for col in df.columns:
+        if df[col].dtype == object:
+            values = df[col]
+            df[col] = values.astype("float64") if len(values) and values.isna().all() else values.fillna(np.nan)
+    return df
+
+
+def _bad_line_record(row) -> dict:
+    return {
+        "line": row.number,
+        "expected_columns": row.expected_columns,
+        "actual_columns": row.actual_columns,
+        "text": row.text,
+    }
+
+
+def _read_arrow_table(path, columns, dialect) -> tuple:
+    bad: list[dict] = []
+
+    def _collect(row):
+        bad.append(_bad_line_record(row))
+        return "skip"
+
+    table = pa_csv.read_csv(str(path), *_arrow_options(columns, dialect, True, _collect))
+    if bad and any(rec["line"] is None for rec in bad):
+        # Zeilennummern kennt pyarrow nur beim Lesen mit einem Thread
+        bad.clear()
+        table = pa_csv.read_csv(str(path), *_arrow_options(columns, dialect, False, _collect))
+    return _dates_as_text(table), bad
+
+
+def _read_arrow(path, columns, dialect, where, on_bad_line: BadLineHandler | None, cache=None) -> pd.DataFrame:
+    variant = _cache_variant(columns, dialect)
+    cached = cache.load(path, variant) if cache is not None else None
+    if cached is not None:
+        table, bad = cached
+    else:
+        table, bad = _read_arrow_table(path, columns, dialect)
+        if cache is not None:
+            cache.store(path, variant, table, bad)
+    _report_bad_lines(bad, on_bad_line)
+    return _arrow_to_pandas(table, where)
+
+
+def _as_text_columns(columns: dict[str, str] | None) -> dict[str, str] | None:
+    """Schema fürs Streamen: numerische Spalten zunächst als Text parsen."""
+    if columns is None:
+        return None
+    return {col: "string" for col in columns}
+
+
+def _convert_batch(batch, schema, columns: dict[str, str], path, coerced: set[str]):
+    """
+    Castet einen als Text gelesenen Batch auf die Zieltypen. Nicht konvertierbare
+    Werte (z. B. "tbd") werden wie bei `pd.to_numeric(errors="coerce")` zu
+    fehlenden Werten, statt den Lauf mitten im Stream abzubrechen.
+    """
+    arrays = []
+    for field in schema:
+        values = batch.column(batch.schema.get_field_index(field.name))
+        if pa.types.is_string(field.type):
+            arrays.append(values)
+            continue
+        try:
+            arrays.append(pa_compute.cast(values, field.type))
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            if field.name not in coerced:
+                coerced.add(field.name)
+                logging.warning(f"CSV-Ingestion: nicht numerische Werte in {path}, Spalte "
+                                f"'{field.name}' ({columns[field.name]}) → fehlend.")
+            numbers = pd.to_numeric(values.to_pandas(), errors="coerce")
+            arrays.append(pa.array(numbers, type=field.type, from_pandas=True, safe=False))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _iter_cached(table, bad: list[dict], chunksize: int, where,
+                 on_bad_line: BadLineHandler | None) -> Iterator[pd.DataFrame]:
+    _report_bad_lines(bad, on_bad_line)
+    for offset in range(0, table.num_rows, chunksize):
+        yield _arrow_to_pandas(table.slice(offset, chunksize), where)
+
+
+def _iter_arrow(path, columns, dialect, where, chunksize: int,
+                on_bad_line: BadLineHandler | None, cache=None) -> Iterator[pd.DataFrame]:
+    variant = _cache_variant(columns, dialect)
+    cached = cache.load(path, variant) if cache is not None else None
+    if cached is not None:
+        yield from _iter_cached(*cached, chunksize, where, on_bad_line)
+        return
+
+    bad: list[dict] = []
+    all_bad: list[dict] = []
+
+    def _collect(row):
+        bad.append(_bad_line_record(row))
+        return "skip"
+
+    def _flush_bad():
+        all_bad.extend(bad)
+        _report_bad_lines(bad, on_bad_line)
+        bad.clear()
+
+    # Typisierte Spalten werden als Text gestreamt und je Batch konvertiert:
+    # pyarrow legt die Typen sonst pro Block fest, und ein Ausreißer nach dem
+    # ersten Block ließe sich nicht mehr auf pandas umleiten
+    reader = pa_csv.open_csv(str(path), *_arrow_options(_as_text_columns(columns), dialect, False, _collect))
+    if columns is None:
+        schema = _dates_as_text(reader.schema.empty_table()).schema
+    else:
+        schema = pa.schema([(col, pa.type_for_alias(_ARROW_TYPES.get(columns[col], columns[col])))
+                            for col in reader.schema.names])
+    coerced: set[str] = set()
+    # Raw-Cache wird parallel zum Streamen geschrieben; nur vollständige Läufe zählen
+    writer = cache.writer(path, variant, schema) if cache is not None else None
+    completed = False
+    try:
+        pending: list = []
+        pending_rows = 0
+        for batch in reader:
+            batch = _dates_as_text(batch) if columns is None else _convert_batch(batch, schema, columns, path, coerced)
+            if writer is not None:
+                writer.write(batch)
+            pending.append(batch)
+            pending_rows += batch.num_rows
+            while pending_rows >= chunksize:
+                table = pa.Table.from_batches(pending, schema=schema)
+                _flush_bad()
+                yield _arrow_to_pandas(table.slice(0, chunksize), where)
+                rest = table.slice(chunksize)
+                pending, pending_rows = rest.to_batches(), rest.num_rows
+        _flush_bad()
+        if pending_rows:
+            yield _arrow_to_pandas(pa.Table.from_batches(pending, schema=schema), where)
+        completed = True
+    finally:
+        if writer is not None:
+            if completed:
+                writer.commit(all_bad)
+            else:
+                writer.abort()
+
+
+# ------------------------------------------------------------ #
+# pandas (Fallback)                                            #
+# ------------------------------------------------------------ #
+def _pandas_dialect(dialect: dict) -> dict:
+    kwargs = {}
+    if dialect["delimiter"] != ",":
+        kwargs["sep"] = dialect["delimiter"]
+    if not dialect["quoted"]:
+        kwargs["quoting"] = csv.QUOTE_NONE
+    if dialect["null_values"]:
+        kwargs["na_values"] = list(dialect["null_values"])
+    return kwargs
+
+
+def _pandas_kwargs(columns: dict[str, str] | None, dialect: dict) -> dict:
+    kwargs = _pandas_dialect(dialect)
+    if columns is None:
+        return kwargs
+    # Kein usecols: damit erkennt der C-Parser zu lange Zeilen nicht mehr.
+    # Numerische dtypes nicht erzwingen: Ausreißer wie "tbd" löst später to_numeric auf
+    kwargs["dtype"] = {c: str for c, t in columns.items() if t == "string"}
+    return kwargs
+
+
+def _pandas_select(df: pd.DataFrame, columns: dict[str, str] | None, where: dict[str, list] | None) -> pd.DataFrame:
+    if where:
+        mask = np.ones(len(df), dtype=bool)
+        for col, allowed in where.items():
+            mask &= df[col].isin(allowed).to_numpy()
+        df = df[mask]
+    return df if columns is None else df[list(columns)]
+
+
+def _report_pandas_warnings(caught, path, on_bad_line: BadLineHandler | None) -> None:
+    """Übersetzt "Skipping line N"-Warnungen des C-Parsers in Datensätze inkl. Rohtext."""
+    records = []
+    for w in caught:
+        for match in _PANDAS_BAD_LINE.finditer(str(w.message)):
+            line, expected, actual = (int(g) for g in match.groups())
+            records.append({"line": line, "expected_columns": expected,
+                            "actual_columns": actual, "text": None})
+    if not records:
+        return
+    wanted = {rec["line"]: rec for rec in records}
+    with _open_text(path) as handle:
+        for number, text in enumerate(handle, start=1):
+            if number in wanted:
+                wanted[number]["text"] = text.rstrip("\r\n")
+            if number >= max(wanted):
+                break
+    if on_bad_line is not None:
+        for rec in records:
+            on_bad_line(rec)
+
+
+def _open_text(path):
+    suffix = Path(path).suffix.lower()
+    if suffix == ".gz":
+        import gzip
+        return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+    if suffix == ".bz2":
+        import bz2
+        return bz2.open(path, "rt", encoding="utf-8", errors="replace")
+    if suffix == ".zst":
+        import zstandard  # optional, wie bei pandas
+        return io.TextIOWrapper(zstandard.open(path, "rb"), encoding="utf-8", errors="replace")
+    return open(path, "r", encoding="utf-8", errors="replace")
+
+
+def _read_pandas(path, columns, dialect, where, on_bad_line: BadLineHandler | None) -> pd.DataFrame:
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", pd.errors.ParserWarning)
+        df = pd.read_csv(path, on_bad_lines="warn", **_pandas_kwargs(columns, dialect))
+    _report_pandas_warnings(caught, path, on_bad_line)
+    return _pandas_select(df, columns, where)
+
+
+def _iter_pandas(path, columns, dialect, where, chunksize: int,
+                 on_bad_line: BadLineHandler | None) -> Iterator[pd.DataFrame]:
+    # Der C-Parser kürzt im Blockmodus zu lange Zeilen stillschweigend; der
+    # Python-Parser meldet sie per Callback (allerdings ohne Zeilennummer)
+    header: list[str] = []
+
+    def _bad(fields: list[str]):
+        if on_bad_line is not None:
+            on_bad_line({"line": None, "expected_columns": len(header),
+                         "actual_columns": len(fields), "text": dialect["delimiter"].join(fields)})
+        return None
+
+    header.extend(read_header(path, dialect))
+    reader = pd.read_csv(path, engine="python", on_bad_lines=_bad, chunksize=chunksize,
+                         **_pandas_kwargs(columns, dialect))
+    for chunk in reader:
+        yield _pandas_select(chunk, columns, where)
+
+
+# ------------------------------------------------------------ #
+# Öffentliche API                                              #
+# ------------------------------------------------------------ #
+def read_csv_source(
+    path: str | Path,
+    schema: dict[str, str] | None = None,
+    on_bad_line: BadLineHandler | None = None,
+    engine: str = "auto",
+    cache: "RawColumnarCache | None" = None,
+    dialect: dict | None = None,
+    where: dict[str, list] | None = None,
+) -> pd.DataFrame:
+    """
+    Liest eine Roh-CSV vollständig.
+
+    Args:
+        path: CSV-Datei (optional .gz/.bz2/.zst).
+        schema: Spalte → dtype ("string", "float64", "float32", "int64",
+                "int32"); None = alle Spalten mit Typinferenz.
+        on_bad_line: Callback je fehlerhafter Zeile (siehe Modul-Docstring).
+        engine: "auto" (pyarrow, falls installiert), "pyarrow" oder "pandas".
+        cache: optionaler Raw-Cache; wirkt nur im pyarrow-Pfad.
+        dialect: Dateiformat (`csv_dialect`); None = CSV wie pandas.read_csv.
+        where: Spalte → erlaubte Werte; nur passende Zeilen werden geliefert
+               (Spalten müssen im Schema stehen).
+    """
+    dialect = dialect or DEFAULT_DIALECT
+    columns = _select_columns(path, schema, dialect)
+    if engine != "pandas" and _arrow_available():
+        try:
+            return _read_arrow(path, columns, dialect, where, on_bad_line, cache)
+        except pa.ArrowInvalid as e:
+            logging.warning(f"CSV-Ingestion: pyarrow konnte {path} nicht lesen ({e}); Fallback auf pandas.")
+    return _read_pandas(path, columns, dialect, where, on_bad_line)
+
+
+def iter_csv_source(
+    path: str | Path,
+    chunksize: int,
+    schema: dict[str, str] | None = None,
+    on_bad_line: BadLineHandler | None = None,
+    engine: str = "auto",
+    cache: "RawColumnarCache | None" = None,
+    dialect: dict | None = None,
+    where: dict[str, list] | None = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Wie `read_csv_source`, aber in Blöcken von `chunksize` Zeilen.
+
+    Der pyarrow-Pfad liest gestreamt. Mit Schema werden die Spalten als Text
+    geparst und je Batch konvertiert; nicht numerische Werte (z. B. "tbd")
+    werden dabei – auch nach dem ersten Block – zu fehlenden Werten. Ohne
+    Schema (Typinferenz) wird auf pandas umgeschaltet, wenn die Konvertierung
+    scheitert, bevor ein Block geliefert wurde. Mit `cache` wird
+    der Eintrag beim ersten vollständigen Durchlauf blockweise geschrieben und
+    danach in Blöcken aus der gemappten Datei geliefert. Mit `where` können
+    Blöcke kleiner als `chunksize` (auch leer) sein.
+    """
+    dialect = dialect or DEFAULT_DIALECT
+    columns = _select_columns(path, schema, dialect)
+    if engine != "pandas" and _arrow_available():
+        chunks = _iter_arrow(path, columns, dialect, where, chunksize, on_bad_line, cache)
+        try:
+            first = next(chunks, None)
+        except pa.ArrowInvalid as e:
+            logging.warning(f"CSV-Ingestion: pyarrow konnte {path} nicht lesen ({e}); Fallback auf pandas.")
+        else:
+            if first is not None:
+                yield first
+                yield from chunks
+            return
+    yield from _iter_pandas(path, columns, dialect, where, chunksize, on_bad_line)
@@ -0,0 +1,101 @@
+"""
+Persistenter Entitätsindex für den inkrementellen Merge (transform/merge.py).
+
+Hält den Stand des letzten Merges, damit ein Lauf nur die Entitäten neu
+aggregiert, die von geänderten Adapterzeilen betroffen sind:
+
+  • members.pkl   – je Long-Zeile: row_key (Inhalts-Hash ohne ID_*-Spalten),
+                    norm_title vor dem Merge, imdb_id, ID-Signatur (sig) und
+                    Signatur-Gruppe (sig_group) sowie die Entität, der die
+                    Zeile zugeordnet wurde (entity_title, entity_cluster)
+  • entities.pkl  – ungefilterte Wide-Zeilen je Entität (norm_title →
+                    year_cluster → entity_id, dazu die ID_*-Spalten je Quelle)
+  • manifest.json – Version, Zeilenzahlen, nächste freie entity_id
+
+Die Version fasst Merge-Code, Normalisierungsregeln und Spaltenschema des
+Long-Frames zusammen; passt sie nicht, liefert `load` None und der Merge baut
+den Index vollständig neu auf. Die Frames werden gepickelt (wie bei den
+Checkpoints), damit kategoriale und nullable dtypes exakt erhalten bleiben.
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+_MANIFEST = "manifest.json"
+_MEMBERS = "members.pkl"
+_ENTITIES = "entities.pkl"
+
+
+class EntityIndex:
+    """Entitätsindex unter ``index_dir`` (siehe Modul-Docstring)."""
+
+    def __init__(self, index_dir: str | Path):
+        self.index_dir = Path(index_dir)
+
+    def _read_manifest(self) -> dict:
+        try:
+            return json.loads((self.index_dir / _MANIFEST).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _write_manifest(self, manifest: dict) -> None:
+        path = self.index_dir / _MANIFEST
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _write_frame(df: pd.DataFrame, path: Path) -> None:
+        tmp_path = path.with_suffix(".tmp")
+        df.to_pickle(tmp_path, protocol=5)
+        os.replace(tmp_path, path)
+
+    # ------------------------------------------------------------ #
+    # Lesen / Schreiben                                            #
+    # ------------------------------------------------------------ #
+    def load(self, version: str) -> dict | None:
+        """
+        Stand des letzten Merges.
+
+        Returns:
+            {"members": DataFrame, "entities": DataFrame, "next_entity_id": int}
+            oder None (kein Index, andere Version oder unlesbar).
+        """
+        manifest = self._read_manifest()
+        if not manifest:
+            return None
+        if manifest.get("version") != version:
+            logging.info("EntityIndex: Version geändert – Index wird neu aufgebaut.")
+            return None
+        try:
+            members = pd.read_pickle(self.index_dir / _MEMBERS)
+            entities = pd.read_pickle(self.index_dir / _ENTITIES)
+        except Exception as e:
+            logging.warning(f"EntityIndex: {self.index_dir} unlesbar, wird neu aufgebaut: {e}")
+            return None
+        return {
+            "members": members,
+            "entities": entities,
+            "next_entity_id": int(manifest.get("next_entity_id", 0)),
+        }
+
+    def save(self, version: str, members: pd.DataFrame, entities: pd.DataFrame, next_entity_id: int) -> None:
+        """Schreibt den neuen Stand; der Index gilt erst mit dem Manifest als gültig."""
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        # Zunächst invalidieren, damit ein Abbruch keinen halben Stand hinterlässt
+        (self.index_dir / _MANIFEST).unlink(missing_ok=True)
+        self._write_frame(members, self.index_dir / _MEMBERS)
+        self._write_frame(entities, self.index_dir / _ENTITIES)
+        self._write_manifest({
+            "version": version,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "members": len(members),
+            "entities": len(entities),
+            "next_entity_id": int(next_entity_id),
+        })
+        logging.info(f"EntityIndex: {len(entities)} Entitäten gespeichert unter {self.index_dir}")
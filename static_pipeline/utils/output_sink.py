@@ -0,0 +1,146 @@
+"""
+Ausgabeziele (Sinks) für Zwischenergebnisse der Transform-Schritte.
+
+Transforms wie `merge_long_frame` schreiben keine Dateien mehr selbst,
+sondern übergeben benannte Frames (z. B. "all_movies_wide_unfiltered") an
+einen Sink:
+
+  • OutputSink      – Basisklasse, verwirft alles (ausgeschaltet)
+  • FileSink        – schreibt ``<base_dir>/<name>.<format>`` als csv
+                      (Genres als Listen, wie bisher), feather (Arrow IPC)
+                      oder parquet; feather/parquet benötigen pyarrow
+                      (ohne pyarrow: Fallback auf csv)
+  • BackgroundSink  – reicht die Frames an einen Hintergrund-Thread weiter,
+                      der sie in den inneren Sink schreibt; `publish` blockiert
+                      nur, wenn `max_pending` Frames noch ausstehen
+
+`make_sink` baut den Sink aus der Konfiguration (`intermediate_outputs` in
+config.yaml). Fehler beim Schreiben werden geloggt und brechen den Lauf
+nicht ab. `close` wartet auf ausstehende Schreibvorgänge.
+"""
+
+import logging
+import os
+import queue
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+from transform.genres import with_genre_lists
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+FORMATS: tuple[str, ...] = ("csv", "feather", "parquet")
+
+
+class OutputSink:
+    """Sink, der nichts schreibt; Basisklasse der übrigen Sinks."""
+
+    def publish(self, name: str, df: pd.DataFrame) -> None:
+        """Übergibt das Frame `df` unter dem Namen `name` (ohne Endung)."""
+
+    def close(self) -> None:
+        """Schließt den Sink (wartet ggf. auf ausstehende Schreibvorgänge)."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class FileSink(OutputSink):
+    """Schreibt jedes Frame synchron nach ``<base_dir>/<name>.<format>``."""
+
+    def __init__(self, base_dir: str | Path, fmt: str = "csv"):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unbekanntes Ausgabeformat '{fmt}' (erlaubt: {', '.join(FORMATS)})")
+        if fmt != "csv" and pyarrow is None:
+            logging.warning(f"FileSink: pyarrow fehlt – schreibe csv statt {fmt}.")
+            fmt = "csv"
+        self.base_dir = Path(base_dir)
+        self.fmt = fmt
+
+    def path_for(self, name: str) -> Path:
+        return self.base_dir / f"{name}.{self.fmt}"
+
+    def publish(self, name: str, df: pd.DataFrame) -> None:
+        path = self.path_for(name)
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if self.fmt == "csv":
+                with_genre_lists(df).to_csv(tmp_path, index=False)
+            elif self.fmt == "feather":
+                df.reset_index(drop=True).to_feather(tmp_path)
+            else:
+                df.to_parquet(tmp_path, index=False)
+            # Erst vollständig geschriebene Dateien ersetzen den alten Stand
+            os.replace(tmp_path, path)
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            logging.error(f"FileSink: '{name}' konnte nicht nach {path} geschrieben werden: {e}")
+            return
+        logging.info(f"FileSink: '{name}' gespeichert: {path} (Zeilen: {len(df)})")
+
+
+class BackgroundSink(OutputSink):
+    """
+    Schreibt über `inner` in einem Hintergrund-Thread.
+
+    Die Frames werden nicht kopiert – Aufrufer dürfen ein übergebenes Frame
+    danach nicht mehr verändern.
+    """
+
+    _STOP = object()
+
+    def __init__(self, inner: OutputSink, max_pending: int = 4):
+        self.inner = inner
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, max_pending))
+        self._thread = threading.Thread(target=self._run, name="output-sink", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            name, df = item
+            try:
+                self.inner.publish(name, df)
+            except Exception as e:
+                logging.error(f"BackgroundSink: '{name}' fehlgeschlagen: {e}")
+
+    def publish(self, name: str, df: pd.DataFrame) -> None:
+        if not self._thread.is_alive():
+            raise RuntimeError("BackgroundSink ist bereits geschlossen.")
+        self._queue.put((name, df))
+
+    def close(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+        self.inner.close()
+
+
+def make_sink(cfg: dict | None, base_dir: str | Path) -> OutputSink:
+    """
+    Sink aus der Konfiguration.
+
+    Args:
+        cfg: {"enabled": bool, "format": "csv"|"feather"|"parquet",
+              "background": bool, "max_pending": int}; None/leer → Defaults
+              (eingeschaltet, csv, synchron).
+        base_dir: Zielverzeichnis (bereits aufgelöst).
+    """
+    cfg = cfg or {}
+    if not cfg.get("enabled", True):
+        return OutputSink()
+    sink: OutputSink = FileSink(base_dir, cfg.get("format", "csv"))
+    if cfg.get("background", False):
+        sink = BackgroundSink(sink, cfg.get("max_pending", 4))
+    return sink
@@ -0,0 +1,222 @@
+"""
+Spaltenorientierter Cache für Roh-CSVs (Arrow IPC, memory-mapped).
+
+Jede Roh-CSV wird einmal geparst und als unkomprimierte Arrow-IPC-Datei
+(Feather v2) abgelegt; spätere Läufe öffnen sie per `pa.memory_map`, ohne
+den CSV-Text erneut zu parsen. Genutzt von der CSV-Ingestion der Adapter
+(utils/csv_ingest.py), von `run_comprehensive_analysis.py` und von
+`load_df()` im adaptiven Notebook.
+
+Schlüssel = SHA-256 über
+  • Größe, mtime und Inhalts-Hash der CSV (Fingerprint wie im AdapterCache)
+  • die Lesevariante (Spaltenauswahl + dtypes bzw. "*" für Typinferenz)
+
+Je Eintrag liegen unter ``<cache_dir>/`` zwei Dateien:
+``<csv-name>_<key>.arrow`` (Daten) und ``<csv-name>_<key>.json``
+(Quelle, Zeilenzahl, fehlerhafte Zeilen für die Quarantäne). Die .arrow-Datei
+wird zuletzt per rename angelegt und markiert einen vollständigen Eintrag.
+
+Eviction (`evict`): Einträge, die länger als ``max_age_days`` nicht genutzt
+wurden, werden entfernt; danach die am längsten nicht genutzten, bis die
+Gesamtgröße ``max_size_mb`` einhält. Beide Grenzen sind optional.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+from utils.adapter_cache import file_fingerprint
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+except ImportError:  # pragma: no cover
+    pa = None
+    pa_ipc = None
+
+# Bei Änderungen am Ablageformat erhöhen (alte Einträge werden dann nicht mehr getroffen)
+_FORMAT_VERSION = 1
+_FINGERPRINT_DIR = "fingerprints"
+
+
+class RawColumnarCache:
+    """Arrow-IPC-Cache für geparste Roh-CSVs (siehe Modul-Docstring)."""
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        max_size_mb: float | None = None,
+        max_age_days: float | None = None,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_size_mb = max_size_mb
+        self.max_age_days = max_age_days
+
+    @staticmethod
+    def available() -> bool:
+        """True, wenn pyarrow installiert ist (sonst bleibt der Cache wirkungslos)."""
+        return pa_ipc is not None
+
+    # ------------------------------------------------------------ #
+    # Schlüsselbildung                                             #
+    # ------------------------------------------------------------ #
+    def key_for(self, path: str | Path, variant: str) -> str:
+        """Schlüssel aus Inhalts-Fingerprint der CSV und Lesevariante."""
+        path = Path(path)
+        digest = hashlib.sha256()
+        digest.update(str(_FORMAT_VERSION).encode("utf-8"))
+        digest.update(file_fingerprint(path, self.cache_dir / _FINGERPRINT_DIR).encode("utf-8"))
+        digest.update(variant.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _entry_paths(self, path: str | Path, key: str) -> tuple[Path, Path]:
+        stem = f"{Path(path).name}_{key[:32]}"
+        return self.cache_dir / f"{stem}.arrow", self.cache_dir / f"{stem}.json"
+
+    # ------------------------------------------------------------ #
+    # Lesen / Schreiben                                            #
+    # ------------------------------------------------------------ #
+    def load(self, path: str | Path, variant: str):
+        """
+        Öffnet den Eintrag zu (CSV, Variante) memory-mapped.
+
+        Returns:
+            (pa.Table, fehlerhafte Zeilen als Liste von Dicts) oder None (Miss).
+            Die Spaltenpuffer der Tabelle verweisen direkt auf die gemappte
+            Datei (keine Kopie, kein Parsen).
+        """
+        if not self.available():
+            return None
+        try:
+            key = self.key_for(path, variant)
+        except OSError as e:
+            logging.debug(f"RawColumnarCache: Schlüssel für {path} nicht berechenbar: {e}")
+            return None
+        data_path, meta_path = self._entry_paths(path, key)
+        if not data_path.exists():
+            return None
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            table = pa_ipc.open_file(pa.memory_map(str(data_path), "r")).read_all()
+        except Exception as e:
+            logging.warning(f"RawColumnarCache: Eintrag {data_path} unlesbar, wird ignoriert: {e}")
+            return None
+        # Zugriffszeit für LRU-/Alters-Eviction aktualisieren
+        for entry in (data_path, meta_path):
+            try:
+                os.utime(entry)
+            except OSError:
+                pass
+        logging.info(f"RawColumnarCache: {Path(path).name} aus {data_path.name} geladen ({table.num_rows} Zeilen).")
+        return table, meta.get("bad_lines", [])
+
+    def store(self, path: str | Path, variant: str, table, bad_lines: list[dict]) -> None:
+        """Legt eine vollständig gelesene Tabelle ab (atomar per tmp-Datei + rename)."""
+        writer = self.writer(path, variant, table.schema)
+        if writer is None:
+            return
+        try:
+            writer.write(table)
+        except Exception as e:
+            writer.abort()
+            logging.warning(f"RawColumnarCache: Schreiben für {path} fehlgeschlagen: {e}")
+            return
+        writer.commit(bad_lines)
+
+    def writer(self, path: str | Path, variant: str, schema) -> "RawCacheWriter | None":
+        """Inkrementeller Schreiber für den Blockmodus (None, falls nicht möglich)."""
+        if not self.available():
+            return None
+        try:
+            key = self.key_for(path, variant)
+            data_path, meta_path = self._entry_paths(path, key)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            return RawCacheWriter(path, data_path, meta_path, schema)
+        except Exception as e:
+            logging.warning(f"RawColumnarCache: Eintrag für {path} nicht anlegbar: {e}")
+            return None
+
+    # ------------------------------------------------------------ #
+    # Eviction                                                     #
+    # ------------------------------------------------------------ #
+    def evict(self) -> None:
+        """Entfernt zu alte Einträge und danach die ältesten bis max_size_mb."""
+        if not self.cache_dir.exists() or not (self.max_size_mb or self.max_age_days):
+            return
+        entries = []
+        for data_path in self.cache_dir.glob("*.arrow"):
+            meta_path = data_path.with_suffix(".json")
+            try:
+                stat = data_path.stat()
+            except FileNotFoundError:
+                continue
+            size = stat.st_size + (meta_path.stat().st_size if meta_path.exists() else 0)
+            entries.append((stat.st_mtime, size, data_path, meta_path))
+        entries.sort(key=lambda e: e[0])
+
+        total = sum(size for _, size, _, _ in entries)
+        limit = int(self.max_size_mb * 1024 * 1024) if self.max_size_mb else None
+        cutoff = time.time() - self.max_age_days * 86400 if self.max_age_days else None
+        for mtime, size, data_path, meta_path in entries:
+            too_old = cutoff is not None and mtime < cutoff
+            too_big = limit is not None and total > limit
+            if not (too_old or too_big):
+                continue
+            try:
+                data_path.unlink()
+                meta_path.unlink(missing_ok=True)
+                total -= size
+                reason = "Alterslimit" if too_old else "Größenlimit"
+                logging.info(f"RawColumnarCache: Eintrag entfernt ({reason}): {data_path.name}")
+            except OSError:
+                continue
+
+
+class RawCacheWriter:
+    """Schreibt Arrow-Blöcke in eine tmp-Datei; `commit` macht den Eintrag sichtbar."""
+
+    def __init__(self, source_path: str | Path, data_path: Path, meta_path: Path, schema):
+        self.source_path = Path(source_path)
+        self.data_path = data_path
+        self.meta_path = meta_path
+        self.tmp_path = data_path.with_suffix(f".{os.getpid()}.tmp")
+        self.rows = 0
+        self._sink = pa.OSFile(str(self.tmp_path), "wb")
+        self._writer = pa_ipc.new_file(self._sink, schema)
+
+    def write(self, data) -> None:
+        """Hängt eine pa.Table oder pa.RecordBatch an."""
+        if isinstance(data, pa.RecordBatch):
+            self._writer.write_batch(data)
+        else:
+            self._writer.write_table(data)
+        self.rows += data.num_rows
+
+    def commit(self, bad_lines: list[dict]) -> None:
+        try:
+            self._writer.close()
+            self._sink.close()
+            meta = {
+                "source": str(self.source_path),
+                "rows": self.rows,
+                "bad_lines": bad_lines,
+            }
+            meta_tmp = self.meta_path.with_suffix(f".{os.getpid()}.tmp.json")
+            meta_tmp.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+            os.replace(meta_tmp, self.meta_path)
+            os.replace(self.tmp_path, self.data_path)
+        except Exception as e:
+            logging.warning(f"RawColumnarCache: Schreiben von {self.data_path} fehlgeschlagen: {e}")
+            self.tmp_path.unlink(missing_ok=True)
+
+    def abort(self) -> None:
+        """Verwirft den unvollständigen Eintrag (z. B. abgebrochener Blockmodus)."""
+        try:
+            self._writer.close()
+        except Exception:
+            pass
+        self._sink.close()
+        self.tmp_path.unlink(missing_ok=True)
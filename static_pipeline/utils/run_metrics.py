@@ -0,0 +1,137 @@
+import json
+import logging
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+import pandas as pd
+
+# resource gibt es nur auf POSIX-Systemen
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore
+
+_PROC_STATUS = Path("/proc/self/status")
+_PROC_CLEAR_REFS = Path("/proc/self/clear_refs")
+
+
+def _reset_peak_rss() -> bool:
+    """Setzt den Peak-RSS-Zähler (Linux: VmHWM) zurück; False, wenn nicht möglich."""
+    try:
+        _PROC_CLEAR_REFS.write_text("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb() -> float | None:
+    """Peak Resident Set Size des aktuellen Prozesses in MB."""
+    try:
+        for line in _PROC_STATUS.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return round(int(line.split()[1]) / 1024, 2)
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    # ru_maxrss: Linux in KB, macOS in Bytes
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(max_rss / divisor, 2)
+
+
+def _children_cpu_seconds() -> float:
+    """CPU-Zeit beendeter Kindprozesse (z. B. Adapter-Worker)."""
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def frame_stats(df: pd.DataFrame | None) -> dict:
+    """Zeilenzahl und tiefe Speichergröße (MB) eines DataFrames."""
+    if df is None:
+        return {"rows": 0, "memory_deep_mb": 0.0}
+    return {
+        "rows": int(len(df)),
+        "memory_deep_mb": round(df.memory_usage(deep=True).sum() / (1024 * 1024), 3),
+    }
+
+
+@contextmanager
+def measure() -> Iterator[dict]:
+    """
+    Misst Wall-Zeit, CPU-Zeit (inkl. beendeter Kindprozesse) und Peak-RSS des
+    umschlossenen Blocks. Das gelieferte Dict kann im Block um Zählwerte
+    ergänzt werden und enthält nach dem Block die Messwerte.
+    """
+    record: dict = {}
+    peak_reset = _reset_peak_rss()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time() + _children_cpu_seconds()
+    try:
+        yield record
+    finally:
+        record["wall_s"] = round(time.perf_counter() - wall_start, 4)
+        record["cpu_s"] = round(time.process_time() + _children_cpu_seconds() - cpu_start, 4)
+        record["peak_rss_mb"] = peak_rss_mb()
+        # Ohne Reset ist der Peak-Wert prozessweit (nicht stufenbezogen)
+        record["peak_rss_scope"] = "stage" if peak_reset else "process"
+
+
+class RunMetrics:
+    """
+    Sammelt Kennzahlen eines Pipeline-Laufs und schreibt sie als JSON.
+
+    Struktur:
+      • stages:   je Stufe wall_s, cpu_s, peak_rss_mb, Ein-/Ausgabezeilen,
+                  memory_deep_mb des Ergebnis-DataFrames
+      • adapters: je Adapter dieselben Messwerte plus input/output/rejected/
+                  duplicate/quarantined_rows, cache_hit und ggf. rating_sources
+                  (Zeilen je gewinnender Rating-Kandidatenspalte)
+
+    `write()` legt ``run_<zeitstempel>.json`` an und hängt denselben Datensatz
+    als eine Zeile an die History-Datei (JSON Lines) an.
+    """
+
+    def __init__(self) -> None:
+        self.started = datetime.now()
+        self.run_id = self.started.strftime("%Y%m%d_%H%M%S")
+        self.stages: dict[str, dict] = {}
+        self.adapters: dict[str, dict] = {}
+        self.status = "running"
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[dict]:
+        """Misst eine Pipeline-Stufe; Zusatzwerte können ins Dict geschrieben werden."""
+        with measure() as record:
+            self.stages[name] = record
+            yield record
+
+    def to_dict(self) -> dict:
+        return {
+            "run_id": self.run_id,
+            "started": self.started.isoformat(timespec="seconds"),
+            "finished": datetime.now().isoformat(timespec="seconds"),
+            "status": self.status,
+            "total_wall_s": round(sum(s.get("wall_s", 0.0) for s in self.stages.values()), 4),
+            "stages": self.stages,
+            "adapters": self.adapters,
+        }
+
+    def write(self, output_dir: Path, history_file: Path | None = None) -> Path:
+        """Schreibt den Metrik-Report und ergänzt optional die History-Datei."""
+        payload = self.to_dict()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        report_path = output_dir / f"run_{self.run_id}.json"
+        report_path.write_text(json.dumps(payload, indent=2, default=str), encoding="utf-8")
+        if history_file is not None:
+            history_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(history_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(payload, default=str) + "\n")
+        logging.info(f"Run-Metriken gespeichert unter {report_path}")
+        return report_path
@@ -1,6 +1,7 @@
 from pathlib import Path
 import pandas as pd
 import yaml
+from transform.genres import with_genre_lists
 
 # Pfad zur zentralen Pipeline-Config ermitteln (eine Ebene über utils)
 CONFIG_PATH = Path(__file__).resolve().parent.parent / "config.yaml"
@@ -14,17 +15,26 @@ except FileNotFoundError:
 _AUX_DIRS = _cfg.get("aux_output_dirs", {
     "invalid": "static_pipeline/data/intermediate_adapter_outputs/invalid",
     "duplicates": "static_pipeline/data/intermediate_adapter_outputs/duplicates",
+    "quarantine": "static_pipeline/data/intermediate_adapter_outputs/quarantine",
 })
 
 
 def _get_target_dir(kind: str) -> Path:
-    """Liefert das Zielverzeichnis für eine CSV-Art (invalid/duplicates)."""
+    """Liefert das Zielverzeichnis für eine CSV-Art (invalid/duplicates/quarantine)."""
     return Path(_AUX_DIRS.get(kind, f"static_pipeline/data/intermediate_adapter_outputs/{kind}"))
 
 
-def save_aux_csv(kind: str, adapter_name: str, df: pd.DataFrame) -> None:
-    """Speichert DataFrame unter <dir>/<adapter_name>_<kind>.csv."""
+def save_aux_csv(kind: str, adapter_name: str, df: pd.DataFrame, append: bool = False) -> None:
+    """Speichert DataFrame unter <dir>/<adapter_name>_<kind>.csv.
+
+    Mit append=True werden die Zeilen ohne Header an eine bestehende Datei
+    angehängt (Chunk-Modus der Adapter).
+    """
     target_dir = _get_target_dir(kind)
     target_dir.mkdir(parents=True, exist_ok=True)
     out_path = target_dir / f"{adapter_name}_{kind}.csv"
-    df.to_csv(out_path, index=False) 
\ No newline at end of file
+    df = with_genre_lists(df)
+    if append and out_path.exists():
+        df.to_csv(out_path, mode="a", header=False, index=False)
+    else:
+        df.to_csv(out_path, index=False) 
\ No newline at end of file
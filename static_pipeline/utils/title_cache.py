@@ -0,0 +1,271 @@
+"""
+Persistenter Cache für normalisierte Filmtitel (Arrow IPC, memory-mapped).
+
+Bildet Rohtitel → normalisierten Titel ab, damit wiederholte Läufe (statische
+Pipeline, Notebooks) nur noch Titel normalisieren, die sie noch nie gesehen
+haben. Genutzt von `transform.normalize.normalize_titles` (Parameter `cache`)
+und von `normalize_cached` für eigene Normalisierungsfunktionen.
+
+Je Regelversion (`rules`, Hash der Normalisierungsregeln, z. B.
+`transform.normalize.RULES_VERSION`) liegt unter ``<cache_dir>/`` eine Datei
+``titles_<rules>.arrow`` mit den Spalten raw, norm und used (letzte Nutzung,
+Unix-Zeit). Ändern sich die Regeln, entsteht eine neue Datei; mehrere
+Normalisierer können sich ein Verzeichnis teilen.
+
+Nachschlagen: die Datei wird einmal je Instanz per `pa.memory_map` geöffnet
+und als Hash-Index (pd.Index) gehalten; ein Batch wird mit einem einzigen
+`get_indexer` aufgelöst. Neue Einträge und Zugriffszeiten sammeln sich im
+Speicher und werden per `flush` geschrieben (tmp-Datei + rename; Einträge,
+die ein anderer Prozess inzwischen geschrieben hat, bleiben erhalten).
+
+Grenzen (optional): ``max_entries`` je Datei (die am längsten nicht genutzten
+Einträge fallen beim `flush` heraus), ``max_age_days`` für ganze Dateien
+(`evict`, z. B. Stände alter Regelversionen).
+"""
+
+import hashlib
+import inspect
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Callable, Iterable
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+except ImportError:  # pragma: no cover
+    pa = None
+    pa_ipc = None
+
+# Zugriffszeiten nur auffrischen, wenn sie älter sind (spart Schreibvorgänge)
+_TOUCH_INTERVAL = 86400
+
+
+class TitleCache:
+    """Arrow-IPC-Cache Rohtitel → normalisierter Titel (siehe Modul-Docstring)."""
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        max_entries: int | None = None,
+        max_age_days: float | None = None,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        # rules → {"index": pd.Index, "norm": ndarray, "used": ndarray,
+        #          "new": dict[str, str], "touched": bool}
+        self._state: dict[str, dict] = {}
+
+    def __getstate__(self) -> dict:
+        # Geladene Stände nicht an Worker-Prozesse weiterreichen
+        state = self.__dict__.copy()
+        state["_state"] = {}
+        return state
+
+    @staticmethod
+    def available() -> bool:
+        """True, wenn pyarrow installiert ist (sonst bleibt der Cache wirkungslos)."""
+        return pa_ipc is not None
+
+    def _path(self, rules: str) -> Path:
+        return self.cache_dir / f"titles_{rules}.arrow"
+
+    def _read(self, rules: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(raw, norm, used) der Datei zu `rules`; leer, wenn es sie (noch) nicht gibt."""
+        path = self._path(rules)
+        if path.exists():
+            try:
+                table = pa_ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+                return (
+                    table.column("raw").to_numpy(zero_copy_only=False),
+                    table.column("norm").to_numpy(zero_copy_only=False),
+                    table.column("used").to_numpy(),
+                )
+            except Exception as e:
+                logging.warning(f"TitleCache: {path} unlesbar, wird ignoriert: {e}")
+        empty = np.empty(0, dtype=object)
+        return empty, empty, np.empty(0, dtype=np.float64)
+
+    def _load(self, rules: str) -> dict:
+        if rules not in self._state:
+            raw, norm, used = self._read(rules)
+            self._state[rules] = {
+                "index": pd.Index(raw, dtype=object), "norm": norm, "used": used.copy(),
+                "new": {}, "touched": False,
+            }
+        return self._state[rules]
+
+    @staticmethod
+    def _empty_state() -> dict:
+        return {
+            "index": pd.Index([], dtype=object), "norm": np.empty(0, dtype=object),
+            "used": np.empty(0, dtype=np.float64), "new": {}, "touched": False,
+        }
+
+    # ------------------------------------------------------------ #
+    # Batch-Zugriff                                                #
+    # ------------------------------------------------------------ #
+    def lookup(self, rules: str, titles: Iterable[str]) -> np.ndarray:
+        """
+        Normalisierte Titel zu `titles` (ein Hash-Lookup je Batch).
+
+        Returns:
+            object-Array in der Reihenfolge von `titles`; None = nicht im Cache.
+        """
+        titles = np.asarray(titles if isinstance(titles, np.ndarray) else list(titles), dtype=object)
+        found = np.full(titles.size, None, dtype=object)
+        if not self.available() or titles.size == 0:
+            return found
+        state = self._load(rules)
+        positions = state["index"].get_indexer(titles)
+        hit = positions >= 0
+        found[hit] = state["norm"][positions[hit]]
+        if state["new"]:
+            pending = state["new"]
+            found[~hit] = [pending.get(t) for t in titles[~hit]]
+
+        # Zugriffszeiten (LRU) im Speicher auffrischen; geschrieben wird per flush()
+        now = time.time()
+        used = state["used"]
+        stale = positions[hit][used[positions[hit]] < now - _TOUCH_INTERVAL]
+        if stale.size:
+            used[stale] = now
+            state["touched"] = True
+        logging.debug(f"TitleCache: {int(hit.sum())}/{titles.size} Titel aus dem Cache.")
+        return found
+
+    def store(self, rules: str, raw: Iterable[str], norm: Iterable[str]) -> None:
+        """Merkt neue Einträge Rohtitel → normalisierter Titel vor (persistiert per `flush`)."""
+        if self.available():
+            self._load(rules)["new"].update(zip(raw, norm))
+
+    def flush(self) -> None:
+        """Schreibt neue Einträge/Zugriffszeiten aller Regelversionen auf die Platte."""
+        for rules, state in self._state.items():
+            if not state["new"] and not state["touched"]:
+                continue
+            try:
+                self._write(rules, state)
+            except Exception as e:
+                logging.warning(f"TitleCache: Schreiben für Regelversion {rules} fehlgeschlagen: {e}")
+            # Neu laden beim nächsten Zugriff (enthält dann auch Einträge anderer Prozesse)
+        self._state.clear()
+
+    def _write(self, rules: str, state: dict) -> None:
+        now = time.time()
+        # Aktuellen Stand der Datei als Basis (ein anderer Prozess kann geschrieben haben)
+        disk_raw, disk_norm, disk_used = self._read(rules)
+        mine = pd.DataFrame({"raw": state["index"].to_numpy(), "norm": state["norm"], "used": state["used"]})
+        new = pd.DataFrame({"raw": list(state["new"]), "norm": list(state["new"].values()), "used": now})
+        disk = pd.DataFrame({"raw": disk_raw, "norm": disk_norm, "used": disk_used})
+        merged = (
+            pd.concat([new, mine, disk], ignore_index=True)
+              .sort_values("used", ascending=False, kind="stable")
+              .drop_duplicates("raw")
+        )
+        if self.max_entries and len(merged) > self.max_entries:
+            logging.info(
+                f"TitleCache: {len(merged) - int(self.max_entries)} Einträge entfernt "
+                f"(Größenlimit {self.max_entries}).")
+            merged = merged.iloc[:int(self.max_entries)]
+
+        table = pa.table({
+            "raw": pa.array(merged["raw"].to_numpy(), type=pa.string()),
+            "norm": pa.array(merged["norm"].to_numpy(), type=pa.string()),
+            "used": pa.array(merged["used"].to_numpy(dtype=np.float64), type=pa.float64()),
+        })
+        path = self._path(rules)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with pa.OSFile(str(tmp_path), "wb") as sink, pa_ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        logging.info(f"TitleCache: {path.name} geschrieben ({table.num_rows} Einträge).")
+
+    # ------------------------------------------------------------ #
+    # Eviction                                                     #
+    # ------------------------------------------------------------ #
+    def evict(self) -> None:
+        """
+        Entfernt Dateien, die länger als max_age_days nicht geschrieben wurden,
+        und kürzt die übrigen auf max_entries (am längsten nicht genutzte zuerst).
+        """
+        if not self.available() or not self.cache_dir.exists():
+            return
+        cutoff = time.time() - self.max_age_days * 86400 if self.max_age_days else None
+        for path in self.cache_dir.glob("titles_*.arrow"):
+            try:
+                if cutoff is not None and path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    logging.info(f"TitleCache: {path.name} entfernt (Alterslimit).")
+                    continue
+                if self.max_entries:
+                    rows = pa_ipc.open_file(pa.memory_map(str(path), "r")).read_all().num_rows
+                    if rows > self.max_entries:
+                        rules = path.stem[len("titles_"):]
+                        self._write(rules, self._empty_state())
+            except Exception as e:
+                logging.warning(f"TitleCache: Eviction für {path.name} fehlgeschlagen: {e}")
+
+
+def rules_version(normalizer: Callable[[str], str]) -> str:
+    """Regelversion einer Normalisierungsfunktion: Hash über ihren Quelltext."""
+    try:
+        source = inspect.getsource(normalizer)
+    except (OSError, TypeError):
+        source = normalizer.__code__.co_code.hex()
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()[:16]
+
+
+def normalize_cached(
+    values: pd.Series,
+    normalizer: Callable[[str], str],
+    cache: TitleCache | None,
+    rules: str | None = None,
+) -> pd.Series:
+    """
+    `values.map(normalizer)` mit persistentem Cache für beliebige Normalisierer.
+
+    Jeder verschiedene Titel wird höchstens einmal normalisiert; nur Titel, die
+    nicht im Cache liegen, laufen durch `normalizer`. Nicht-Strings (NA)
+    werden ohne Cache normalisiert. Der Cache wird am Ende geschrieben.
+
+    Args:
+        rules: Regelversion; Default `rules_version(normalizer)`.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    uniques = np.asarray(uniques, dtype=object)
+    if cache is None:
+        normalized = np.array([normalizer(t) for t in uniques] + [None], dtype=object)
+    else:
+        rules = rules or rules_version(normalizer)
+        normalized = np.append(cached_normalize(uniques, normalizer, cache, rules), None)
+        cache.flush()
+    # Code -1 (NA) → normalizer(NA)
+    if (codes == -1).any():
+        normalized[-1] = normalizer(np.nan)
+    return pd.Series(normalized[codes], index=values.index, dtype=object)
+
+
+def cached_normalize(titles: np.ndarray, normalizer: Callable[[str], str], cache: TitleCache, rules: str) -> np.ndarray:
+    """
+    Normalisiert verschiedene Titel über den Cache: Treffer werden übernommen,
+    nur Fehlende laufen durch `normalizer` und werden im Cache vorgemerkt.
+
+    Returns:
+        object-Array der normalisierten Titel (Reihenfolge wie `titles`).
+    """
+    result = cache.lookup(rules, titles)
+    missing = pd.isna(result)
+    result[missing] = [normalizer(t) for t in titles[missing]]
+    storable = missing & np.fromiter((isinstance(t, str) for t in titles), dtype=bool, count=len(titles))
+    cache.store(rules, titles[storable], result[storable])
+    return result